@@ -0,0 +1,84 @@
+"""
+Compare the PDF text extraction engines on throughput and peak memory.
+
+Each engine extracts every page of the PDFs in a fresh process, so its peak
+resident set size is measured in isolation. Engines whose library is not
+installed are skipped.
+
+Usage:
+    python -m benchmarks.pdf_extraction [data/raw/] [--engines pypdf pypdfium2]
+"""
+
+import argparse
+import glob
+import os
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple
+
+from rich import print
+
+from mental_health_ai.processing_raw_data.extractors import (
+    EXTRACTORS,
+    available_extractors,
+    get_extractor,
+)
+
+
+def extract_all(
+    engine: str, pdf_paths: List[str]
+) -> Tuple[int, int, float, float]:
+    """
+    Stream the text of every page of the PDFs, in a worker process.
+
+    Returns:
+        Tuple[int, int, float, float]: Pages, characters, seconds spent and peak RSS in MiB.
+    """  # noqa: E501
+    extractor = get_extractor(engine)
+    pages, characters = 0, 0
+    start_time = time.perf_counter()
+    for pdf_path in pdf_paths:
+        for text in extractor.iter_pages(pdf_path):
+            pages += 1
+            characters += len(text)
+    elapsed = time.perf_counter() - start_time
+    # ru_maxrss is in KiB on Linux.
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return pages, characters, elapsed, peak_rss
+
+
+def main(root_path: str, engines: List[str]) -> None:
+    pdf_paths = sorted(
+        glob.glob(os.path.join(root_path, '**', '*.pdf'), recursive=True)
+    )
+    size = sum(os.path.getsize(path) for path in pdf_paths) / 2**20
+    print(f'{len(pdf_paths)} PDFs, {size:.1f} MiB.')
+
+    for engine in engines:
+        if engine not in available_extractors():
+            print(f'[yellow]{engine}: not installed, skipped.[/yellow]')
+            continue
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            pages, characters, elapsed, peak_rss = executor.submit(
+                extract_all, engine, pdf_paths
+            ).result()
+        print(
+            f'{engine:>10}: {pages} pages in {elapsed:.1f}s '
+            f'({pages / elapsed:.1f} pages/s), {characters} characters, '
+            f'peak RSS {peak_rss:.0f} MiB'
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('root_path', nargs='?', default='data/raw/')
+    parser.add_argument(
+        '--engines',
+        nargs='+',
+        choices=list(EXTRACTORS),
+        default=list(EXTRACTORS),
+    )
+    args = parser.parse_args()
+
+    main(args.root_path, args.engines)
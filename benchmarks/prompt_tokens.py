@@ -0,0 +1,142 @@
+"""
+Compare the tokens of the context in the legacy and compact prompt formats.
+
+The benchmark loads the processed corpus into a `PageIndex`, retrieves the
+pages of a fixed set of queries with a lexical score (so it runs without
+Weaviate or an embedding model) and renders the same pages with the legacy
+per-chunk metadata dump and with `render_context`.
+
+Usage:
+    python -m benchmarks.prompt_tokens [data/processed/] [--top-k 5]
+"""
+
+import argparse
+import math
+import re
+from collections import Counter
+from typing import Callable, Dict, List
+
+from rich import print
+
+from mental_health_ai.rag.context import ContextBlock, render_context
+from mental_health_ai.rag.database.db_interface import PageKey
+from mental_health_ai.rag.database.page_index import PageIndex
+from mental_health_ai.rag.database.utils import (
+    iter_documents_in_file,
+    iter_json_files,
+)
+
+QUERIES = (
+    'Quais são os sintomas do TDAH em crianças?',
+    'Como o uso de telas afeta a atenção de adolescentes?',
+    'Quais fatores aumentam o risco de depressão?',
+    'Ansiedade e depressão em trabalhadores da saúde durante a COVID-19',
+    'Como funciona a política de saúde mental para crianças?',
+    'Quais são os tratamentos para o transtorno de ansiedade?',
+    'Saúde mental de mulheres privadas de liberdade',
+    'Relação entre racismo e sofrimento psíquico',
+    'Como avaliar o desempenho e o estresse no trabalho?',
+    'Qual o papel da família no cuidado em saúde mental?',
+)
+
+WORD_PATTERN = re.compile(r'\w{4,}')
+
+
+def legacy_format(block: ContextBlock) -> str:
+    """Format a page like the prompt did before sources were deduplicated."""
+    properties = block.document.properties
+    metadata = properties.get('metadata', {})
+    return (
+        f'Título: {properties.get("title", "No Title")}\n'
+        f'Número da página: {metadata.get("page_number", "N/A")}\n'
+        f'Fonte: {metadata.get("source", "N/A")}\n'
+        f'Descrição da fonte: {metadata.get("source_description", "N/A")}\n'
+        f'Metadados: {metadata}\n'
+        f'Content:\n{chr(10).join(block.chunks)}\n'
+        '---------------------\n'
+    )
+
+
+def token_counter() -> Callable[[str], int]:
+    """Count tokens with tiktoken, or estimate 4 characters per token."""
+    try:
+        import tiktoken  # noqa: PLC0415
+
+        encoding = tiktoken.get_encoding('o200k_base')
+    except (ImportError, OSError):
+        print('[yellow]No tiktoken encoding, estimating tokens.[/yellow]')
+        return lambda text: math.ceil(len(text) / 4)
+
+    return lambda text: len(encoding.encode(text))
+
+
+def load_pages(root_path: str) -> Dict[PageKey, list]:
+    """Load the chunks of the processed corpus, grouped by page."""
+    index = PageIndex()
+    keys = {}
+    for file_path in iter_json_files(root_path):
+        for position, document in enumerate(iter_documents_in_file(file_path)):
+            if index.add(f'{file_path}:{position}', document):
+                keys[PageIndex.page_key(document['metadata'])] = None
+    return index.get_many(keys)
+
+
+def retrieve(
+    query: str, pages: Dict[PageKey, str], top_k: int
+) -> List[PageKey]:
+    """Rank the pages by how often they mention the words of the query."""
+    words = set(WORD_PATTERN.findall(query.lower()))
+    scores = Counter({
+        key: sum(text.count(word) for word in words)
+        for key, text in pages.items()
+    })
+    return [key for key, score in scores.most_common(top_k) if score]
+
+
+def main(root_path: str, top_k: int) -> None:
+    grouped = load_pages(root_path)
+    pages = {
+        key: '\n'.join(
+            chunk.properties['page_content'] for chunk in chunks
+        ).lower()
+        for key, chunks in grouped.items()
+    }
+    count_tokens = token_counter()
+    print(f'{len(pages)} pages, top_k={top_k}.')
+
+    total_legacy, total_compact = 0, 0
+    for query in QUERIES:
+        blocks = [
+            ContextBlock(
+                key=key,
+                document=grouped[key][0],
+                chunks=[
+                    chunk.properties['page_content'] for chunk in grouped[key]
+                ],
+            )
+            for key in retrieve(query, pages, top_k)
+        ]
+        if not blocks:
+            continue
+        legacy = count_tokens('\n'.join(map(legacy_format, blocks)))
+        compact = count_tokens(render_context(blocks))
+        total_legacy += legacy
+        total_compact += compact
+        print(
+            f'{legacy:>6} -> {compact:>6} tokens '
+            f'({1 - compact / legacy:.1%} less): {query}'
+        )
+
+    if total_legacy:
+        print(
+            f'[green]Total: {total_legacy} -> {total_compact} tokens, {1 - total_compact / total_legacy:.1%} less.[/green]'  # noqa: E501
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('root_path', nargs='?', default='data/processed/')
+    parser.add_argument('--top-k', type=int, default=5)
+    args = parser.parse_args()
+
+    main(args.root_path, args.top_k)
@@ -0,0 +1,97 @@
+"""
+Compare the regex sentence splitter with NLTK's Punkt on the corpus.
+
+The chunks of the processed corpus are joined back into pages, each page is
+split by both splitters and the benchmark reports their throughput and how
+many sentence boundaries they agree on (precision and recall of the regex
+boundaries against Punkt's).
+
+Usage:
+    python -m benchmarks.sentence_splitting [data/processed/]
+"""
+
+import argparse
+import time
+from collections import defaultdict
+from typing import List, Optional, Set, Tuple
+
+from rich import print
+
+from mental_health_ai.processing_raw_data.utils import split_into_sentences
+from mental_health_ai.rag.database.utils import (
+    iter_documents_in_file,
+    iter_json_files,
+)
+
+
+def load_pages(root_path: str) -> List[str]:
+    """Join the chunks of the processed corpus back into page texts."""
+    pages = defaultdict(list)
+    for file_path in iter_json_files(root_path):
+        for document in iter_documents_in_file(file_path):
+            page_number = document['metadata'].get('page_number')
+            pages[file_path, page_number].append(document['page_content'])
+    return [' '.join(chunks) for chunks in pages.values()]
+
+
+def boundaries(text: str, sentences: List[str]) -> Set[int]:
+    """Get the offsets where the sentences of a text end."""
+    ends, position = set(), 0
+    for sentence in sentences:
+        position = text.find(sentence, position) + len(sentence)
+        ends.add(position)
+    return ends
+
+
+def run(
+    splitter: str, pages: List[str]
+) -> Optional[Tuple[List[List[str]], float]]:
+    """Split every page, returning the sentences and the seconds spent."""
+    start_time = time.perf_counter()
+    try:
+        sentences = [split_into_sentences(text, splitter) for text in pages]
+    except LookupError as e:
+        print(f'[yellow]{splitter}: {e}[/yellow]')
+        return None
+    return sentences, time.perf_counter() - start_time
+
+
+def main(root_path: str) -> None:
+    pages = load_pages(root_path)
+    characters = sum(map(len, pages))
+    print(f'{len(pages)} pages, {characters / 1e6:.1f}M characters.')
+
+    results = {}
+    for splitter in ('regex', 'nltk'):
+        result = run(splitter, pages)
+        if result is None:
+            continue
+        results[splitter] = result
+        sentences, elapsed = result
+        print(
+            f'{splitter:>6}: {sum(map(len, sentences))} sentences in '
+            f'{elapsed:.2f}s ({characters / elapsed / 1e6:.1f}M characters/s)'
+        )
+
+    if len(results) < len(('regex', 'nltk')):
+        return
+    matched, regex_total, nltk_total = 0, 0, 0
+    for text, regex_sentences, nltk_sentences in zip(
+        pages, results['regex'][0], results['nltk'][0]
+    ):
+        regex_ends = boundaries(text, regex_sentences)
+        nltk_ends = boundaries(text, nltk_sentences)
+        matched += len(regex_ends & nltk_ends)
+        regex_total += len(regex_ends)
+        nltk_total += len(nltk_ends)
+    print(
+        f'[green]Agreement: precision {matched / regex_total:.1%}, recall {matched / nltk_total:.1%}, speedup {results["nltk"][1] / results["regex"][1]:.1f}x.[/green]'  # noqa: E501
+    )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('root_path', nargs='?', default='data/processed/')
+    args = parser.parse_args()
+
+    main(args.root_path)
@@ -1,16 +1,88 @@
-from typing import Optional
+import json
+from contextlib import asynccontextmanager
+from typing import Annotated, List, Optional
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
-from pydantic import BaseModel
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
+from langchain_openai import OpenAIEmbeddings
+from pydantic import BaseModel, Field, StringConstraints
 from rich import print
 
+from mental_health_ai.rag.cache import RetrievalCache, SemanticCache
+from mental_health_ai.rag.database.health import HealthMonitor
 from mental_health_ai.rag.database.weaviate_impl import WeaviateClient
+from mental_health_ai.rag.embeddings import (
+    create_query_embeddings,
+    embedding_model_name,
+)
 from mental_health_ai.rag.llm.openai_impl import OpenAILLM
 from mental_health_ai.rag.rag import RAGFactory
+from mental_health_ai.settings import settings
+
+query_embeddings = (
+    create_query_embeddings() if settings.QUERY_EMBEDDING_IN_PROCESS else None
+)
+if settings.VECTOR_DB_BACKEND == 'faiss':
+    # Imported here so Weaviate deployments do not need faiss installed.
+    from mental_health_ai.rag.database.faiss_impl import (  # noqa: PLC0415
+        FaissDatabase,
+    )
+
+    # Without in-process query embeddings, FAISS embeds locally.
+    local_embeddings = query_embeddings is None or settings.IS_LOCAL_EMBEDDING
+    vector_db = FaissDatabase(
+        embeddings=query_embeddings
+        or create_query_embeddings(local_embeddings),
+        model_name=embedding_model_name(local_embeddings),
+    )
+else:
+    vector_db = WeaviateClient(query_embeddings=query_embeddings)
+llm = OpenAILLM()
+health_monitor = HealthMonitor(vector_db)
+answer_cache = (
+    SemanticCache(
+        query_embeddings
+        if query_embeddings is not None
+        else OpenAIEmbeddings(api_key=settings.OPENAI_API_KEY),
+        threshold=settings.SEMANTIC_CACHE_THRESHOLD,
+        max_size=settings.SEMANTIC_CACHE_MAX_SIZE,
+        ttl=settings.SEMANTIC_CACHE_TTL,
+    )
+    if settings.SEMANTIC_CACHE_ENABLED
+    else None
+)
+retrieval_cache = (
+    RetrievalCache(
+        max_size=settings.RETRIEVAL_CACHE_MAX_SIZE,
+        ttl=settings.RETRIEVAL_CACHE_TTL,
+    )
+    if settings.RETRIEVAL_CACHE_MAX_SIZE > 0
+    else None
+)
+rag_factory = RAGFactory(
+    vector_db=vector_db,
+    llm=llm,
+    health_monitor=health_monitor,
+    answer_cache=answer_cache,
+    retrieval_cache=retrieval_cache,
+)
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    try:
+        vector_db.build_page_index()
+    except Exception as e:
+        print(f'[yellow]Page index will be built on first query: {e}[/yellow]')
+    await health_monitor.start()
+    yield
+    await health_monitor.stop()
+    await vector_db.aclose()
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -20,10 +92,6 @@ app.add_middleware(
     allow_headers=['*'],
 )
 
-vector_db = WeaviateClient()
-llm = OpenAILLM()
-rag_factory = RAGFactory(vector_db=vector_db, llm=llm)
-
 
 class QueryRequest(BaseModel):
     query: str
@@ -35,6 +103,62 @@ class QueryResponse(BaseModel):
     source_documents: list
 
 
+class BatchQueryRequest(BaseModel):
+    queries: List[
+        Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+    ] = Field(..., min_length=1, max_length=settings.MAX_BATCH_QUERIES)
+    top_k: Optional[int] = 5
+
+
+class BatchQueryResponse(BaseModel):
+    results: List[QueryResponse]
+
+
+@app.get('/healthz')
+async def healthz():
+    """Liveness probe: the API process is up and the health monitor is running."""  # noqa: E501
+    if not health_monitor.is_running:
+        return JSONResponse(
+            status_code=503, content={'status': 'health monitor stopped'}
+        )
+    return {'status': 'ok'}
+
+
+@app.get('/readyz')
+async def readyz():
+    """Readiness probe: the cached database health allows serving queries."""  # noqa: E501
+    if not health_monitor.is_ready:
+        return JSONResponse(
+            status_code=503,
+            content={
+                'status': 'not ready',
+                'detail': health_monitor.status.detail,
+            },
+        )
+    return {'status': 'ready'}
+
+
+@app.get('/rag/cache/stats')
+async def cache_stats():
+    """Hit and miss counters of the answer, retrieval, query embedding and OpenAI prompt caches."""  # noqa: E501
+    prompt_stats = llm.prompt_cache_stats()
+    return {
+        **{
+            name: {'enabled': True, **cache.stats()}
+            if cache is not None
+            else {'enabled': False}
+            for name, cache in (
+                ('answer', answer_cache),
+                ('retrieval', retrieval_cache),
+                ('query_embeddings', query_embeddings),
+            )
+        },
+        'prompt': {'enabled': True, **prompt_stats}
+        if prompt_stats is not None
+        else {'enabled': False},
+    }
+
+
 @app.get('/')
 async def get():
     html = """<!DOCTYPE html>
@@ -177,6 +301,7 @@ async def get():
 
             chatBox.appendChild(messageElement);
             chatBox.scrollTop = chatBox.scrollHeight;
+            return messageElement;
         }
 
         function addLoader() {
@@ -194,7 +319,46 @@ async def get():
             }
         }
 
-        async function sendMessage() {
+        const socketProtocol = location.protocol === 'https:' ? 'wss' : 'ws';
+        const socket = new WebSocket(`${socketProtocol}://${location.host}/rag/ws`);
+        let botMessage = null;
+        let botText = '';
+
+        socket.addEventListener('message', function (event) {
+            const data = JSON.parse(event.data);
+
+            if (data.type === 'sources') {
+                console.log(data.source_documents);
+            } else if (data.type === 'token') {
+                if (!botMessage) {
+                    removeLoader();
+                    botMessage = appendMessage('', 'bot');
+                }
+                botText += data.content;
+                botMessage.innerHTML = marked.parse(botText);
+                chatBox.scrollTop = chatBox.scrollHeight;
+            } else if (data.type === 'done') {
+                if (!botMessage) {
+                    removeLoader();
+                    appendMessage('Sorry, I didn’t understand that.', 'bot');
+                }
+                botMessage = null;
+                botText = '';
+            } else if (data.type === 'error') {
+                console.error('Error:', data.detail);
+                removeLoader();
+                appendMessage(`Error: ${data.detail}`, 'bot');
+                botMessage = null;
+                botText = '';
+            }
+        });
+
+        socket.addEventListener('close', function () {
+            removeLoader();
+            appendMessage('Error: Could not reach the server.', 'bot');
+        });
+
+        function sendMessage() {
             const message = userInput.value;
             if (!message) return;
 
@@ -202,27 +366,7 @@ async def get():
             userInput.value = '';
 
             addLoader();
-
-            try {
-                const response = await fetch('http://127.0.0.1:8000/rag/query', {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json',
-                    },
-                    body: JSON.stringify({ query: message }),
-                });
-
-                const data = await response.json();
-                console.log(data);
-                const botMessage = data.response || 'Sorry, I didn’t understand that.';
-
-                removeLoader();
-                appendMessage(botMessage, 'bot');
-            } catch (error) {
-                console.error('Error:', error);
-                removeLoader();
-                appendMessage('Error: Could not reach the server.', 'bot');
-            }
+            socket.send(JSON.stringify({ query: message }));
         }
 
         sendButton.addEventListener('click', sendMessage);
@@ -242,7 +386,7 @@ async def get():
 @app.post('/rag/query', response_model=QueryResponse)
 async def query_rag(request: QueryRequest):
     try:
-        response, source_documents = rag_factory.generate_response(
+        response, source_documents = await rag_factory.agenerate_response(
             request.query, request.top_k
         )
 
@@ -254,4 +398,75 @@ async def query_rag(request: QueryRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-# TODO: Adicionar implementação para WebSocket
+@app.post('/rag/query/batch', response_model=BatchQueryResponse)
+async def query_rag_batch(request: BatchQueryRequest):
+    """Answer many queries at once, in input order, sharing the retrieval work."""  # noqa: E501
+    try:
+        results = await rag_factory.agenerate_responses(
+            request.queries,
+            request.top_k,
+            max_concurrency=settings.LLM_BATCH_CONCURRENCY,
+        )
+
+        return BatchQueryResponse(
+            results=[
+                QueryResponse(
+                    response=response, source_documents=source_documents
+                )
+                for response, source_documents in results
+            ]
+        )
+    except Exception as e:
+        print(f'[red]Error: {e}[/red]')
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _encode_event(event: dict) -> str:
+    """Serialize a streaming event, including the retrieved documents, to JSON."""  # noqa: E501
+    return json.dumps(jsonable_encoder(event), ensure_ascii=False)
+
+
+@app.post('/rag/stream')
+async def stream_rag(request: QueryRequest):
+    """Stream the sources and then the response tokens as Server-Sent Events."""  # noqa: E501
+
+    async def event_stream():
+        try:
+            async for event in rag_factory.astream_response(
+                request.query, request.top_k
+            ):
+                yield f'event: {event["type"]}\ndata: {_encode_event(event)}\n\n'  # noqa: E501
+        except Exception as e:
+            print(f'[red]Error: {e}[/red]')
+            error = {'type': 'error', 'detail': str(e)}
+            yield f'event: error\ndata: {_encode_event(error)}\n\n'
+
+    return StreamingResponse(
+        event_stream(),
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
+
+
+@app.websocket('/rag/ws')
+async def websocket_rag(websocket: WebSocket):
+    """Answer each query received on the socket with the sources and then the response tokens."""  # noqa: E501
+    await websocket.accept()
+    try:
+        while True:
+            try:
+                payload = await websocket.receive_json()
+                request = QueryRequest(**payload)
+                async for event in rag_factory.astream_response(
+                    request.query, request.top_k
+                ):
+                    await websocket.send_text(_encode_event(event))
+            except WebSocketDisconnect:
+                raise
+            except Exception as e:
+                print(f'[red]Error: {e}[/red]')
+                await websocket.send_text(
+                    _encode_event({'type': 'error', 'detail': str(e)})
+                )
+    except WebSocketDisconnect:
+        print('WebSocket disconnected.')
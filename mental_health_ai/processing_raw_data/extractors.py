@@ -0,0 +1,113 @@
+from abc import ABC, abstractmethod
+from importlib.util import find_spec
+from typing import Dict, Iterator, List, Type
+
+
+class PdfExtractor(ABC):
+    """
+    Text extraction backend streaming the pages of a PDF one at a time.
+
+    Only the page being extracted is held in memory, so the chunking of a
+    long document such as the DSM-5 starts with its first page.
+
+    Attributes:
+        name (str): Name of the engine, used to choose it.
+        module_name (str): Library the engine depends on.
+
+    Examples:
+        >>> extractor = get_extractor('pypdf')
+        >>> for page_text in extractor.iter_pages('data/raw/dsm5/DSM5_organized.pdf'):
+        ...     print(page_text[:100])
+    """  # noqa: E501
+
+    name: str
+    module_name: str
+
+    @abstractmethod
+    def iter_pages(self, pdf_path: str) -> Iterator[str]:
+        """Yield the text of each page of a PDF, in page order.
+
+        Parameters:
+            pdf_path (str): Path of the PDF.
+
+        Returns:
+            Iterator[str]: The text of each page.
+        """
+        raise NotImplementedError
+
+
+class PypdfExtractor(PdfExtractor):
+    """Pure Python extraction with `pypdf`, the default engine."""
+
+    name = 'pypdf'
+    module_name = 'pypdf'
+
+    def iter_pages(self, pdf_path: str) -> Iterator[str]:  # noqa: PLR6301
+        from pypdf import PdfReader  # noqa: PLC0415
+
+        reader = PdfReader(pdf_path)
+        for page in reader.pages:
+            yield page.extract_text()
+
+
+class PdfiumExtractor(PdfExtractor):
+    """Extraction with `pypdfium2`, bindings to the PDFium C++ library.
+
+    Usually several times faster than `pypdf`. `pypdfium2` is an optional
+    dependency, installed separately.
+    """
+
+    name = 'pypdfium2'
+    module_name = 'pypdfium2'
+
+    def iter_pages(self, pdf_path: str) -> Iterator[str]:  # noqa: PLR6301
+        import pypdfium2 as pdfium  # noqa: PLC0415
+
+        document = pdfium.PdfDocument(pdf_path)
+        try:
+            for index in range(len(document)):
+                page = document[index]
+                text_page = page.get_textpage()
+                try:
+                    yield text_page.get_text_range()
+                finally:
+                    text_page.close()
+                    page.close()
+        finally:
+            document.close()
+
+
+EXTRACTORS: Dict[str, Type[PdfExtractor]] = {
+    extractor.name: extractor
+    for extractor in (PypdfExtractor, PdfiumExtractor)
+}
+DEFAULT_EXTRACTOR = PypdfExtractor.name
+
+
+def get_extractor(name: str = DEFAULT_EXTRACTOR) -> PdfExtractor:
+    """
+    Create the extraction engine registered under a name.
+
+    Args:
+        name (str): Name of the engine, a key of `EXTRACTORS`.
+
+    Returns:
+        PdfExtractor: The engine.
+
+    Raises:
+        ValueError: If no engine has this name.
+    """
+    if name not in EXTRACTORS:
+        raise ValueError(
+            f'Unknown PDF extractor: {name}. Choose one of {", ".join(EXTRACTORS)}.'  # noqa: E501
+        )
+    return EXTRACTORS[name]()
+
+
+def available_extractors() -> List[str]:
+    """Get the names of the engines whose library is installed."""
+    return [
+        name
+        for name, extractor in EXTRACTORS.items()
+        if find_spec(extractor.module_name) is not None
+    ]
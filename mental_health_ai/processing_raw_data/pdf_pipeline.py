@@ -0,0 +1,303 @@
+import argparse
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from rich import print
+
+from mental_health_ai.processing_raw_data.extractors import (
+    DEFAULT_EXTRACTOR,
+    EXTRACTORS,
+    get_extractor,
+)
+from mental_health_ai.processing_raw_data.utils import (
+    DEFAULT_SENTENCE_SPLITTER,
+    SENTENCE_SPLITTERS,
+    reconstruct_documents,
+    split_into_sentences,
+)
+from mental_health_ai.rag.database.ingestion import content_hash, file_sha256
+
+PROCESSOR_VERSION = 1
+"""Version of the chunking logic, bumped to reprocess every PDF."""
+
+RECORD_SUFFIX = '.source.json'
+
+
+@dataclass(frozen=True)
+class PdfJob:
+    """
+    A PDF to split into chunks and the JSON file receiving them.
+
+    Attributes:
+        pdf_path (str): Path of the PDF.
+        output_path (str): Path of the JSON file with the chunks.
+        title_prefix (str): Title of the chunks before the page number, e.g. 'DSM-5 Page '.
+        doc_type (str): Type of the document, 'DSM-5' or 'Article'.
+        source (str): Name of the PDF, stored as the source of the chunks.
+        source_description (str): Description of the source.
+        date (str): Publication date of the source.
+    """  # noqa: E501
+
+    pdf_path: str
+    output_path: str
+    title_prefix: str
+    doc_type: str
+    source: str
+    source_description: str
+    date: str
+
+
+def record_path(output_path: str) -> str:
+    """
+    Get the path of the processing record of an output file.
+
+    The record is a hidden file next to the output, so `iter_json_files`
+    never reads it as documents.
+    """
+    directory, name = os.path.split(output_path)
+    return os.path.join(directory, f'.{name}{RECORD_SUFFIX}')
+
+
+def job_fingerprint(
+    job: PdfJob,
+    pdf_sha256: str,
+    target_lines_per_chunk: int,
+    extractor: str = DEFAULT_EXTRACTOR,
+    sentence_splitter: str = DEFAULT_SENTENCE_SPLITTER,
+) -> str:
+    """
+    Hash everything that determines the output of a job.
+
+    Args:
+        job (PdfJob): The job.
+        pdf_sha256 (str): Hash of the PDF content.
+        target_lines_per_chunk (int): Target number of lines per chunk.
+        extractor (str): Name of the text extraction engine.
+        sentence_splitter (str): Name of the sentence splitter.
+
+    Returns:
+        str: The fingerprint stored in the processing record.
+    """
+    return content_hash(
+        json.dumps(
+            {
+                'version': PROCESSOR_VERSION,
+                'pdf_sha256': pdf_sha256,
+                'target_lines_per_chunk': target_lines_per_chunk,
+                'extractor': extractor,
+                'sentence_splitter': sentence_splitter,
+                'job': asdict(job),
+            },
+            sort_keys=True,
+        )
+    )
+
+
+def is_up_to_date(output_path: str, fingerprint: str) -> bool:
+    """Check whether an output exists and was produced with the fingerprint."""
+    path = record_path(output_path)
+    if not (os.path.exists(output_path) and os.path.exists(path)):
+        return False
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f).get('fingerprint') == fingerprint
+
+
+def _write_json_atomic(path: str, content: Any) -> None:
+    """Write a JSON file atomically, so an interrupted run keeps the previous one."""  # noqa: E501
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        'w', encoding='utf-8', dir=directory, delete=False
+    ) as f:
+        json.dump(content, f, ensure_ascii=False)
+    os.replace(f.name, path)
+
+
+def process_pdf(
+    job: PdfJob,
+    fingerprint: str,
+    target_lines_per_chunk: int,
+    extractor: str = DEFAULT_EXTRACTOR,
+    sentence_splitter: str = DEFAULT_SENTENCE_SPLITTER,
+) -> Tuple[int, int, float]:
+    """
+    Split a PDF into chunks and write them, then its processing record.
+
+    Runs in a worker process of `process_pdfs`. Pages are streamed from the
+    extraction engine and chunked as they arrive, so only the chunks are
+    held in memory, not every page of the document. The record is written
+    after the output, so an interrupted job is processed again on the next
+    run.
+
+    Args:
+        job (PdfJob): The PDF and its output.
+        fingerprint (str): Fingerprint of the job, see `job_fingerprint`.
+        target_lines_per_chunk (int): Target number of lines per chunk.
+        extractor (str): Name of the text extraction engine.
+        sentence_splitter (str): Name of the sentence splitter.
+
+    Returns:
+        Tuple[int, int, float]: Number of pages, number of chunks and seconds spent.
+    """  # noqa: E501
+    start_time = time.perf_counter()
+    pages = 0
+    documents = []
+    for page_number, page_text in enumerate(
+        get_extractor(extractor).iter_pages(job.pdf_path), start=1
+    ):
+        pages = page_number
+        for chunk in reconstruct_documents(
+            split_into_sentences(page_text, sentence_splitter),
+            target_lines_per_chunk=target_lines_per_chunk,
+        ):
+            if not chunk.strip():
+                continue
+
+            documents.append({
+                'title': f'{job.title_prefix}{page_number}',
+                'page_content': chunk,
+                'metadata': {
+                    'type': job.doc_type,
+                    'source': job.source,
+                    'page_number': page_number,
+                    'source_description': job.source_description,
+                    'date': job.date,
+                },
+            })
+
+    _write_json_atomic(job.output_path, documents)
+    _write_json_atomic(
+        record_path(job.output_path), {'fingerprint': fingerprint}
+    )
+    return pages, len(documents), time.perf_counter() - start_time
+
+
+def process_pdfs(  # noqa: PLR0913, PLR0917
+    jobs: List[PdfJob],
+    workers: Optional[int] = None,
+    target_lines_per_chunk: int = 15,
+    force: bool = False,
+    extractor: str = DEFAULT_EXTRACTOR,
+    sentence_splitter: str = DEFAULT_SENTENCE_SPLITTER,
+) -> Dict[str, int]:
+    """
+    Process PDFs across a process pool, skipping the unchanged ones.
+
+    A PDF is skipped when its output exists and its record matches the hash
+    of the PDF, the chunking parameters and the job metadata. The largest
+    PDFs are submitted first so a long document does not finish last alone.
+
+    Args:
+        jobs (List[PdfJob]): The PDFs to process.
+        workers (Optional[int]): Number of worker processes, all cores by default.
+        target_lines_per_chunk (int): Target number of lines per chunk.
+        force (bool): Whether to reprocess unchanged PDFs.
+        extractor (str): Name of the text extraction engine, see `EXTRACTORS`.
+        sentence_splitter (str): Name of the sentence splitter, see `SENTENCE_SPLITTERS`.
+
+    Returns:
+        Dict[str, int]: Number of processed, skipped and failed PDFs.
+    """  # noqa: E501
+    start_time = time.perf_counter()
+    stats = {'processed': 0, 'skipped': 0, 'failed': 0}
+    pending = []
+    for job in jobs:
+        fingerprint = job_fingerprint(
+            job,
+            file_sha256(job.pdf_path),
+            target_lines_per_chunk,
+            extractor,
+            sentence_splitter,
+        )
+        if not force and is_up_to_date(job.output_path, fingerprint):
+            stats['skipped'] += 1
+            continue
+        pending.append((job, fingerprint))
+    pending.sort(
+        key=lambda item: os.path.getsize(item[0].pdf_path), reverse=True
+    )
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    process_pdf,
+                    job,
+                    fingerprint,
+                    target_lines_per_chunk,
+                    extractor,
+                    sentence_splitter,
+                ): job
+                for job, fingerprint in pending
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                name = os.path.basename(futures[future].pdf_path)
+                try:
+                    pages, chunks, elapsed = future.result()
+                except Exception as e:
+                    stats['failed'] += 1
+                    print(
+                        f'[red]{done}/{len(pending)} - Failed to process {name}: {e}[/red]'  # noqa: E501
+                    )
+                    continue
+                stats['processed'] += 1
+                print(
+                    f'{done}/{len(pending)} - {name}: {pages} pages, {chunks} chunks in {elapsed:.1f}s'  # noqa: E501
+                )
+
+    elapsed = time.perf_counter() - start_time
+    print(
+        f'[green]PDFs processed in {elapsed:.1f}s: {stats["processed"]} processed, {stats["skipped"]} unchanged, {stats["failed"]} failed.[/green]'  # noqa: E501
+    )
+    return stats
+
+
+def build_parser(
+    description: str, target_lines_per_chunk: int = 15
+) -> argparse.ArgumentParser:
+    """
+    Build the command line parser shared by the PDF processing scripts.
+
+    Args:
+        description (str): Description of the script.
+        target_lines_per_chunk (int): Default of `--target-lines-per-chunk`.
+
+    Returns:
+        argparse.ArgumentParser: The parser of the script options.
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Number of worker processes (default: all cores).',
+    )
+    parser.add_argument(
+        '--target-lines-per-chunk',
+        type=int,
+        default=target_lines_per_chunk,
+        help='Target number of lines per chunk (default: %(default)s).',
+    )
+    parser.add_argument(
+        '--extractor',
+        choices=list(EXTRACTORS),
+        default=DEFAULT_EXTRACTOR,
+        help='PDF text extraction engine.',
+    )
+    parser.add_argument(
+        '--sentence-splitter',
+        choices=SENTENCE_SPLITTERS,
+        default=DEFAULT_SENTENCE_SPLITTER,
+        help="NLTK's Punkt tokenizer or the faster regex splitter.",
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Reprocess the PDFs whose outputs are up to date.',
+    )
+    return parser
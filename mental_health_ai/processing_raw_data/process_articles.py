@@ -1,16 +1,27 @@
+import argparse
 import json
-from itertools import count
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from http import HTTPStatus
+from typing import Any, Dict, List
 
 import requests
+from requests.adapters import HTTPAdapter
+from rich import print
 
+METADATA_PATH = 'data/raw/articles/articles_metadata.json'
+OUTPUT_PATH = 'data/raw/articles/scrapped/'
 LIMIT_ARTICLES = 100
 LIMIT_TITLE_LENGTH = 200
-
-with open('data/raw/articles/articles_metadata.json', 'r') as file:  # noqa
-    articles = json.load(file)
-    articles = articles[:LIMIT_ARTICLES]
-
-counter = count(1)
+PARTIAL_SUFFIX = '.part'
+RETRY_STATUS_CODES = {
+    HTTPStatus.TOO_MANY_REQUESTS,
+    HTTPStatus.INTERNAL_SERVER_ERROR,
+    HTTPStatus.BAD_GATEWAY,
+    HTTPStatus.SERVICE_UNAVAILABLE,
+    HTTPStatus.GATEWAY_TIMEOUT,
+}
 
 
 def clear_title(title):
@@ -30,11 +41,247 @@ def clear_title(title):
     return cleaned_title
 
 
-for article in articles:
-    print(f'Processing article {next(counter)}')
-    pdf_link = article['pdf_url']
-    pdf_content = requests.get(pdf_link).content
-    cleaned_title = clear_title(article['title'])
+def load_articles(
+    metadata_path: str = METADATA_PATH, limit: int = LIMIT_ARTICLES
+) -> List[Dict[str, Any]]:
+    """Load the metadata of the first `limit` scraped articles."""
+    with open(metadata_path, 'r', encoding='utf-8') as file:
+        return json.load(file)[:limit]
+
+
+def create_session(pool_size: int) -> requests.Session:
+    """Create an HTTP session pooling up to `pool_size` connections per host."""  # noqa: E501
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def _expected_size(response: requests.Response, offset: int) -> int:
+    """Get the full size of the file being downloaded, or -1 if unknown."""
+    content_range = response.headers.get('Content-Range', '')
+    if '/' in content_range and not content_range.endswith('/*'):
+        return int(content_range.rsplit('/', 1)[1])
+    if 'Content-Length' in response.headers:
+        return offset + int(response.headers['Content-Length'])
+    return -1
+
+
+def _remote_size(session: requests.Session, url: str, timeout: float) -> int:
+    """Get the size of a remote file from a HEAD request, or -1 if unknown."""
+    try:
+        response = session.head(url, allow_redirects=True, timeout=timeout)
+        response.raise_for_status()
+    except requests.RequestException:
+        return -1
+    return int(response.headers.get('Content-Length', -1))
+
+
+def _download_once(
+    session: requests.Session,
+    url: str,
+    partial_path: str,
+    chunk_size: int,
+    timeout: float,
+) -> bool:
+    """
+    Stream a URL to a partial file, resuming from its current size.
+
+    Returns:
+        bool: Whether the download resumed a partial file.
+
+    Raises:
+        requests.RequestException: If the request fails or the file is incomplete.
+    """  # noqa: E501
+    offset = (
+        os.path.getsize(partial_path) if os.path.exists(partial_path) else 0
+    )
+    headers = {'Range': f'bytes={offset}-'} if offset else {}
+    with session.get(
+        url, headers=headers, stream=True, timeout=timeout
+    ) as response:
+        if offset and response.status_code == (
+            HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE
+        ):
+            # The partial file already holds the whole file.
+            return True
+        response.raise_for_status()
+
+        # Servers ignoring the range send the whole file again.
+        resumed = (
+            offset > 0 and response.status_code == HTTPStatus.PARTIAL_CONTENT
+        )
+        if not resumed:
+            offset = 0
+        expected_size = _expected_size(response, offset)
+
+        with open(partial_path, 'ab' if resumed else 'wb') as file:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                file.write(chunk)
+
+    size = os.path.getsize(partial_path)
+    if expected_size >= 0 and size != expected_size:
+        raise requests.ConnectionError(
+            f'Incomplete download of {url}: {size} of {expected_size} bytes.'
+        )
+    return resumed
+
+
+def download_file(  # noqa: PLR0913, PLR0917
+    session: requests.Session,
+    url: str,
+    path: str,
+    chunk_size: int = 1 << 16,
+    retries: int = 3,
+    backoff: float = 1.0,
+    timeout: float = 30.0,
+) -> str:
+    """
+    Download a file to disk in chunks, resuming and retrying on failures.
 
-    with open(f'data/raw/articles/scrapped/{cleaned_title}.pdf', 'wb') as file:
-        file.write(pdf_content)
+    The file is streamed to `<path>.part` and renamed once complete, so an
+    existing `path` is a finished download. It is skipped unless a HEAD
+    request reports a different `Content-Length`, in which case it is
+    downloaded again. A partial file left by a failed attempt or an
+    interrupted run is resumed with a `Range` request when the server
+    supports it.
+
+    Args:
+        session (requests.Session): Session whose connections are reused.
+        url (str): URL of the file.
+        path (str): Destination path.
+        chunk_size (int): Number of bytes written at a time.
+        retries (int): Number of retries after the first attempt.
+        backoff (float): Seconds before the first retry, doubled at each retry.
+        timeout (float): Seconds to wait for the server to connect or send data.
+
+    Returns:
+        str: 'skipped', 'resumed' or 'downloaded'.
+
+    Raises:
+        requests.RequestException: If every attempt fails.
+    """  # noqa: E501
+    if os.path.exists(path):
+        remote_size = _remote_size(session, url, timeout)
+        size = os.path.getsize(path)
+        if remote_size < 0 or size == remote_size:
+            return 'skipped'
+        print(
+            f'[yellow]Downloading {url} again: {size} of {remote_size} bytes on disk.[/yellow]'  # noqa: E501
+        )
+        os.remove(path)
+
+    partial_path = f'{path}{PARTIAL_SUFFIX}'
+    resumed = False
+    for attempt in range(retries + 1):
+        try:
+            resumed = (
+                _download_once(session, url, partial_path, chunk_size, timeout)
+                or resumed
+            )
+            break
+        except requests.RequestException as e:
+            status_code = getattr(e.response, 'status_code', None)
+            if attempt == retries or (
+                status_code is not None
+                and status_code not in RETRY_STATUS_CODES
+            ):
+                raise
+            delay = backoff * 2**attempt
+            print(f'[yellow]Retrying {url} in {delay:.1f}s: {e}[/yellow]')
+            time.sleep(delay)
+
+    os.replace(partial_path, path)
+    return 'resumed' if resumed else 'downloaded'
+
+
+def download_articles(  # noqa: PLR0913, PLR0917
+    articles: List[Dict[str, Any]],
+    output_path: str = OUTPUT_PATH,
+    concurrency: int = 8,
+    retries: int = 3,
+    backoff: float = 1.0,
+    timeout: float = 30.0,
+) -> Dict[str, int]:
+    """
+    Download the PDFs of the articles with a bounded pool of connections.
+
+    Articles whose titles clean to the same file name are downloaded once,
+    from the first of their URLs.
+
+    Args:
+        articles (List[Dict[str, Any]]): Scraped metadata with the `title` and `pdf_url` of each article.
+        output_path (str): Directory receiving the PDFs.
+        concurrency (int): Maximum number of simultaneous downloads.
+        retries (int): Number of retries of each download.
+        backoff (float): Seconds before the first retry, doubled at each retry.
+        timeout (float): Seconds to wait for the server to connect or send data.
+
+    Returns:
+        Dict[str, int]: Number of downloaded, resumed, skipped and failed PDFs.
+    """  # noqa: E501
+    os.makedirs(output_path, exist_ok=True)
+    # Titles cleaning to the same file name would share the partial file.
+    jobs: Dict[str, Dict[str, Any]] = {}
+    for article in articles:
+        path = os.path.join(
+            output_path, f'{clear_title(article["title"])}.pdf'
+        )
+        if jobs.setdefault(path, article) is not article:
+            print(
+                f'[yellow]Skipping {article["pdf_url"]}: {path} is downloaded from {jobs[path]["pdf_url"]}.[/yellow]'  # noqa: E501
+            )
+
+    stats = {'downloaded': 0, 'resumed': 0, 'skipped': 0, 'failed': 0}
+    start_time = time.perf_counter()
+    with (
+        create_session(concurrency) as session,
+        ThreadPoolExecutor(max_workers=concurrency) as executor,
+    ):
+        futures = {
+            executor.submit(
+                download_file,
+                session,
+                article['pdf_url'],
+                path,
+                retries=retries,
+                backoff=backoff,
+                timeout=timeout,
+            ): article
+            for path, article in jobs.items()
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            url = futures[future]['pdf_url']
+            try:
+                status = future.result()
+            except requests.RequestException as e:
+                stats['failed'] += 1
+                print(f'[red]{done}/{len(futures)} - Failed {url}: {e}[/red]')
+                continue
+            stats[status] += 1
+            print(f'{done}/{len(futures)} - {status.capitalize()} {url}')
+
+    elapsed = time.perf_counter() - start_time
+    print(
+        f'[green]Articles downloaded in {elapsed:.1f}s: {stats["downloaded"]} downloaded, {stats["resumed"]} resumed, {stats["skipped"]} skipped, {stats["failed"]} failed.[/green]'  # noqa: E501
+    )
+    return stats
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Download the PDFs of the scraped articles.'
+    )
+    parser.add_argument('--limit', type=int, default=LIMIT_ARTICLES)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--retries', type=int, default=3)
+    parser.add_argument('--timeout', type=float, default=30.0)
+    args = parser.parse_args()
+
+    download_articles(
+        load_articles(limit=args.limit),
+        concurrency=args.concurrency,
+        retries=args.retries,
+        timeout=args.timeout,
+    )
@@ -1,89 +1,88 @@
-import json
 import os
-from itertools import count
+from typing import Any, Dict, List
 
-from langchain_community.document_loaders import PyPDFLoader
 from rich import print
 
-from mental_health_ai.processing_raw_data.utils import (
-    reconstruct_documents,
-    split_into_sentences,
+from mental_health_ai.processing_raw_data.pdf_pipeline import (
+    PdfJob,
+    build_parser,
+    process_pdfs,
+)
+from mental_health_ai.processing_raw_data.process_articles import (
+    METADATA_PATH,
+    clear_title,
+    load_articles,
 )
 
 RAW_DATA_PATH = 'data/raw/articles/scrapped/'
 OUTPUT_PATH = 'data/processed/articles/scrapped/'
-METADATA_PATH = 'data/raw/articles/articles_metadata.json'
 TARGET_LINES_PER_CHUNK = 15
-LIMIT_TITLE_LENGTH = 200
 
-with open(METADATA_PATH, 'r', encoding='utf-8') as meta_file:
-    metadata_list = json.load(meta_file)[:100]
-    cleaned_titles = [
-        (
-            f'{article["title"][:LIMIT_TITLE_LENGTH]}...'
-            if len(article['title']) > LIMIT_TITLE_LENGTH
-            else article['title']
-        )
-        .lower()
-        .replace('\n', '')
-        .replace(' ', '_')
-        .replace('/', '_')
-        .replace(',', '')
-        + '.pdf'
-        for article in metadata_list
-    ]
 
+def load_articles_metadata(
+    metadata_path: str = METADATA_PATH,
+) -> Dict[str, Dict[str, Any]]:
+    """Load the metadata of the downloaded articles, keyed by PDF file name."""
+    metadata_by_pdf = {}
+    for article in load_articles(metadata_path):
+        metadata_by_pdf.setdefault(
+            f'{clear_title(article["title"])}.pdf', article
+        )
+    return metadata_by_pdf
 
-def find_metadata_by_pdf(pdf_name, cleaned_titles):
-    for indice, cleaned_title in enumerate(cleaned_titles):
-        if pdf_name == cleaned_title:
-            return metadata_list[indice]
-    print(f'[red]Metadata not found for {pdf_name}[/red]')
-    return None
 
+def article_jobs(
+    raw_path: str = RAW_DATA_PATH,
+    output_path: str = OUTPUT_PATH,
+    metadata_path: str = METADATA_PATH,
+) -> List[PdfJob]:
+    """
+    Build the jobs splitting each downloaded article PDF into a JSON file.
 
-pdf_files = [f for f in os.listdir(RAW_DATA_PATH) if f.endswith('.pdf')]
-counter = count(1)
+    Args:
+        raw_path (str): Directory of the PDFs.
+        output_path (str): Directory receiving the JSON files.
+        metadata_path (str): Path of the scraped articles metadata.
 
-for pdf_file in pdf_files:
-    file_path = os.path.join(RAW_DATA_PATH, pdf_file)
-    loader = PyPDFLoader(file_path)
-    documents = loader.load()
+    Returns:
+        List[PdfJob]: One job per PDF with metadata, in file name order.
+    """
+    metadata_by_pdf = load_articles_metadata(metadata_path)
+    jobs = []
+    for pdf_file in sorted(os.listdir(raw_path)):
+        if not pdf_file.endswith('.pdf'):
+            continue
 
-    metadata = find_metadata_by_pdf(pdf_file, cleaned_titles)
+        metadata = metadata_by_pdf.get(pdf_file)
+        if metadata is None:
+            print(f'[red]Metadata not found for {pdf_file}[/red]')
+            continue
 
-    if metadata:
-        splitted_documents = []
-        for i, doc in enumerate(documents):
-            page_number = i + 1
-            sentence_splits = split_into_sentences(doc)
-            reconstructed_docs = reconstruct_documents(
-                sentence_splits, target_lines_per_chunk=TARGET_LINES_PER_CHUNK
+        jobs.append(
+            PdfJob(
+                pdf_path=os.path.join(raw_path, pdf_file),
+                output_path=os.path.join(
+                    output_path, f'{os.path.splitext(pdf_file)[0]}.json'
+                ),
+                title_prefix=f'{metadata["title"]} - Page ',
+                doc_type='Article',
+                source=pdf_file,
+                source_description=metadata['description'],
+                date=metadata['date'],
             )
-            for idx, chunk in enumerate(reconstructed_docs):
-                if not chunk.strip():
-                    continue
-
-                splitted_documents.append({
-                    'title': f'{metadata["title"]} - Page {page_number}',
-                    'page_content': chunk,
-                    'metadata': {
-                        'type': 'Article',
-                        'source': pdf_file,
-                        'page_number': page_number,
-                        'source_description': metadata['description'],
-                        'date': metadata['date'],
-                    },
-                })
-
-        output_file_path = os.path.join(
-            OUTPUT_PATH, f'{os.path.splitext(pdf_file)[0]}.json'
         )
-        with open(output_file_path, 'w', encoding='utf-8') as f:
-            json.dump(splitted_documents, f, ensure_ascii=False)
+    return jobs
 
-        print(
-            f'{next(counter)} - Documents for {pdf_file} saved as JSON at {output_file_path}'  # noqa: E501
-        )
-    else:
-        print(f'{next(counter)} - No metadata found for {pdf_file}')
+
+if __name__ == '__main__':
+    args = build_parser(
+        'Split the article PDFs into chunks.', TARGET_LINES_PER_CHUNK
+    ).parse_args()
+    process_pdfs(
+        article_jobs(),
+        workers=args.workers,
+        target_lines_per_chunk=args.target_lines_per_chunk,
+        force=args.force,
+        extractor=args.extractor,
+        sentence_splitter=args.sentence_splitter,
+    )
@@ -1,12 +1,9 @@
-import json
 import os
 
-from langchain_community.document_loaders import PyPDFLoader
-from rich import print
-
-from mental_health_ai.processing_raw_data.utils import (
-    reconstruct_documents,
-    split_into_sentences,
+from mental_health_ai.processing_raw_data.pdf_pipeline import (
+    PdfJob,
+    build_parser,
+    process_pdfs,
 )
 
 RAW_DATA_PATH = 'data/raw/dsm5/'
@@ -14,37 +11,31 @@ OUTPUT_PATH = 'data/processed/'
 FILE_NAME = 'DSM5_organized.pdf'
 FULL_PATH = os.path.join(RAW_DATA_PATH, FILE_NAME)
 TARGET_LINES_PER_CHUNK = 15
-
-loader = PyPDFLoader(FULL_PATH)
-documents = loader.load()
-
-splitted_documents = []
-
-for i, doc in enumerate(documents):
-    page_number = i + 1
-    sentence_splits = split_into_sentences(doc)
-    reconstructed_docs = reconstruct_documents(
-        sentence_splits, target_lines_per_chunk=TARGET_LINES_PER_CHUNK
+SOURCE_DESCRIPTION = 'O Manual Diagnóstico e Estatístico de Transtornos Mentais 5.ª edição, ou DSM-5, é um manual diagnóstico e estatístico feito pela Associação Americana de Psiquiatria para definir como é feito o diagnóstico de transtornos mentais. Usado por psicólogos, fonoaudiólogos, médicos e terapeutas ocupacionais. A versão atualizada saiu em maio de 2013 e substitui o DSM-IV criado em 1994 e revisado em 2000. Desde o DSM-I, criado em 1952, esse manual tem sido uma das bases de diagnósticos de saúde mental mais usados no mundo.'  # noqa
+
+
+def dsm5_job() -> PdfJob:
+    """Build the job splitting the DSM-5 PDF into `dsm5.json`."""
+    return PdfJob(
+        pdf_path=FULL_PATH,
+        output_path=os.path.join(OUTPUT_PATH, 'dsm5.json'),
+        title_prefix='DSM-5 Page ',
+        doc_type='DSM-5',
+        source=FILE_NAME,
+        source_description=SOURCE_DESCRIPTION,
+        date='2013-05-18T00:00:00Z',
     )
-    for idx, chunk in enumerate(reconstructed_docs):
-        splitted_documents.append({
-            'title': f'DSM-5 Page {page_number}',
-            'page_content': chunk,
-            'metadata': {
-                'type': 'DSM-5',
-                'source': FILE_NAME,
-                'page_number': page_number,
-                'source_description': 'O Manual Diagnóstico e Estatístico de Transtornos Mentais 5.ª edição, ou DSM-5, é um manual diagnóstico e estatístico feito pela Associação Americana de Psiquiatria para definir como é feito o diagnóstico de transtornos mentais. Usado por psicólogos, fonoaudiólogos, médicos e terapeutas ocupacionais. A versão atualizada saiu em maio de 2013 e substitui o DSM-IV criado em 1994 e revisado em 2000. Desde o DSM-I, criado em 1952, esse manual tem sido uma das bases de diagnósticos de saúde mental mais usados no mundo.',  # noqa
-                'date': '2013-05-18T00:00:00Z',
-            },
-        })
-
-    # TODO: Adicionar validação pydantic para os documentos
-splitted_documents = [
-    doc for doc in splitted_documents if doc['page_content'].strip()
-]
 
-with open(f'{OUTPUT_PATH}dsm5.json', 'w', encoding='utf-8') as f:
-    json.dump(splitted_documents, f, ensure_ascii=False)
 
-print('Splitted documents saved as JSON file')
+if __name__ == '__main__':
+    args = build_parser(
+        'Split the DSM-5 PDF into chunks.', TARGET_LINES_PER_CHUNK
+    ).parse_args()
+    process_pdfs(
+        [dsm5_job()],
+        workers=args.workers,
+        target_lines_per_chunk=args.target_lines_per_chunk,
+        force=args.force,
+        extractor=args.extractor,
+        sentence_splitter=args.sentence_splitter,
+    )
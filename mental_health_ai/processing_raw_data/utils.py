@@ -1,19 +1,109 @@
+import re
+from functools import lru_cache
+
 import nltk
 
-nltk.download('punkt')
+SENTENCE_SPLITTERS = ('nltk', 'regex')
+DEFAULT_SENTENCE_SPLITTER = 'nltk'
+
+SENTENCE_END_PATTERN = re.compile(
+    r'[.!?…]+[)\]"\'»”’]*(?=\s+[(\["\'«“‘]?[A-ZÀ-ÖØ-Þ0-9])'
+)
+"""Sentence-ending punctuation followed by a capitalized or numbered word."""
+
+ABBREVIATIONS = frozenset(
+    (
+        'al art arts aprox av ca cap cf co dept dr dra drs e.g ed eds et '
+        'ex exma exmo fig figs i.e inc jr ltd mr mrs ms n nº obs org orgs '
+        'p pág págs pp prof profa sec sr sra srs srta st tab univ vol vols '
+        'vs'
+    ).split()
+)
+"""Portuguese and English abbreviations that do not end a sentence."""
+
+
+@lru_cache
+def _punkt_tokenizer(language='english'):
+    """
+    Loads the Punkt model once per process, from the local NLTK data only.
+
+    Nothing is downloaded: on offline hosts the model must be copied to one
+    of the NLTK data paths, such as the directory in `NLTK_DATA`.
+
+    Args:
+    language (str): Language of the Punkt model.
+
+    Returns:
+    PunktSentenceTokenizer: The sentence tokenizer.
+    """
+    try:
+        try:
+            from nltk.tokenize import PunktTokenizer  # noqa: PLC0415
+        except ImportError:
+            # NLTK < 3.8.2 ships the models as pickles.
+            return nltk.data.load(f'tokenizers/punkt/{language}.pickle')
+        return PunktTokenizer(language)
+    except LookupError as e:
+        raise LookupError(
+            'NLTK Punkt model not found. Download it once with '
+            '`python -m nltk.downloader -d <dir> punkt punkt_tab` and point '
+            '`NLTK_DATA` to <dir>, or use the regex sentence splitter.'
+        ) from e
+
+
+def _regex_sentences(text):
+    """
+    Splits text at sentence-ending punctuation in a single regex pass.
+
+    A period ends a sentence unless the word before it is a known
+    abbreviation or a single letter (an initial).
+    """
+    sentences = []
+    start = 0
+    for match in SENTENCE_END_PATTERN.finditer(text):
+        punctuation_end = match.start() + len(match.group().rstrip(')]"\'»”’'))
+        if text[punctuation_end - 1] == '.':
+            word_start = max(
+                text.rfind(' ', start, match.start()),
+                text.rfind('\n', start, match.start()),
+            )
+            word = text[word_start + 1 : match.start()].lstrip('(["\'«“‘')
+            if (len(word) == 1 and word.isupper()) or (
+                word.lower() in ABBREVIATIONS
+            ):
+                continue
+
+        sentence = text[start : match.end()].strip()
+        if sentence:
+            sentences.append(sentence)
+        start = match.end()
+
+    last = text[start:].strip()
+    if last:
+        sentences.append(last)
+    return sentences
 
 
-def split_into_sentences(doc):
+def split_into_sentences(text, splitter=DEFAULT_SENTENCE_SPLITTER):
     """
-    Splits the document content into sentences using NLTK's sentence tokenizer.
+    Splits the text of a page into sentences.
 
     Args:
-    doc (Document): The document to be split.
+    text (str): The text to be split.
+    splitter (str): 'nltk' for NLTK's Punkt tokenizer, or 'regex' for the
+        faster abbreviation-aware regex splitter.
 
     Returns:
     List[str]: List of sentences.
     """
-    return nltk.sent_tokenize(doc.page_content)
+    if splitter == 'regex':
+        return _regex_sentences(text)
+    if splitter == 'nltk':
+        return _punkt_tokenizer().tokenize(text)
+    raise ValueError(
+        f'Unknown sentence splitter: {splitter}. '
+        f'Choose one of {", ".join(SENTENCE_SPLITTERS)}.'
+    )
 
 
 def reconstruct_documents(sentences, target_lines_per_chunk=15):
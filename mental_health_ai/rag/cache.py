@@ -0,0 +1,414 @@
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import count
+from threading import RLock
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+from rich import print
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query for exact cache lookups: NFC, lowercase, single spaces."""  # noqa: E501
+    return (
+        re.sub(r'\s+', ' ', unicodedata.normalize('NFC', query))
+        .strip()
+        .lower()
+    )
+
+
+class _CorpusVersionedCache:
+    """
+    Base of the bounded LRU caches tied to a version of the corpus.
+
+    Every entry is dropped when the corpus version passed to a lookup or an
+    insertion differs from the one of the cached entries, and an insertion
+    computed from an older corpus than the cached entries is ignored.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._corpus_version: Optional[int] = None
+        self._lock = RLock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def _sync_corpus_version(self, corpus_version: int) -> bool:
+        """
+        Drop every entry if the corpus changed since they were cached.
+
+        Returns:
+            bool: False if `corpus_version` is older than the cached entries.
+        """
+        if self._corpus_version is not None and (
+            corpus_version < self._corpus_version
+        ):
+            return False
+        if self._corpus_version != corpus_version:
+            self.clear()
+            self._corpus_version = corpus_version
+        return True
+
+    def _evict_overflow(self) -> None:
+        """Evict the least recently used entries beyond `max_size`."""
+        while len(self._entries) > self.max_size:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: Hashable) -> None:
+        del self._entries[key]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the hit and miss counters of the cache.
+
+        Returns:
+            Dict[str, Any]: Hits, misses, size and hit rate of the cache.
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self),
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+
+class RetrievalCache(_CorpusVersionedCache):
+    """
+    Cache of the retrieved documents and assembled context of a query.
+
+    Entries are keyed by the normalized query and `top_k`, so a repeated
+    question skips the search and the page expansion and only pays for the
+    LLM. Entries are evicted in least recently used order beyond `max_size`,
+    dropped when the corpus version of the database changes and expire after
+    `ttl` seconds, which bounds how long a re-ingestion that the corpus
+    version misses (one leaving the document count unchanged) is served
+    stale.
+
+    Attributes:
+        max_size (int): Maximum number of cached retrievals (default is 256).
+        ttl (Optional[float]): Seconds a retrieval stays valid, None to never expire (default is 300).
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups not served from the cache.
+
+    Examples:
+        >>> cache = RetrievalCache(max_size=256)
+        >>> rag_factory = RAGFactory(vector_db, llm, retrieval_cache=cache)
+    """  # noqa: E501
+
+    def __init__(self, max_size: int = 256, ttl: Optional[float] = 300):
+        super().__init__(max_size)
+        self.ttl = ttl
+
+    def get(
+        self, query: str, top_k: int, corpus_version: int
+    ) -> Optional[Tuple[str, list]]:
+        """
+        Get the cached retrieval of a query.
+
+        Args:
+            query (str): The query.
+            top_k (int): Number of documents retrieved for the query.
+            corpus_version (int): Current version of the corpus.
+
+        Returns:
+            Optional[Tuple[str, list]]: The context and the retrieved documents, or None on a miss.
+        """  # noqa: E501
+        key = (normalize_query(query), top_k)
+        with self._lock:
+            self._sync_corpus_version(corpus_version)
+            cached = self._entries.get(key)
+            if cached is not None and (
+                self.ttl is not None
+                and time.monotonic() - cached[2] > self.ttl
+            ):
+                self._remove(key)
+                cached = None
+            if cached is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return cached[0], cached[1]
+
+    def put(  # noqa: PLR0913, PLR0917
+        self,
+        query: str,
+        top_k: int,
+        corpus_version: int,
+        context: str,
+        documents: list,
+    ) -> None:
+        """
+        Cache the retrieval of a query.
+
+        Args:
+            query (str): The query.
+            top_k (int): Number of documents retrieved for the query.
+            corpus_version (int): Version of the corpus the documents were retrieved from.
+            context (str): The assembled context.
+            documents (list): The retrieved documents.
+        """  # noqa: E501
+        key = (normalize_query(query), top_k)
+        with self._lock:
+            if not self._sync_corpus_version(corpus_version):
+                return
+            self._entries[key] = (context, documents, time.monotonic())
+            self._entries.move_to_end(key)
+            self._evict_overflow()
+
+
+@dataclass
+class CachedAnswer:
+    """An answer stored in the semantic cache.
+
+    Attributes:
+        query (str): The query that produced the answer.
+        response (str): The answer generated by the LLM.
+        source_documents (list): The documents retrieved for the query.
+        top_k (int): Number of documents retrieved for the query.
+        corpus_version (int): Version of the corpus the answer was generated from.
+        created_at (float): `time.monotonic()` of the insertion.
+    """  # noqa: E501
+
+    query: str
+    response: str
+    source_documents: list
+    top_k: int
+    corpus_version: int
+    created_at: float
+
+
+class SemanticCache(_CorpusVersionedCache):
+    """
+    Cache of answers keyed by the embedding of their query.
+
+    A new query is served from the cache when the cosine similarity between
+    its embedding and the embedding of a cached query, asked with the same
+    `top_k`, reaches `threshold`. Paraphrases such as "o que é TDAH" and
+    "me explique o TDAH" then skip the vector search, the page expansion and
+    the LLM generation.
+
+    Entries are evicted in least recently used order beyond `max_size`,
+    expire after `ttl` seconds and are all dropped when the corpus version
+    of the database changes.
+
+    Attributes:
+        embeddings (Embeddings): Model used to embed the queries.
+        threshold (float): Minimum cosine similarity of a hit (default is 0.95).
+        max_size (int): Maximum number of cached answers (default is 1024).
+        ttl (Optional[float]): Seconds an answer stays valid, None to never expire (default is 3600).
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups not served from the cache.
+
+    Examples:
+        >>> from langchain_openai import OpenAIEmbeddings
+        >>> cache = SemanticCache(OpenAIEmbeddings(), threshold=0.95)
+        >>> rag_factory = RAGFactory(vector_db, llm, answer_cache=cache)
+        >>> rag_factory.generate_response('O que é TDAH?')
+        >>> rag_factory.generate_response('Me explique o TDAH')  # served from the cache
+        >>> cache.stats()
+        {'hits': 1, 'misses': 1, 'size': 1, 'hit_rate': 0.5}
+    """  # noqa: E501
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        threshold: float = 0.95,
+        max_size: int = 1024,
+        ttl: Optional[float] = 3600,
+    ):
+        super().__init__(max_size)
+        self.embeddings = embeddings
+        self.threshold = threshold
+        self.ttl = ttl
+        self._vectors: Dict[int, np.ndarray] = {}
+        self._ids = count()
+
+    @staticmethod
+    def _normalize(vector: Sequence[float]) -> np.ndarray:
+        """Convert an embedding to a unit-length float32 array."""
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        return array / norm if norm else array
+
+    def embed(self, query: str) -> Optional[np.ndarray]:
+        """
+        Embed a query for a lookup.
+
+        Args:
+            query (str): The query to embed.
+
+        Returns:
+            Optional[np.ndarray]: The normalized embedding, or None if the embedding failed.
+        """  # noqa: E501
+        try:
+            return self._normalize(self.embeddings.embed_query(query))
+        except Exception as e:
+            print(f'[yellow]Failed to embed query for the cache: {e}[/yellow]')
+            return None
+
+    async def aembed(self, query: str) -> Optional[np.ndarray]:
+        """Asynchronously embed a query for a lookup, see `embed`."""
+        try:
+            return self._normalize(await self.embeddings.aembed_query(query))
+        except Exception as e:
+            print(f'[yellow]Failed to embed query for the cache: {e}[/yellow]')
+            return None
+
+    def embed_many(self, queries: List[str]) -> List[Optional[np.ndarray]]:
+        """
+        Embed many queries for lookups in a single batch.
+
+        Through a `CachedQueryEmbeddings`, the vectors are shared with the
+        vector search, so each query is embedded once per batch.
+
+        Args:
+            queries (List[str]): The queries to embed.
+
+        Returns:
+            List[Optional[np.ndarray]]: The normalized embedding of each query, or Nones if the embedding failed.
+        """  # noqa: E501
+        # Imported here, the embeddings module imports this one.
+        from mental_health_ai.rag.embeddings import (  # noqa: PLC0415
+            embed_queries,
+        )
+
+        try:
+            vectors = embed_queries(self.embeddings, queries)
+        except Exception as e:
+            print(f'[yellow]Failed to embed query for the cache: {e}[/yellow]')
+            return [None] * len(queries)
+        return [self._normalize(vector) for vector in vectors]
+
+    async def aembed_many(
+        self, queries: List[str]
+    ) -> List[Optional[np.ndarray]]:
+        """Asynchronously embed many queries for lookups, see `embed_many`."""
+        from mental_health_ai.rag.embeddings import (  # noqa: PLC0415
+            aembed_queries,
+        )
+
+        try:
+            vectors = await aembed_queries(self.embeddings, queries)
+        except Exception as e:
+            print(f'[yellow]Failed to embed query for the cache: {e}[/yellow]')
+            return [None] * len(queries)
+        return [self._normalize(vector) for vector in vectors]
+
+    def clear(self) -> None:
+        """Remove every cached answer."""
+        with self._lock:
+            self._entries.clear()
+            self._vectors.clear()
+
+    def _remove(self, key: int) -> None:
+        del self._entries[key]
+        del self._vectors[key]
+
+    def _evict_expired(self) -> None:
+        if self.ttl is None:
+            return
+        deadline = time.monotonic() - self.ttl
+        for entry_id in [
+            entry_id
+            for entry_id, entry in self._entries.items()
+            if entry.created_at < deadline
+        ]:
+            self._remove(entry_id)
+
+    def lookup(
+        self,
+        vector: Optional[np.ndarray],
+        top_k: int,
+        corpus_version: int,
+    ) -> Optional[CachedAnswer]:
+        """
+        Find the cached answer of the most similar query.
+
+        Args:
+            vector (Optional[np.ndarray]): Normalized embedding of the query, from `embed`.
+            top_k (int): Number of documents retrieved for the query.
+            corpus_version (int): Current version of the corpus.
+
+        Returns:
+            Optional[CachedAnswer]: The cached answer if one is similar enough, else None.
+        """  # noqa: E501
+        with self._lock:
+            self._sync_corpus_version(corpus_version)
+            self._evict_expired()
+
+            candidates: List[int] = [
+                entry_id
+                for entry_id, entry in self._entries.items()
+                if entry.top_k == top_k
+            ]
+            if vector is None or not candidates:
+                self.misses += 1
+                return None
+
+            similarities = (
+                np.stack([self._vectors[entry_id] for entry_id in candidates])
+                @ vector
+            )
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.threshold:
+                self.misses += 1
+                return None
+
+            entry_id = candidates[best]
+            self._entries.move_to_end(entry_id)
+            self.hits += 1
+            return self._entries[entry_id]
+
+    def store(  # noqa: PLR0913, PLR0917
+        self,
+        vector: Optional[np.ndarray],
+        query: str,
+        response: str,
+        source_documents: list,
+        top_k: int,
+        corpus_version: int,
+    ) -> None:
+        """
+        Cache the answer of a query.
+
+        Args:
+            vector (Optional[np.ndarray]): Normalized embedding of the query, from `embed`. Nothing is cached if None.
+            query (str): The query.
+            response (str): The answer generated by the LLM.
+            source_documents (list): The documents retrieved for the query.
+            top_k (int): Number of documents retrieved for the query.
+            corpus_version (int): Version of the corpus the answer was generated from.
+        """  # noqa: E501
+        if vector is None:
+            return
+
+        with self._lock:
+            if not self._sync_corpus_version(corpus_version):
+                return
+            entry_id = next(self._ids)
+            self._entries[entry_id] = CachedAnswer(
+                query=query,
+                response=response,
+                source_documents=source_documents,
+                top_k=top_k,
+                corpus_version=corpus_version,
+                created_at=time.monotonic(),
+            )
+            self._vectors[entry_id] = vector
+            self._evict_overflow()
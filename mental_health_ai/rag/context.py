@@ -0,0 +1,191 @@
+import re
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from mental_health_ai.rag.database.db_interface import PageKey
+
+PAGE_SUFFIX_PATTERN = re.compile(r'\s*-?\s*page\s+\d+\s*$', re.IGNORECASE)
+"""Page suffix of the chunk titles, e.g. 'DSM-5 Page 10' or 'X - Page 2'."""
+
+SOURCES_HEADING = 'Fontes:\n'
+PAGES_HEADING = '\n\nTrechos:\n'
+BLOCK_SEPARATOR = '\n\n'
+"""Separator between two sources or two pages of the context."""
+
+
+@dataclass
+class ContextBlock:
+    """
+    A page of the context: its chunks and the formatting around them.
+
+    Attributes:
+        key (PageKey): (type, source, page_number) key of the page.
+        document (Any): First chunk of the page, carrying its title and metadata.
+        chunks (List[str]): Content of each chunk of the page, in page order.
+        overhead (int): Tokens of the page header, with the separator before it.
+        source_overhead (int): Tokens of the description of the source, with the separator before it, paid by the first page of each source.
+    """  # noqa: E501
+
+    key: PageKey
+    document: Any
+    chunks: List[str]
+    overhead: int = 0
+    source_overhead: int = 0
+
+    @property
+    def source_key(self) -> Tuple[str, Optional[str]]:
+        """(type, source) key of the source of the page."""
+        return self.key[0], self.key[1]
+
+
+@dataclass
+class PackedContext:
+    """
+    The pages selected to fit a token budget.
+
+    Attributes:
+        blocks (List[ContextBlock]): Selected pages in relevance order, truncated at chunk boundaries.
+        tokens (int): Tokens used by the selected pages and the headings of the context.
+        budget (Optional[int]): The token budget, None for no limit.
+        dropped_chunks (int): Number of chunks left out of the context.
+    """  # noqa: E501
+
+    blocks: List[ContextBlock] = field(default_factory=list)
+    tokens: int = 0
+    budget: Optional[int] = None
+    dropped_chunks: int = 0
+
+
+def pack_context(
+    blocks: List[ContextBlock],
+    budget: Optional[int],
+    count_tokens: Callable[[str], int],
+) -> PackedContext:
+    """
+    Fill a token budget with pages, in relevance order.
+
+    The headings of the context are charged first. Each page costs its
+    header plus the tokens of its chunks, and the first page of each source
+    also pays for the description of the source, so the budget bounds the
+    whole rendered context (see `page_overhead` and `source_overhead`).
+    A page that does not fit entirely is truncated after its last chunk
+    that fits, and later (less relevant) pages still fill what is left.
+
+    Args:
+        blocks (List[ContextBlock]): Pages in relevance order.
+        budget (Optional[int]): Maximum number of tokens, None for no limit.
+        count_tokens (Callable[[str], int]): Tokenizer of the target model.
+
+    Returns:
+        PackedContext: The selected pages and the tokens they use.
+    """
+    packed = PackedContext(
+        tokens=count_tokens(SOURCES_HEADING + PAGES_HEADING), budget=budget
+    )
+    sources = set()
+    for block in blocks:
+        cost = block.overhead
+        if block.source_key not in sources:
+            cost += block.source_overhead
+        chunks = []
+        for chunk in block.chunks:
+            chunk_tokens = count_tokens(chunk) + 1  # Separating newline.
+            if budget is not None and packed.tokens + cost + chunk_tokens > (
+                budget
+            ):
+                break
+            chunks.append(chunk)
+            cost += chunk_tokens
+
+        packed.dropped_chunks += len(block.chunks) - len(chunks)
+        if not chunks:
+            continue
+        packed.blocks.append(replace(block, chunks=chunks))
+        packed.tokens += cost
+        sources.add(block.source_key)
+    return packed
+
+
+def source_title(document: Any) -> str:
+    """Get the title of the source of a chunk, without its page suffix."""
+    title = document.properties.get('title') or 'Sem título'
+    return PAGE_SUFFIX_PATTERN.sub('', title) or title
+
+
+def format_source(document: Any, source_id: int) -> str:
+    """
+    Format the description of a source, emitted once per context.
+
+    Args:
+        document (Any): A chunk of the source.
+        source_id (int): Number referencing the source in the page headers.
+
+    Returns:
+        str: The title, date, origin and description of the source.
+    """
+    metadata = document.properties.get('metadata', {}) or {}
+    line = f'[{source_id}] {source_title(document)}'
+    if metadata.get('date'):
+        line += f' ({str(metadata["date"])[:10]})'
+    if metadata.get('source'):
+        line += f' - {metadata["source"]}'
+    if metadata.get('source_description'):
+        line += f'\n{metadata["source_description"]}'
+    return line
+
+
+def format_page_header(source_id: int, page_number: Any) -> str:
+    """Format the compact reference of a page, e.g. '[1, p. 10]'."""
+    return f'[{source_id}, p. {page_number}]'
+
+
+def page_overhead(
+    count_tokens: Callable[[str], int], source_id: int, page_number: Any
+) -> int:
+    """Count the tokens of a page header and of the separator before it."""
+    return count_tokens(
+        BLOCK_SEPARATOR + format_page_header(source_id, page_number) + '\n'
+    )
+
+
+def source_overhead(
+    count_tokens: Callable[[str], int], document: Any, source_id: int
+) -> int:
+    """Count the tokens of a source description and of the separator before it."""  # noqa: E501
+    return count_tokens(BLOCK_SEPARATOR + format_source(document, source_id))
+
+
+def render_context(blocks: List[ContextBlock]) -> str:
+    """
+    Render pages as a list of sources followed by the referenced pages.
+
+    Each source is described once and numbered in order of appearance, and
+    each page only carries its `[source, p. page]` reference.
+
+    Args:
+        blocks (List[ContextBlock]): Pages to render, in context order.
+
+    Returns:
+        str: The context sent to the LLM.
+    """
+    source_ids: Dict[Tuple[str, Optional[str]], int] = {}
+    sources = []
+    for block in blocks:
+        if block.source_key not in source_ids:
+            source_ids[block.source_key] = len(source_ids) + 1
+            sources.append(
+                format_source(block.document, source_ids[block.source_key])
+            )
+
+    pages = [
+        format_page_header(source_ids[block.source_key], block.key[2])
+        + '\n'
+        + '\n'.join(block.chunks)
+        for block in blocks
+    ]
+    return (
+        SOURCES_HEADING
+        + BLOCK_SEPARATOR.join(sources)
+        + PAGES_HEADING
+        + BLOCK_SEPARATOR.join(pages)
+    )
@@ -1,8 +1,76 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple
+
+from pydantic import ValidationError
+from rich import print
+
+from mental_health_ai.rag.database.schemas import WeaviateDocument
+
+PageKey = Tuple[str, Optional[str], int]
+"""Identifies a page of a source: (type, source, page_number)."""
+
+# (uuid, properties, vector) of a document to insert. Documents without a
+# precomputed vector are embedded by the database.
+InsertObject = Tuple[str, Dict[str, Any], Optional[List[float]]]
 
 
 class DatabaseInterface(ABC):
+    corpus_version: int = 0
+    """Counter increased whenever documents are added or removed, in this process or by another one (see `sync_document_count`), used to invalidate caches."""  # noqa: E501
+    _document_count: Optional[int] = None
+    _dump_mode: str = 'python'
+    """`model_dump` mode of the validated documents, 'json' for a backend storing JSON."""  # noqa: E501
+
+    def _bump_corpus_version(self) -> None:
+        """Signal that the documents of the database changed."""
+        self.corpus_version += 1
+
+    def _handle_exception(self, e: Exception, message: str):  # noqa: PLR6301
+        """Handle exceptions and log the error message."""
+        print(f'[red]{message}: {e}[/red]')
+        raise e
+
+    @staticmethod
+    def _validate_document(document: Dict[str, Any]) -> WeaviateDocument:
+        """Validate a single document using the Pydantic schema."""
+        try:
+            return WeaviateDocument(**document)
+        except ValidationError as e:
+            print(f'[red]Validation failed for document: {e}[/red]')
+            print(f'[red]Document: {document}[/red]')
+            raise e
+
+    def _validate_documents(
+        self,
+        documents: Iterable[Dict[str, Any]],
+        continue_on_error: bool = False,
+    ) -> Generator[Dict[str, Any], None, None]:
+        """
+        Validate a stream of documents using the Pydantic schema.
+
+        Documents are validated and dumped one at a time, so the stream is
+        never materialized in memory.
+
+        Args:
+            documents (Iterable[Dict[str, Any]]): Documents to validate.
+            continue_on_error (bool): Whether to skip invalid documents instead of raising.
+
+        Returns:
+            Generator[Dict[str, Any], None, None]: Generator yielding the validated documents.
+
+        Raises:
+            ValidationError: If a document is invalid and `continue_on_error` is False.
+        """  # noqa: E501
+        for doc in documents:
+            try:
+                yield self._validate_document(doc).model_dump(
+                    mode=self._dump_mode
+                )
+            except ValidationError as e:
+                if not continue_on_error:
+                    raise e
+
     @abstractmethod
     def verify_database(self) -> bool:
         """Verify if the database is up and running."""
@@ -24,6 +92,28 @@ class DatabaseInterface(ABC):
         """Load documents to the database from a given root path."""
         raise NotImplementedError
 
+    @abstractmethod
+    def count_documents(self) -> int:
+        """Count the documents in the database."""
+        raise NotImplementedError
+
+    def sync_document_count(self, document_count: int) -> bool:
+        """Record the document count seen by a health check.
+
+        A count different from the previous one means documents were added or
+        removed, possibly by another process such as a `load_documents` run
+        from the command line. The corpus version is then bumped, which drops
+        the caches tied to it, and implementations refresh their in-memory
+        state.
+
+        Returns:
+            bool: Whether the count changed since the previous check."""
+        previous, self._document_count = self._document_count, document_count
+        changed = previous is not None and previous != document_count
+        if changed:
+            self._bump_corpus_version()
+        return changed
+
     @abstractmethod
     def search(self, query: str, limit: int) -> List[Any]:
         """Search for documents in the database."""
@@ -39,9 +129,88 @@ class DatabaseInterface(ABC):
         """Delete a document by its ID."""
         raise NotImplementedError
 
-    @abstractmethod
     def get_documents_by_type_and_page_number(
-        self, doc_type: str, page_number: int
+        self, doc_type: str, page_number: int, source: Optional[str] = None
     ) -> List[Any]:
-        """Get documents by type and page number."""
+        """Get documents by type, page number and optionally source.
+
+        Looks the single page up with `get_documents_by_pages`.
+
+        Args:
+            doc_type (str): The type of the document (e.g., 'article', 'dsm-5').
+            page_number (int): The page number.
+            source (str, optional): The source of the document.
+
+        Returns:
+            List[Any]: List of documents matching the criteria."""  # noqa: E501
+        key = (doc_type.lower(), source, int(page_number))
+        documents = self.get_documents_by_pages([key]).get(key, [])
+        if not documents:
+            print('[yellow]No documents found matching the criteria.[/yellow]')
+        return documents
+
+    def build_page_index(self) -> int:
+        """Build the in-memory page index used by `get_documents_by_pages`.
+
+        A no-op returning the document count unless overridden, for backends
+        whose page lookup needs no separate index, such as FAISS.
+
+        Returns:
+            int: Number of documents indexed."""
+        return self.count_documents()
+
+    @abstractmethod
+    def get_documents_by_pages(
+        self, pages: Iterable[PageKey]
+    ) -> Dict[PageKey, List[Any]]:
+        """Get all documents of many pages at once, grouped by page key.
+
+        The type of each key is matched case-insensitively and a `None`
+        source matches every source."""
         raise NotImplementedError
+
+    async def averify_database(self) -> bool:
+        """Asynchronously verify if the database is up and running.
+
+        Runs `verify_database` in a worker thread unless overridden."""
+        return await asyncio.to_thread(self.verify_database)
+
+    async def acount_documents(self) -> int:
+        """Asynchronously count the documents in the database.
+
+        Runs `count_documents` in a worker thread unless overridden."""
+        return await asyncio.to_thread(self.count_documents)
+
+    async def asearch(self, query: str, limit: int) -> List[Any]:
+        """Asynchronously search for documents in the database.
+
+        Runs `search` in a worker thread unless overridden."""
+        return await asyncio.to_thread(self.search, query, limit)
+
+    def search_many(self, queries: List[str], limit: int) -> List[List[Any]]:
+        """Search for the documents of many queries, in query order.
+
+        Runs `search` once per query unless overridden."""
+        return [self.search(query, limit) for query in queries]
+
+    async def asearch_many(
+        self, queries: List[str], limit: int
+    ) -> List[List[Any]]:
+        """Asynchronously search for the documents of many queries, in query order.
+
+        Runs `asearch` concurrently for every query unless overridden."""  # noqa: E501
+        return list(
+            await asyncio.gather(
+                *(self.asearch(query, limit) for query in queries)
+            )
+        )
+
+    async def aget_documents_by_pages(
+        self, pages: Iterable[PageKey]
+    ) -> Dict[PageKey, List[Any]]:
+        """Asynchronously get all documents of many pages, grouped by page key.
+
+        Runs `get_documents_by_pages` in a worker thread unless overridden."""
+        return await asyncio.to_thread(
+            self.get_documents_by_pages, list(pages)
+        )
@@ -0,0 +1,791 @@
+import json
+import mmap
+import os
+import tempfile
+from dataclasses import dataclass, field
+from itertools import islice
+from threading import RLock
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import faiss
+import numpy as np
+from langchain_core.embeddings import Embeddings
+from pydantic import ValidationError
+from rich import print
+
+from mental_health_ai.rag.database.db_interface import (
+    DatabaseInterface,
+    InsertObject,
+    PageKey,
+)
+from mental_health_ai.rag.database.ingestion import (
+    MANIFEST_FILE_NAME,
+    IngestionManifest,
+    document_uuid,
+    iter_changed_chunks,
+)
+from mental_health_ai.rag.database.page_index import PageIndex
+from mental_health_ai.rag.database.utils import iter_json_files
+from mental_health_ai.rag.database.vectors import (
+    SidecarVectors,
+    vectorized_text,
+)
+from mental_health_ai.rag.embeddings import (
+    create_query_embeddings,
+    embed_queries,
+    embedding_model_name,
+)
+from mental_health_ai.settings import settings
+
+INDEX_FILE_NAME = 'index.faiss'
+DOCUMENTS_FILE_NAME = 'documents.jsonl'
+OFFSETS_FILE_NAME = 'offsets.npy'
+CATALOG_FILE_NAME = 'catalog.json'
+COMPACTION_THRESHOLD = 0.25
+"""Share of deleted rows above which saving the store rewrites it without them."""  # noqa: E501
+
+
+@dataclass
+class SearchMetadata:
+    """Search metadata of a result, shaped like Weaviate's `MetadataReturn`."""
+
+    distance: Optional[float] = None
+    score: Optional[float] = None
+
+
+@dataclass
+class StoredDocument:
+    """A document read from the store, shaped like a Weaviate object."""
+
+    uuid: str
+    properties: Dict[str, Any]
+    metadata: SearchMetadata = field(default_factory=SearchMetadata)
+
+
+class FaissDatabase(DatabaseInterface):
+    """
+    A vector database running in-process with FAISS, without any external service.
+
+    Documents are embedded locally and stored in a directory holding:
+
+    - `index.faiss`: an inner-product FAISS index over normalized vectors, whose IDs are row numbers, memory-mapped read-only on load.
+    - `documents.jsonl`: the properties of each row, one JSON object per line, memory-mapped on load.
+    - `offsets.npy`: the byte offset of each row in `documents.jsonl`, memory-mapped on load.
+    - `catalog.json`: the UUID of each row and the (type, source, page_number) lookup table.
+
+    Deleted rows are removed from the index and the catalog at once, and
+    their lines are dropped from `documents.jsonl` when they exceed
+    `COMPACTION_THRESHOLD` of the rows (see `_compact`).
+
+    A store saved by another process, such as a `load_documents` run from
+    the command line, is reloaded by the next `count_documents` (called by
+    the health checks) or change.
+
+    Attributes:
+        index_path (str): Directory of the store.
+        embeddings (Embeddings): Model embedding the documents and the queries.
+        model_name (Optional[str]): Name of the embedding model, used to pick the precomputed vectors of `load_documents`. None to always embed.
+        insert_batch_size (int): Number of documents embedded at a time (default is 256).
+
+    Examples:
+        >>> from mental_health_ai.rag.embeddings import create_query_embeddings
+        >>> db = FaissDatabase('data/faiss', create_query_embeddings(local_embeddings=True))
+        >>> db.load_documents('data/processed/')
+        >>> db.search('O que é o TDAH?', limit=5)
+    """  # noqa: E501
+
+    _dump_mode = 'json'
+
+    def __init__(
+        self,
+        index_path: str = settings.FAISS_INDEX_PATH,
+        embeddings: Optional[Embeddings] = None,
+        insert_batch_size: int = 256,
+        model_name: Optional[str] = None,
+    ):
+        if embeddings is None:
+            embeddings = create_query_embeddings(local_embeddings=True)
+            model_name = embedding_model_name(local_embeddings=True)
+
+        self.index_path = index_path
+        self.embeddings = embeddings
+        self.model_name = model_name
+        self.insert_batch_size = insert_batch_size
+        self._lock = RLock()
+        self._documents_map: Optional[mmap.mmap] = None
+        self._reset()
+        self._open()
+
+    def __enter__(self):
+        """Enter the runtime context related to this object."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Exit the runtime context and release the memory maps."""
+        self.close()
+
+    def _path(self, file_name: str) -> str:
+        return os.path.join(self.index_path, file_name)
+
+    def _reset(self) -> None:
+        """Forget the loaded store and release its memory maps."""
+        self.close()
+        self._index: Optional[faiss.Index] = None
+        self._index_mapped = False
+        self._offsets = np.zeros(1, dtype=np.int64)
+        self._uuids: List[Optional[str]] = []
+        self._rows: Dict[str, int] = {}
+        self._pages: Dict[PageKey, List[int]] = {}
+        self._sources: Dict[Tuple[str, int], Dict[Optional[str], None]] = {}
+        self._catalog_mtime: Optional[int] = None
+
+    def _stat_catalog(self) -> Optional[int]:
+        """Get the modification time of the catalog, None if there is none."""
+        try:
+            return os.stat(self._path(CATALOG_FILE_NAME)).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _reload_if_changed(self) -> bool:
+        """
+        Load the store again when another process saved it since it was loaded.
+
+        Every save replaces the catalog, so a catalog modified since this
+        instance last loaded or saved it means the store changed on disk, for
+        example through a `load_documents` run from the command line.
+
+        Returns:
+            bool: Whether the store was reloaded.
+        """  # noqa: E501
+        with self._lock:
+            if self._stat_catalog() == self._catalog_mtime:
+                return False
+            print(
+                '[yellow]FAISS store changed on disk, reloading it.[/yellow]'
+            )
+            self._reset()
+            self._open()
+            self._bump_corpus_version()
+            return True
+
+    def _open(self) -> None:
+        """Load the store from disk, memory-mapping the documents and offsets."""  # noqa: E501
+        if not os.path.exists(self._path(CATALOG_FILE_NAME)):
+            return
+
+        self._index = faiss.read_index(
+            self._path(INDEX_FILE_NAME),
+            faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY,
+        )
+        self._index_mapped = True
+        self._offsets = np.load(self._path(OFFSETS_FILE_NAME), mmap_mode='r')
+        self._remap_documents()
+
+        with open(self._path(CATALOG_FILE_NAME), 'r', encoding='utf-8') as f:
+            catalog = json.load(f)
+        self._uuids = catalog['uuids']
+        self._rows = {
+            uuid: row for row, uuid in enumerate(self._uuids) if uuid
+        }
+        for doc_type, source, page_number, rows in catalog['pages']:
+            self._add_to_pages((doc_type, source, page_number), rows)
+        self._catalog_mtime = self._stat_catalog()
+
+    def _writable_index(self) -> faiss.Index:
+        """Copy the memory-mapped index to memory before its first change."""
+        if self._index_mapped:
+            self._index = faiss.clone_index(self._index)
+            self._index_mapped = False
+        return self._index
+
+    def _remap_documents(self) -> None:
+        """Memory-map `documents.jsonl` again, after rows were appended."""
+        if self._documents_map is not None:
+            self._documents_map.close()
+            self._documents_map = None
+        if os.path.getsize(self._path(DOCUMENTS_FILE_NAME)) == 0:
+            return
+        with open(self._path(DOCUMENTS_FILE_NAME), 'rb') as f:
+            self._documents_map = mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            )
+
+    def close(self) -> None:
+        """Release the memory maps of the store."""
+        with self._lock:
+            if self._documents_map is not None:
+                self._documents_map.close()
+                self._documents_map = None
+
+    async def aclose(self) -> None:
+        """Release the memory maps of the store, see `close`."""
+        self.close()
+
+    def _write_atomically(self, file_name: str, write) -> None:
+        """Write a file through a temporary file, so readers never see a partial one."""  # noqa: E501
+        with tempfile.NamedTemporaryFile(
+            'wb', dir=self.index_path, delete=False
+        ) as f:
+            write(f)
+        os.replace(f.name, self._path(file_name))
+
+    def _compact(self) -> int:
+        """
+        Rewrite the store without the rows of deleted documents.
+
+        The remaining rows are renumbered in order, and their vectors are
+        copied to a new index under the new row numbers.
+
+        Returns:
+            int: Number of rows dropped.
+        """
+        live = [row for row, uuid in enumerate(self._uuids) if uuid]
+        dropped = len(self._uuids) - len(live)
+        if not dropped:
+            return 0
+
+        live_rows = np.array(live, dtype=np.int64)
+        index = faiss.IndexIDMap2(faiss.IndexFlatIP(self._index.d))
+        if live:
+            index.add_with_ids(
+                self._index.reconstruct_batch(live_rows),
+                np.arange(len(live)),
+            )
+        self._write_atomically(
+            DOCUMENTS_FILE_NAME,
+            lambda f: f.writelines(
+                self._documents_map[
+                    int(self._offsets[row]) : int(self._offsets[row + 1])
+                ]
+                for row in live
+            ),
+        )
+        sizes = self._offsets[live_rows + 1] - self._offsets[live_rows]
+        self._offsets = np.concatenate([[0], np.cumsum(sizes)]).astype(
+            np.int64
+        )
+
+        new_rows = {row: new_row for new_row, row in enumerate(live)}
+        self._index, self._index_mapped = index, False
+        self._uuids = [self._uuids[row] for row in live]
+        self._rows = {uuid: row for row, uuid in enumerate(self._uuids)}
+        self._pages = {
+            key: [new_rows[row] for row in rows]
+            for key, rows in self._pages.items()
+        }
+        self._remap_documents()
+        print(f'Compacted the store, {dropped} deleted rows dropped.')
+        return dropped
+
+    def _save(self) -> None:
+        """Persist the index, the offsets and the catalog, compacting the store past `COMPACTION_THRESHOLD`."""  # noqa: E501
+        if len(self._uuids) - len(self._rows) > COMPACTION_THRESHOLD * len(
+            self._uuids
+        ):
+            self._compact()
+        faiss.write_index(self._index, self._path(INDEX_FILE_NAME) + '.tmp')
+        os.replace(
+            self._path(INDEX_FILE_NAME) + '.tmp', self._path(INDEX_FILE_NAME)
+        )
+        offsets = np.array(self._offsets, dtype=np.int64)
+        self._write_atomically(
+            OFFSETS_FILE_NAME, lambda f: np.save(f, offsets)
+        )
+        catalog = {
+            'uuids': self._uuids,
+            'pages': [
+                [doc_type, source, page_number, rows]
+                for (
+                    doc_type,
+                    source,
+                    page_number,
+                ), rows in self._pages.items()
+            ],
+        }
+        self._write_atomically(
+            CATALOG_FILE_NAME,
+            lambda f: f.write(json.dumps(catalog).encode('utf-8')),
+        )
+        self._offsets = np.load(self._path(OFFSETS_FILE_NAME), mmap_mode='r')
+        self._catalog_mtime = self._stat_catalog()
+
+    def _add_to_pages(self, key: PageKey, rows: List[int]) -> None:
+        self._pages.setdefault(key, []).extend(rows)
+        self._sources.setdefault((key[0], key[2]), {})[key[1]] = None
+
+    def _remove_from_pages(self, key: PageKey, row: int) -> None:
+        rows = self._pages.get(key)
+        if rows is None:
+            return
+        rows.remove(row)
+        if not rows:
+            del self._pages[key]
+            sources = self._sources[key[0], key[2]]
+            del sources[key[1]]
+            if not sources:
+                del self._sources[key[0], key[2]]
+
+    def _read_row(self, row: int) -> StoredDocument:
+        """Read the document of a row from the memory-mapped store."""
+        start, end = int(self._offsets[row]), int(self._offsets[row + 1])
+        return StoredDocument(
+            uuid=self._uuids[row],
+            properties=json.loads(self._documents_map[start:end]),
+        )
+
+    @staticmethod
+    def _to_properties(
+        document: Dict[str, Any], chunk_index: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Build the stored properties of a document."""
+        properties = {
+            'title': document.get('title', ''),
+            'page_content': document.get('page_content', ''),
+            'metadata': document.get('metadata', {}) or {},
+        }
+        if chunk_index is not None:
+            properties['chunk_index'] = chunk_index
+        return properties
+
+    def _embed(self, texts: List[str]) -> np.ndarray:
+        """Embed texts into normalized float32 vectors."""
+        vectors = np.asarray(
+            self.embeddings.embed_documents(texts), dtype=np.float32
+        )
+        faiss.normalize_L2(vectors)
+        return vectors
+
+    def _insert_batch(self, batch: List[InsertObject]) -> int:
+        """
+        Append a batch of (uuid, properties, vector) triples to the store.
+
+        Documents without a precomputed vector are embedded, and documents
+        whose UUID is already stored are skipped.
+
+        Returns:
+            int: Number of documents inserted.
+        """
+        unique = {
+            uuid: (properties, vector)
+            for uuid, properties, vector in batch
+            if uuid not in self._rows
+        }
+        batch = [
+            (uuid, properties, vector)
+            for uuid, (properties, vector) in unique.items()
+        ]
+        if not batch:
+            return 0
+
+        missing = [
+            position
+            for position, (_, _, vector) in enumerate(batch)
+            if vector is None
+        ]
+        embedded = (
+            self._embed([
+                vectorized_text(batch[position][1]) for position in missing
+            ])
+            if missing
+            else None
+        )
+        dimension = (
+            embedded.shape[1] if embedded is not None else len(batch[0][2])
+        )
+        vectors = np.empty((len(batch), dimension), dtype=np.float32)
+        for position, (_, _, vector) in enumerate(batch):
+            if vector is not None:
+                vectors[position] = vector
+        if embedded is not None:
+            vectors[missing] = embedded
+        faiss.normalize_L2(vectors)
+        if self._index is None:
+            self._index = faiss.IndexIDMap2(
+                faiss.IndexFlatIP(vectors.shape[1])
+            )
+
+        first_row = len(self._uuids)
+        lines = [
+            json.dumps(properties, ensure_ascii=False).encode('utf-8') + b'\n'
+            for _, properties, _ in batch
+        ]
+        with open(self._path(DOCUMENTS_FILE_NAME), 'ab') as f:
+            f.writelines(lines)
+        self._offsets = np.concatenate([
+            self._offsets,
+            int(self._offsets[-1]) + np.cumsum([len(line) for line in lines]),
+        ])
+        self._writable_index().add_with_ids(
+            vectors, np.arange(first_row, first_row + len(batch))
+        )
+
+        for row, (uuid, properties, _) in enumerate(batch, start=first_row):
+            self._uuids.append(uuid)
+            self._rows[uuid] = row
+            key = PageIndex.page_key(properties['metadata'])
+            if key is not None:
+                self._add_to_pages(key, [row])
+
+        self._remap_documents()
+        return len(batch)
+
+    def _insert_documents(self, objects: Iterable[InsertObject]) -> int:
+        """Insert (uuid, properties, vector) triples in batches of `insert_batch_size`."""  # noqa: E501
+        os.makedirs(self.index_path, exist_ok=True)
+        open(self._path(DOCUMENTS_FILE_NAME), 'ab').close()
+
+        objects = iter(objects)
+        inserted = 0
+        while batch := list(islice(objects, self.insert_batch_size)):
+            inserted += self._insert_batch(batch)
+        if inserted:
+            self._bump_corpus_version()
+        return inserted
+
+    def _delete_rows(self, uuids: Iterable[str]) -> int:
+        """Remove documents from the index and the catalog."""
+        rows = [self._rows.pop(uuid) for uuid in uuids if uuid in self._rows]
+        if not rows:
+            return 0
+
+        self._writable_index().remove_ids(np.array(rows, dtype=np.int64))
+        for row in rows:
+            key = PageIndex.page_key(
+                self._read_row(row).properties['metadata']
+            )
+            if key is not None:
+                self._remove_from_pages(key, row)
+            self._uuids[row] = None
+        self._bump_corpus_version()
+        return len(rows)
+
+    def verify_database(self) -> bool:
+        """
+        Verify if the store exists and has documents.
+
+        Returns:
+            bool: True if the database is operational, False otherwise.
+        """
+        try:
+            print('Verifying database...')
+            if self._index is None or self._index.ntotal == 0:
+                raise RuntimeError('Collection is empty.')
+
+            print('[green]Database is up and running.[/green]')
+            return True
+        except Exception as e:
+            self._handle_exception(e, 'Failed to verify database')
+            return False
+
+    def initialize_database(self) -> None:
+        """
+        Create the directory of the store.
+
+        If the store already exists, it is kept.
+        """
+        os.makedirs(self.index_path, exist_ok=True)
+        open(self._path(DOCUMENTS_FILE_NAME), 'ab').close()
+        print(f'[green]FAISS store ready at {self.index_path}.[/green]')
+
+    def delete_all_collections(self) -> None:
+        """
+        Delete every document of the store.
+        """
+        with self._lock:
+            for file_name in (
+                INDEX_FILE_NAME,
+                DOCUMENTS_FILE_NAME,
+                OFFSETS_FILE_NAME,
+                CATALOG_FILE_NAME,
+            ):
+                if os.path.exists(self._path(file_name)):
+                    os.remove(self._path(file_name))
+            self._reset()
+            self._bump_corpus_version()
+            print('[green]All documents deleted successfully.[/green]')
+
+    def count_documents(self) -> int:
+        """Count the documents in the store, reloading it first if another process changed it."""  # noqa: E501
+        with self._lock:
+            self._reload_if_changed()
+            return len(self._rows)
+
+    def get_database_info(self) -> None:
+        """
+        Get information about the database, such as total documents and an example document.
+        """  # noqa: E501
+        if not self._rows:
+            print('[yellow]Collection is empty.[/yellow]')
+            return
+
+        example = self._read_row(next(iter(self._rows.values())))
+        print(f'Example document:\n{example}')
+        print(f'Total documents: {len(self._rows)}')
+
+    def load_documents(
+        self,
+        root_path: str,
+        continue_on_error: bool = False,
+        manifest_path: Optional[str] = None,
+    ) -> bool:
+        """
+        Load documents into the store from JSON files in a directory.
+
+        Loading is incremental, like `WeaviateClient.load_documents`: an
+        ingestion manifest skips unchanged files, only new chunks are embedded
+        and chunks that are no longer on disk are deleted. Chunks with a
+        precomputed vector of `model_name` in the sidecars of their file (see
+        `mental_health_ai.rag.database.vectors`) are not embedded again.
+
+        Args:
+            root_path (str): The root directory to search for JSON and JSON Lines files.
+            continue_on_error (bool): Whether to continue loading after an error.
+            manifest_path (Optional[str]): Path of the ingestion manifest. Defaults to `MANIFEST_FILE_NAME` inside `index_path`.
+
+        Returns:
+            bool: True if documents were loaded successfully, False otherwise.
+        """  # noqa: E501
+        if not any(iter_json_files(root_path)):
+            print('[yellow]No documents found.[/yellow]')
+            return False
+
+        manifest = IngestionManifest.load(
+            manifest_path or self._path(MANIFEST_FILE_NAME)
+        )
+
+        try:
+            with self._lock:
+                self._reload_if_changed()
+                if manifest.entries and not self._rows:
+                    print(
+                        '[yellow]Store is empty, ignoring the ingestion manifest.[/yellow]'  # noqa: E501
+                    )
+                    manifest.clear()
+
+                vectors = (
+                    SidecarVectors(root_path, self.model_name)
+                    if self.model_name is not None
+                    else None
+                )
+                if vectors is not None and vectors.count:
+                    print(f'Using {vectors.count} precomputed vectors.')
+
+                print(f'Loading documents from {root_path}...')
+                stale_uuids: List[str] = []
+                chunks = iter_changed_chunks(
+                    root_path,
+                    manifest,
+                    lambda documents: self._validate_documents(
+                        documents, continue_on_error
+                    ),
+                    stale_uuids,
+                )
+                inserted = self._insert_documents(
+                    (
+                        uuid,
+                        self._to_properties(document, chunk_index),
+                        vectors.get(uuid) if vectors is not None else None,
+                    )
+                    for uuid, chunk_index, document in chunks
+                )
+                deleted = self._delete_rows(stale_uuids)
+                if self._index is not None:
+                    self._save()
+                manifest.save()
+
+            print(
+                f'[green]Documents loaded successfully: {inserted} inserted, {deleted} deleted.[/green]'  # noqa: E501
+            )
+            return True
+        except ValidationError as e:
+            self._handle_exception(e, 'Failed to validate documents')
+            return False
+        except Exception as e:
+            self._handle_exception(e, 'Failed to load documents')
+            return False
+
+    def add_document(self, document: Dict[str, Any]) -> bool:
+        """
+        Add a single document to the store.
+
+        Args:
+            document (Dict[str, Any]): The document data.
+
+        Returns:
+            bool: True if the document was added successfully, False otherwise.
+        """
+        validated_document = self._validate_document(document).model_dump(
+            mode=self._dump_mode
+        )
+        try:
+            with self._lock:
+                self._reload_if_changed()
+                uuid = document_uuid(validated_document)
+                if uuid in self._rows:
+                    print('[yellow]Document already exists.[/yellow]')
+                    return True
+
+                self._insert_documents([
+                    (uuid, self._to_properties(validated_document), None)
+                ])
+                self._save()
+            print(f'Document added with UUID: {uuid}')
+            return True
+        except Exception as e:
+            self._handle_exception(e, 'Failed to add document to the database')
+            return False
+
+    def _search_vectors(
+        self, vectors: List[List[float]], limit: int
+    ) -> List[List[StoredDocument]]:
+        """Search the nearest documents of many query vectors in one call."""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        faiss.normalize_L2(vectors)
+
+        with self._lock:
+            if self._index is None or self._index.ntotal == 0:
+                print('[yellow]No documents found.[/yellow]')
+                return [[] for _ in vectors]
+
+            scores, rows = self._index.search(vectors, limit)
+            results = []
+            for query_scores, query_rows in zip(scores, rows):
+                documents = []
+                for score, row in zip(query_scores, query_rows):
+                    if row < 0:
+                        continue
+                    document = self._read_row(int(row))
+                    document.metadata = SearchMetadata(
+                        distance=1 - float(score), score=float(score)
+                    )
+                    documents.append(document)
+                results.append(documents)
+        return results
+
+    def search(self, query: str, limit: int = 5) -> List[StoredDocument]:
+        """
+        Search for documents in the store using a query.
+
+        Args:
+            query (str): The query string.
+            limit (int): Maximum number of documents to return.
+
+        Returns:
+            List[StoredDocument]: Documents that match the query, with their cosine distance and score.
+        """  # noqa: E501
+        try:
+            [results] = self._search_vectors(
+                [self.embeddings.embed_query(query)], limit
+            )
+            return results
+        except Exception as e:
+            self._handle_exception(e, 'Failed to search documents')
+            return []
+
+    def search_many(
+        self, queries: List[str], limit: int = 5
+    ) -> List[List[StoredDocument]]:
+        """
+        Search for the documents of many queries, in query order.
+
+        The queries missing from the query cache are embedded in one batch
+        and every query is searched in one FAISS call.
+
+        Args:
+            queries (List[str]): The query strings.
+            limit (int): Maximum number of documents to return per query.
+
+        Returns:
+            List[List[StoredDocument]]: Documents that match each query.
+        """
+        if not queries:
+            return []
+        try:
+            return self._search_vectors(
+                embed_queries(self.embeddings, queries), limit
+            )
+        except Exception as e:
+            self._handle_exception(e, 'Failed to search documents')
+            return []
+
+    def get_document_by_id(self, document_id: str) -> Optional[StoredDocument]:
+        """
+        Get a document by its UUID.
+
+        Args:
+            document_id (str): UUID of the document.
+
+        Returns:
+            Optional[StoredDocument]: The document if found, else None.
+        """
+        with self._lock:
+            row = self._rows.get(str(document_id))
+            if row is None:
+                print(
+                    f'[yellow]Document with ID {document_id} not found.[/yellow]'  # noqa: E501
+                )
+                return None
+            return self._read_row(row)
+
+    def delete_document_by_id(self, document_id: str) -> None:
+        """
+        Delete a document by its UUID.
+
+        Args:
+            document_id (str): UUID of the document to be deleted.
+        """
+        try:
+            with self._lock:
+                self._reload_if_changed()
+                if not self._delete_rows([str(document_id)]):
+                    print(
+                        f'[yellow]Document with ID {document_id} not found.[/yellow]'  # noqa: E501
+                    )
+                    return
+                self._save()
+            print(f'Document with ID {document_id} deleted.')
+        except Exception as e:
+            self._handle_exception(e, 'Failed to delete document')
+
+    def _get_page_documents(self, key: PageKey) -> List[StoredDocument]:
+        """Read the documents of a page, ordered by chunk index."""
+        documents = [self._read_row(row) for row in self._pages.get(key, [])]
+        return sorted(
+            documents,
+            key=lambda document: document.properties.get('chunk_index', 0),
+        )
+
+    def get_documents_by_pages(
+        self, pages: Iterable[PageKey]
+    ) -> Dict[PageKey, List[StoredDocument]]:
+        """
+        Get the documents of many pages from the lookup table, grouped by page.
+
+        Args:
+            pages (Iterable[PageKey]): (type, source, page_number) keys. A `None` source matches any source.
+
+        Returns:
+            Dict[PageKey, List[StoredDocument]]: Documents of each requested page, keyed by the normalized key in request order.
+        """  # noqa: E501
+        grouped: Dict[PageKey, List[StoredDocument]] = {}
+        with self._lock:
+            for doc_type, source, page_number in pages:
+                key = (doc_type.lower(), source, int(page_number))
+                if key in grouped:
+                    continue
+
+                sources = (
+                    [source]
+                    if source is not None
+                    else self._sources.get((key[0], key[2]), {})
+                )
+                grouped[key] = [
+                    document
+                    for indexed_source in sources
+                    for document in self._get_page_documents((
+                        key[0],
+                        indexed_source,
+                        key[2],
+                    ))
+                ]
+        return grouped
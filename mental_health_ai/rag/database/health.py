@@ -0,0 +1,134 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from rich import print
+
+from mental_health_ai.rag.database.db_interface import DatabaseInterface
+
+
+@dataclass(frozen=True)
+class HealthStatus:
+    """Result of a database health check.
+
+    Attributes:
+        ready (bool): Whether the database is up, live and has documents.
+        detail (str): Reason why the database is not ready, or 'ok'.
+        checked_at (Optional[float]): `time.monotonic()` of the check, None if it never ran.
+        document_count (Optional[int]): Number of documents of the database, None if it is not ready.
+    """  # noqa: E501
+
+    ready: bool
+    detail: str
+    checked_at: Optional[float] = None
+    document_count: Optional[int] = None
+
+
+class HealthMonitor:
+    """
+    Background monitor caching the health of a vector database.
+
+    `verify_database` costs several admin round trips, so instead of running
+    it before every query, the monitor refreshes it every `interval` seconds
+    in a background task and queries read the cached `status`. A status older
+    than `max_age` seconds is reported as not ready, so a stuck monitor is not
+    mistaken for a healthy database.
+
+    Each check also counts the documents and passes the count to
+    `sync_document_count`, so documents loaded or deleted by another process
+    refresh the in-memory state of the database, such as the page index.
+
+    Attributes:
+        vector_db (DatabaseInterface): The database to monitor.
+        interval (float): Seconds between two checks (default is 30).
+        max_age (float): Seconds after which the cached status is stale (default is 3 * interval).
+        status (HealthStatus): The last health status.
+
+    Examples:
+        >>> monitor = HealthMonitor(vector_db, interval=30)
+        >>> await monitor.start()
+        >>> monitor.is_ready
+        True
+        >>> await monitor.stop()
+    """  # noqa: E501
+
+    def __init__(
+        self,
+        vector_db: DatabaseInterface,
+        interval: float = 30.0,
+        max_age: Optional[float] = None,
+    ):
+        self.vector_db = vector_db
+        self.interval = interval
+        self.max_age = max_age if max_age is not None else 3 * interval
+        self.status = HealthStatus(ready=False, detail='Not checked yet.')
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background refresh task is running."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether the last check succeeded and is not stale."""
+        status = self.status
+        return (
+            status.ready
+            and status.checked_at is not None
+            and time.monotonic() - status.checked_at <= self.max_age
+        )
+
+    async def check(self) -> HealthStatus:
+        """
+        Verify the database now and cache the result.
+
+        Returns:
+            HealthStatus: The new health status.
+        """
+        document_count = None
+        try:
+            ready = await self.vector_db.averify_database()
+            detail = 'ok' if ready else 'Database not available or empty.'
+            if ready:
+                document_count = await self.vector_db.acount_documents()
+                await asyncio.to_thread(
+                    self.vector_db.sync_document_count, document_count
+                )
+        except Exception as e:
+            ready, detail = False, str(e)
+
+        self.status = HealthStatus(
+            ready=ready,
+            detail=detail,
+            checked_at=time.monotonic(),
+            document_count=document_count,
+        )
+        return self.status
+
+    async def _run(self) -> None:
+        """Refresh the status every `interval` seconds until cancelled."""
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.check()
+            except Exception as e:
+                print(f'[red]Health check failed: {e}[/red]')
+
+    async def start(self) -> None:
+        """Run a first check, then keep refreshing it in the background."""
+        await self.check()
+        if not self.is_running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background refresh task."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
@@ -0,0 +1,220 @@
+import hashlib
+import json
+import os
+import tempfile
+import uuid
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from rich import print
+
+from mental_health_ai.rag.database.utils import (
+    iter_documents_in_file,
+    iter_json_files,
+)
+
+MANIFEST_FILE_NAME = '.ingestion_manifest.json'
+DOCUMENT_NAMESPACE = uuid.uuid5(
+    uuid.NAMESPACE_URL, 'https://github.com/Tchez/mental-health-ai/documents'
+)
+
+
+def content_hash(text: str) -> str:
+    """Get the SHA-256 hex digest of a text."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def file_sha256(file_path: str, chunk_size: int = 1 << 20) -> str:
+    """Get the SHA-256 hex digest of a file, reading it in chunks.
+
+    Args:
+        file_path (str): Path to the file.
+        chunk_size (int): Number of bytes read at a time.
+
+    Returns:
+        str: The hex digest of the file content.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def document_uuid(
+    document: Dict[str, Any], chunk_index: Optional[int] = None
+) -> str:
+    """Derive a deterministic UUID for a document chunk.
+
+    The UUID depends on the source, page, chunk index and content of the
+    chunk, so re-ingesting an unchanged chunk targets the same object and a
+    changed chunk gets a new one.
+
+    Args:
+        document (Dict[str, Any]): The document data.
+        chunk_index (Optional[int]): Position of the chunk within its page.
+
+    Returns:
+        str: The UUID of the chunk.
+    """
+    metadata = document.get('metadata', {}) or {}
+    identifier = '|'.join(
+        str(part)
+        for part in (
+            (metadata.get('type') or '').lower(),
+            metadata.get('source'),
+            metadata.get('page_number'),
+            chunk_index,
+            content_hash(document.get('page_content', '')),
+        )
+    )
+    return str(uuid.uuid5(DOCUMENT_NAMESPACE, identifier))
+
+
+def assign_chunk_ids(
+    documents: Iterable[Dict[str, Any]],
+) -> Generator[Tuple[str, int, Dict[str, Any]], None, None]:
+    """Number the chunks of each page in order and derive their UUIDs.
+
+    Args:
+        documents (Iterable[Dict[str, Any]]): Documents of a single file, in file order.
+
+    Returns:
+        Generator[Tuple[str, int, Dict[str, Any]], None, None]: Generator yielding (uuid, chunk_index, document).
+    """  # noqa: E501
+    positions: Counter = Counter()
+    for document in documents:
+        metadata = document.get('metadata', {}) or {}
+        page = (
+            (metadata.get('type') or '').lower(),
+            metadata.get('source'),
+            metadata.get('page_number'),
+        )
+        chunk_index = positions[page]
+        positions[page] += 1
+        yield document_uuid(document, chunk_index), chunk_index, document
+
+
+@dataclass
+class ManifestEntry:
+    sha256: str
+    uuids: List[str] = field(default_factory=list)
+
+
+class IngestionManifest:
+    """
+    Record of the ingested files, their hashes and the UUIDs of their chunks.
+
+    The manifest lets `load_documents` skip unchanged files, insert only the
+    new chunks of changed files and delete the chunks that disappeared.
+
+    Attributes:
+        path (str): Path of the manifest file.
+        entries (Dict[str, ManifestEntry]): Entries keyed by file path relative to the ingestion root.
+    """  # noqa: E501
+
+    def __init__(
+        self, path: str, entries: Optional[Dict[str, ManifestEntry]] = None
+    ):
+        self.path = path
+        self.entries: Dict[str, ManifestEntry] = entries or {}
+
+    @classmethod
+    def load(cls, path: str) -> 'IngestionManifest':
+        """Load a manifest from disk, or an empty one if it does not exist."""
+        if not os.path.exists(path):
+            return cls(path)
+
+        with open(path, 'r', encoding='utf-8') as f:
+            content = json.load(f)
+        return cls(
+            path,
+            {
+                name: ManifestEntry(**entry)
+                for name, entry in content.get('files', {}).items()
+            },
+        )
+
+    def save(self) -> None:
+        """Write the manifest atomically, so an interrupted save keeps the previous one."""  # noqa: E501
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            'w', encoding='utf-8', dir=directory, delete=False
+        ) as f:
+            json.dump(
+                {
+                    'files': {
+                        name: asdict(entry)
+                        for name, entry in sorted(self.entries.items())
+                    }
+                },
+                f,
+                ensure_ascii=False,
+            )
+        os.replace(f.name, self.path)
+
+    def clear(self) -> None:
+        """Forget every ingested file."""
+        self.entries.clear()
+
+
+def iter_changed_chunks(
+    root_path: str,
+    manifest: IngestionManifest,
+    validate: Callable[[Iterable[Dict[str, Any]]], Iterable[Dict[str, Any]]],
+    stale_uuids: List[str],
+) -> Generator[Tuple[str, int, Dict[str, Any]], None, None]:
+    """Yield the chunks that are not ingested yet and update the manifest.
+
+    Unchanged files are skipped without being parsed. For new or changed
+    files, only chunks whose UUID is not in the manifest are yielded, and the
+    manifest entry is updated once the file has been fully consumed. UUIDs of
+    chunks that disappeared from changed or deleted files are appended to
+    `stale_uuids`.
+
+    Args:
+        root_path (str): The root directory to search for JSON and JSON Lines files.
+        manifest (IngestionManifest): Manifest of the previous ingestion, updated in place.
+        validate (Callable): Function validating a stream of documents.
+        stale_uuids (List[str]): List receiving the UUIDs to delete.
+
+    Returns:
+        Generator[Tuple[str, int, Dict[str, Any]], None, None]: Generator yielding (uuid, chunk_index, document).
+    """  # noqa: E501
+    seen_files = set()
+    for file_path in iter_json_files(root_path):
+        name = os.path.relpath(file_path, root_path)
+        seen_files.add(name)
+        digest = file_sha256(file_path)
+        previous = manifest.entries.get(name)
+        if previous is not None and previous.sha256 == digest:
+            continue
+
+        print(f'Ingesting {name}...')
+        previous_uuids = set(previous.uuids) if previous else set()
+        uuids = []
+        for uuid_, chunk_index, document in assign_chunk_ids(
+            validate(iter_documents_in_file(file_path))
+        ):
+            uuids.append(uuid_)
+            if uuid_ not in previous_uuids:
+                yield uuid_, chunk_index, document
+
+        stale_uuids.extend(previous_uuids.difference(uuids))
+        manifest.entries[name] = ManifestEntry(sha256=digest, uuids=uuids)
+
+    for name in list(manifest.entries):
+        if name not in seen_files:
+            print(f'Removing {name}...')
+            stale_uuids.extend(manifest.entries.pop(name).uuids)
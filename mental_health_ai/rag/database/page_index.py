@@ -0,0 +1,185 @@
+from dataclasses import dataclass
+from threading import RLock
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from mental_health_ai.rag.database.db_interface import PageKey
+
+
+@dataclass(frozen=True)
+class IndexedChunk:
+    """A chunk served from the page index, shaped like a database object."""
+
+    uuid: str
+    properties: Dict[str, Any]
+
+
+@dataclass
+class _IndexedPage:
+    title: str
+    metadata: Dict[str, Any]
+    chunks: Dict[str, Tuple[int, str]]
+
+
+class PageIndex:
+    """
+    In-memory index from (type, source, page_number) to the chunks of a page.
+
+    Context expansion only needs every chunk of the pages returned by the
+    vector search, and that mapping only changes on ingestion. The index keeps
+    the title and metadata once per page and the chunk texts ordered by
+    `chunk_index` (or insertion order when it is missing), so pages are
+    expanded without a database round trip.
+
+    Examples:
+        >>> index = PageIndex()
+        >>> index.add('uuid-1', {
+        ...     'title': 'DSM-5 Page 10',
+        ...     'page_content': 'First chunk',
+        ...     'metadata': {'type': 'DSM-5', 'source': 'dsm5.pdf', 'page_number': 10},
+        ... })
+        >>> index.get_many([('dsm-5', None, 10)])
+    """  # noqa: E501
+
+    def __init__(self):
+        self._pages: Dict[PageKey, _IndexedPage] = {}
+        self._sources: Dict[Tuple[str, int], Dict[Optional[str], None]] = {}
+        self._locations: Dict[str, PageKey] = {}
+        self._lock = RLock()
+        self.is_built = False
+
+    def __len__(self) -> int:
+        return len(self._locations)
+
+    @staticmethod
+    def page_key(metadata: Dict[str, Any]) -> Optional[PageKey]:
+        """
+        Get the normalized page key of a document from its metadata.
+
+        Args:
+            metadata (Dict[str, Any]): Metadata of the document.
+
+        Returns:
+            Optional[PageKey]: The page key, or None if the document has no type or page number.
+        """  # noqa: E501
+        doc_type = metadata.get('type')
+        page_number = metadata.get('page_number')
+        if not doc_type or page_number is None:
+            return None
+        return doc_type.lower(), metadata.get('source'), int(page_number)
+
+    def add(self, uuid: Any, properties: Dict[str, Any]) -> bool:
+        """
+        Add a chunk to the index, replacing it if already indexed.
+
+        Args:
+            uuid (Any): UUID of the chunk.
+            properties (Dict[str, Any]): Properties of the chunk.
+
+        Returns:
+            bool: True if the chunk was indexed, False if it has no page key.
+        """
+        metadata = properties.get('metadata', {}) or {}
+        key = self.page_key(metadata)
+        if key is None:
+            return False
+
+        uuid = str(uuid)
+        with self._lock:
+            self.remove(uuid)
+            page = self._pages.get(key)
+            if page is None:
+                page = _IndexedPage(
+                    title=properties.get('title', ''),
+                    metadata=metadata,
+                    chunks={},
+                )
+                self._pages[key] = page
+                self._sources.setdefault((key[0], key[2]), {})[key[1]] = None
+            chunk_index = properties.get('chunk_index')
+            page.chunks[uuid] = (
+                len(page.chunks) if chunk_index is None else chunk_index,
+                properties.get('page_content', ''),
+            )
+            self._locations[uuid] = key
+        return True
+
+    def remove(self, uuid: Any) -> bool:
+        """
+        Remove a chunk from the index.
+
+        Args:
+            uuid (Any): UUID of the chunk.
+
+        Returns:
+            bool: True if the chunk was indexed, False otherwise.
+        """
+        uuid = str(uuid)
+        with self._lock:
+            key = self._locations.pop(uuid, None)
+            if key is None:
+                return False
+
+            page = self._pages[key]
+            del page.chunks[uuid]
+            if not page.chunks:
+                del self._pages[key]
+                sources = self._sources[key[0], key[2]]
+                del sources[key[1]]
+                if not sources:
+                    del self._sources[key[0], key[2]]
+        return True
+
+    def _get_page_chunks(self, key: PageKey) -> List[IndexedChunk]:
+        page = self._pages.get(key)
+        if page is None:
+            return []
+        return [
+            IndexedChunk(
+                uuid=uuid,
+                properties={
+                    'title': page.title,
+                    'page_content': content,
+                    'metadata': page.metadata,
+                    'chunk_index': chunk_index,
+                },
+            )
+            for uuid, (chunk_index, content) in sorted(
+                page.chunks.items(), key=lambda item: item[1][0]
+            )
+        ]
+
+    def get_many(
+        self, pages: Iterable[PageKey]
+    ) -> Dict[PageKey, List[IndexedChunk]]:
+        """
+        Get the chunks of many pages, grouped by page.
+
+        Args:
+            pages (Iterable[PageKey]): (type, source, page_number) keys. A `None` source matches any source.
+
+        Returns:
+            Dict[PageKey, List[IndexedChunk]]: Chunks of each requested page, keyed by the normalized key in request order.
+        """  # noqa: E501
+        grouped: Dict[PageKey, List[IndexedChunk]] = {}
+        with self._lock:
+            for doc_type, source, page_number in pages:
+                key = (doc_type.lower(), source, int(page_number))
+                if key in grouped:
+                    continue
+
+                if source is not None:
+                    grouped[key] = self._get_page_chunks(key)
+                    continue
+
+                grouped[key] = [
+                    chunk
+                    for indexed_source in self._sources.get(
+                        (key[0], key[2]), {}
+                    )
+                    for chunk in self._get_page_chunks((
+                        key[0],
+                        indexed_source,
+                        key[2],
+                    ))
+                ]
+        return grouped
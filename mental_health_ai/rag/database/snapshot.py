@@ -0,0 +1,170 @@
+import io
+import json
+import zipfile
+from datetime import date, datetime
+from itertools import islice
+from typing import Any, Dict, Generator, Iterable, List, Optional
+
+import numpy as np
+
+from mental_health_ai.rag.database.db_interface import InsertObject
+
+SNAPSHOT_FORMAT_VERSION = 1
+HEADER_FILE_NAME = 'snapshot.json'
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize the values returned by Weaviate that JSON does not support."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def _write_json(archive: zipfile.ZipFile, name: str, content: Any) -> None:
+    archive.writestr(
+        name,
+        json.dumps(content, ensure_ascii=False, default=_json_default),
+    )
+
+
+def _write_chunk(
+    archive: zipfile.ZipFile, index: int, chunk: List[InsertObject]
+) -> Optional[int]:
+    """
+    Write a chunk of objects as one member per column.
+
+    Returns:
+        Optional[int]: Dimension of the vectors of the chunk, None if no object has a vector.
+    """  # noqa: E501
+    prefix = f'chunks/{index:06d}'
+    _write_json(archive, f'{prefix}/uuid.json', [str(obj[0]) for obj in chunk])
+
+    names = sorted({name for _, properties, _ in chunk for name in properties})
+    for name in names:
+        _write_json(
+            archive,
+            f'{prefix}/properties/{name}.json',
+            [properties.get(name) for _, properties, _ in chunk],
+        )
+
+    dimension = next(
+        (len(vector) for _, _, vector in chunk if vector is not None), None
+    )
+    if dimension is None:
+        return None
+
+    # Objects without a vector are stored as NaN rows.
+    vectors = np.full((len(chunk), dimension), np.nan, dtype=np.float32)
+    for row, (_, _, vector) in enumerate(chunk):
+        if vector is not None:
+            vectors[row] = vector
+    buffer = io.BytesIO()
+    np.save(buffer, vectors)
+    archive.writestr(f'{prefix}/vector.npy', buffer.getvalue())
+    return dimension
+
+
+def write_snapshot(
+    path: str,
+    objects: Iterable[InsertObject],
+    chunk_size: int = 1000,
+    metadata: Optional[Dict[str, Any]] = None,
+) -> int:
+    """
+    Stream objects to a compressed, columnar snapshot file.
+
+    The snapshot is a ZIP archive holding chunks of `chunk_size` objects.
+    Each chunk stores its UUIDs, each property and its vectors as separate
+    compressed members, the vectors as a float32 `.npy` matrix, so only one
+    chunk is held in memory at a time.
+
+    Args:
+        path (str): Path of the snapshot file.
+        objects (Iterable[InsertObject]): (uuid, properties, vector) triples to export.
+        chunk_size (int): Number of objects per chunk.
+        metadata (Optional[Dict[str, Any]]): Extra information stored in the header, such as the embedding model.
+
+    Returns:
+        int: Number of objects exported.
+    """  # noqa: E501
+    objects = iter(objects)
+    total, chunks, dimension = 0, 0, None
+    with zipfile.ZipFile(
+        path, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=6
+    ) as archive:
+        while chunk := list(islice(objects, chunk_size)):
+            dimension = _write_chunk(archive, chunks, chunk) or dimension
+            total += len(chunk)
+            chunks += 1
+
+        _write_json(
+            archive,
+            HEADER_FILE_NAME,
+            {
+                'format': SNAPSHOT_FORMAT_VERSION,
+                'objects': total,
+                'chunks': chunks,
+                'dimension': dimension,
+                **(metadata or {}),
+            },
+        )
+    return total
+
+
+def read_snapshot_header(path: str) -> Dict[str, Any]:
+    """
+    Read the header of a snapshot file.
+
+    Raises:
+        ValueError: If the snapshot format is not supported.
+    """
+    with zipfile.ZipFile(path) as archive:
+        header = json.loads(archive.read(HEADER_FILE_NAME))
+    if header.get('format') != SNAPSHOT_FORMAT_VERSION:
+        raise ValueError(
+            f'Unsupported snapshot format: {header.get("format")}.'
+        )
+    return header
+
+
+def iter_snapshot(path: str) -> Generator[InsertObject, None, None]:
+    """
+    Stream the objects of a snapshot file, one chunk at a time.
+
+    Args:
+        path (str): Path of the snapshot file.
+
+    Returns:
+        Generator[InsertObject, None, None]: Generator yielding (uuid, properties, vector). The vector is None for objects exported without one.
+    """  # noqa: E501
+    header = read_snapshot_header(path)
+    with zipfile.ZipFile(path) as archive:
+        members = set(archive.namelist())
+        for index in range(header['chunks']):
+            prefix = f'chunks/{index:06d}'
+            uuids = json.loads(archive.read(f'{prefix}/uuid.json'))
+
+            columns = {
+                name[len(f'{prefix}/properties/') : -len('.json')]: json.loads(
+                    archive.read(name)
+                )
+                for name in members
+                if name.startswith(f'{prefix}/properties/')
+            }
+
+            vectors = None
+            if f'{prefix}/vector.npy' in members:
+                vectors = np.load(
+                    io.BytesIO(archive.read(f'{prefix}/vector.npy'))
+                )
+
+            for row, uuid in enumerate(uuids):
+                properties = {
+                    name: values[row]
+                    for name, values in columns.items()
+                    if values[row] is not None
+                }
+                vector = None
+                if vectors is not None and not np.isnan(vectors[row, 0]):
+                    vector = vectors[row].tolist()
+                yield uuid, properties, vector
@@ -1,38 +1,54 @@
 import json
 import os
-from typing import List
+from typing import Generator
 
+JSON_EXTENSIONS = ('.json', '.jsonl')
 
-def read_json_in_nested_path(root_path: str) -> List[List[dict]]:
-    """Read all JSON files in a nested path.
+
+def iter_json_files(root_path: str) -> Generator[str, None, None]:
+    """Walk a nested path yielding the JSON and JSON Lines files, in sorted order.
+
+    Hidden files, such as the ingestion manifest, are skipped.
 
     Args:
         root_path (str): Path to the root directory where the documents are located.
 
     Returns:
-        List[List[dict]]: List of documents in JSON format.
+        Generator[str, None, None]: Generator yielding the file paths.
     """  # noqa: E501
+    for root, dirs, files in os.walk(root_path):
+        dirs.sort()
+        for file in sorted(files):
+            if not file.startswith('.') and file.lower().endswith(
+                JSON_EXTENSIONS
+            ):
+                yield os.path.join(root, file)
+
+
+def iter_documents_in_file(file_path: str) -> Generator[dict, None, None]:
+    """Read the documents of a JSON or JSON Lines file one by one.
+
+    A JSON file holds a list of documents or a single document and is loaded
+    whole. A JSON Lines file holds one document per line and is streamed, so
+    its size is not limited by the available memory.
 
-    all_json_docs: List[List[dict]] = []
-
-    try:  # noqa: PLR1702
-        for root, _, files in os.walk(root_path):
-            print(f'Files founded in {root}: {files}')
-            for file in files:
-                if file.lower().endswith('.json'):
-                    file_path = os.path.join(root, file)
-
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        file_content = json.load(f)
-                        if isinstance(file_content, list):
-                            all_json_docs.append(file_content)
-                        elif isinstance(file_content, dict):
-                            all_json_docs.append([file_content])
-                        else:
-                            print(f'Invalid JSON file: {file_path}')
-
-        return all_json_docs
-
-    except Exception as e:
-        print(f'Failed to load documents: {e}')
-        return []
+    Args:
+        file_path (str): Path to the file.
+
+    Returns:
+        Generator[dict, None, None]: Generator yielding the documents.
+    """  # noqa: E501
+    with open(file_path, 'r', encoding='utf-8') as f:
+        if file_path.lower().endswith('.jsonl'):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+            return
+
+        file_content = json.load(f)
+        if isinstance(file_content, list):
+            yield from file_content
+        elif isinstance(file_content, dict):
+            yield file_content
+        else:
+            print(f'Invalid JSON file: {file_path}')
@@ -0,0 +1,328 @@
+import argparse
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+from pydantic import ValidationError
+from rich import print
+
+from mental_health_ai.rag.database.ingestion import (
+    assign_chunk_ids,
+    file_sha256,
+)
+from mental_health_ai.rag.database.schemas import WeaviateDocument
+from mental_health_ai.rag.database.utils import (
+    iter_documents_in_file,
+    iter_json_files,
+)
+from mental_health_ai.rag.embeddings import (
+    create_query_embeddings,
+    embedding_model_name,
+)
+from mental_health_ai.settings import settings
+
+SIDECAR_SUFFIX = '.vectors'
+VECTOR_DTYPES = ('float32', 'float16')
+VECTORIZED_PROPERTY = 'page_content'
+"""Only property embedded into the vector of a chunk, also by Weaviate."""
+
+
+def vectorized_text(document: Dict[str, Any]) -> str:
+    """Get the text of a chunk that is embedded into its vector."""
+    return document[VECTORIZED_PROPERTY]
+
+
+def sidecar_paths(file_path: str) -> Tuple[str, str]:
+    """
+    Get the paths of the vector sidecar of a JSON file.
+
+    Sidecars are hidden files next to the JSON file, so `iter_json_files`
+    never reads them as documents.
+
+    Args:
+        file_path (str): Path to the JSON or JSON Lines file.
+
+    Returns:
+        Tuple[str, str]: Paths of the `.npy` vectors and of the `.json` chunk IDs.
+    """  # noqa: E501
+    directory, name = os.path.split(file_path)
+    base = os.path.join(directory, f'.{name}{SIDECAR_SUFFIX}')
+    return f'{base}.npy', f'{base}.json'
+
+
+@dataclass
+class VectorSidecar:
+    """
+    Precomputed embeddings of the chunks of a JSON file.
+
+    Attributes:
+        model_name (str): Embedding model that produced the vectors.
+        sha256 (str): Hash of the JSON file the vectors were computed from.
+        ids (List[str]): Deterministic UUID of the chunk of each row (see `document_uuid`).
+        vectors (np.ndarray): One float32 or float16 row per chunk, memory-mapped when loaded.
+    """  # noqa: E501
+
+    model_name: str
+    sha256: str
+    ids: List[str]
+    vectors: np.ndarray
+
+    @classmethod
+    def load(cls, file_path: str) -> Optional['VectorSidecar']:
+        """Load the sidecar of a JSON file, or None if it is missing or incomplete."""  # noqa: E501
+        vectors_path, ids_path = sidecar_paths(file_path)
+        if not (os.path.exists(vectors_path) and os.path.exists(ids_path)):
+            return None
+
+        with open(ids_path, 'r', encoding='utf-8') as f:
+            content = json.load(f)
+        vectors = np.load(vectors_path, mmap_mode='r')
+        if len(vectors) != len(content['ids']):
+            print(
+                f'[yellow]Ignoring incomplete sidecar of {file_path}.[/yellow]'
+            )
+            return None
+        return cls(
+            model_name=content['model_name'],
+            sha256=content['sha256'],
+            ids=content['ids'],
+            vectors=vectors,
+        )
+
+    def save(self, file_path: str) -> None:
+        """
+        Write the sidecar of a JSON file atomically.
+
+        The vectors are written before the chunk IDs, so an interrupted save
+        leaves a sidecar that `load` rejects or the previous one.
+        """
+        vectors_path, ids_path = sidecar_paths(file_path)
+        directory = os.path.dirname(os.path.abspath(file_path))
+
+        with tempfile.NamedTemporaryFile(dir=directory, delete=False) as f:
+            np.save(f, self.vectors)
+        os.replace(f.name, vectors_path)
+
+        with tempfile.NamedTemporaryFile(
+            'w', encoding='utf-8', dir=directory, delete=False
+        ) as f:
+            json.dump(
+                {
+                    'model_name': self.model_name,
+                    'sha256': self.sha256,
+                    'ids': self.ids,
+                },
+                f,
+            )
+        os.replace(f.name, ids_path)
+
+
+def _iter_valid_documents(
+    documents: Iterable[Dict[str, Any]],
+) -> Iterable[Dict[str, Any]]:
+    """Validate documents like `load_documents`, skipping the invalid ones."""
+    for document in documents:
+        try:
+            yield WeaviateDocument(**document).model_dump(mode='json')
+        except ValidationError:
+            continue
+
+
+def _embed_in_batches(
+    embeddings: Embeddings, texts: List[str], batch_size: int
+) -> np.ndarray:
+    """Embed texts in batches of `batch_size` into a float32 matrix."""
+    texts_iterator = iter(texts)
+    batches = [
+        np.asarray(embeddings.embed_documents(batch), dtype=np.float32)
+        for batch in iter(lambda: list(islice(texts_iterator, batch_size)), [])
+    ]
+    return np.concatenate(batches)
+
+
+def embed_file(  # noqa: PLR0913, PLR0917
+    file_path: str,
+    embeddings: Embeddings,
+    model_name: str,
+    batch_size: int = 256,
+    dtype: str = 'float32',
+) -> Tuple[int, int]:
+    """
+    Write the vector sidecar of a JSON file, embedding only the new chunks.
+
+    Chunks are identified by their deterministic UUID, which depends on their
+    content, so the vectors of unchanged chunks are copied from the previous
+    sidecar of the same model. Unchanged files are skipped without being
+    parsed.
+
+    Args:
+        file_path (str): Path to the JSON or JSON Lines file.
+        embeddings (Embeddings): Model embedding the chunks.
+        model_name (str): Name of the model, it must be the collection vectorizer model.
+        batch_size (int): Number of chunks embedded at a time.
+        dtype (str): Storage type of the vectors, 'float32' or 'float16'.
+
+    Returns:
+        Tuple[int, int]: Number of reused and of embedded vectors.
+    """  # noqa: E501
+    digest = file_sha256(file_path)
+    previous = VectorSidecar.load(file_path)
+    if previous is not None and previous.model_name != model_name:
+        previous = None
+    if (
+        previous is not None
+        and previous.sha256 == digest
+        and previous.vectors.dtype == dtype
+    ):
+        return len(previous.ids), 0
+
+    rows = (
+        {uuid: row for row, uuid in enumerate(previous.ids)}
+        if previous is not None
+        else {}
+    )
+    chunks = list(
+        assign_chunk_ids(
+            _iter_valid_documents(iter_documents_in_file(file_path))
+        )
+    )
+    if not chunks:
+        return 0, 0
+
+    missing = [
+        position
+        for position, (uuid, _, _) in enumerate(chunks)
+        if uuid not in rows
+    ]
+    new_vectors = (
+        _embed_in_batches(
+            embeddings,
+            [vectorized_text(chunks[position][2]) for position in missing],
+            batch_size,
+        )
+        if missing
+        else None
+    )
+    dimension = (
+        new_vectors.shape[1]
+        if new_vectors is not None
+        else previous.vectors.shape[1]
+    )
+
+    vectors = np.empty((len(chunks), dimension), dtype=dtype)
+    for position, (uuid, _, _) in enumerate(chunks):
+        if uuid in rows:
+            vectors[position] = previous.vectors[rows[uuid]]
+    if new_vectors is not None:
+        vectors[missing] = new_vectors
+
+    VectorSidecar(
+        model_name=model_name,
+        sha256=digest,
+        ids=[uuid for uuid, _, _ in chunks],
+        vectors=vectors,
+    ).save(file_path)
+    return len(chunks) - len(missing), len(missing)
+
+
+def embed_corpus(
+    root_path: str,
+    embeddings: Embeddings,
+    model_name: str,
+    batch_size: int = 256,
+    dtype: str = 'float32',
+) -> Tuple[int, int]:
+    """
+    Write the vector sidecars of every JSON file in a directory.
+
+    Args:
+        root_path (str): The root directory to search for JSON and JSON Lines files.
+        embeddings (Embeddings): Model embedding the chunks.
+        model_name (str): Name of the model, it must be the collection vectorizer model.
+        batch_size (int): Number of chunks embedded at a time.
+        dtype (str): Storage type of the vectors, 'float32' or 'float16'.
+
+    Returns:
+        Tuple[int, int]: Number of reused and of embedded vectors.
+    """  # noqa: E501
+    start_time = time.perf_counter()
+    total_reused, total_embedded = 0, 0
+    for file_path in iter_json_files(root_path):
+        reused, embedded = embed_file(
+            file_path, embeddings, model_name, batch_size, dtype
+        )
+        if embedded:
+            print(f'Embedded {embedded} chunks of {file_path}.')
+        total_reused += reused
+        total_embedded += embedded
+    elapsed = time.perf_counter() - start_time
+
+    print(
+        f'[green]Vectors ready in {elapsed:.1f}s: {total_embedded} embedded, {total_reused} reused.[/green]'  # noqa: E501
+    )
+    return total_reused, total_embedded
+
+
+class SidecarVectors:
+    """
+    Lookup of the precomputed vectors of a corpus by chunk UUID.
+
+    Only the chunk IDs are held in memory, the vectors stay memory-mapped.
+
+    Attributes:
+        count (int): Number of chunks with a precomputed vector.
+
+    Examples:
+        >>> vectors = SidecarVectors('data/processed/', 'sentence-transformers/all-mpnet-base-v2')
+        >>> vectors.get(document_uuid(document, 0))
+    """  # noqa: E501
+
+    def __init__(self, root_path: str, model_name: Optional[str] = None):
+        self._rows: Dict[str, Tuple[np.ndarray, int]] = {}
+        for file_path in iter_json_files(root_path):
+            sidecar = VectorSidecar.load(file_path)
+            if sidecar is None:
+                continue
+            if model_name is not None and sidecar.model_name != model_name:
+                print(
+                    f'[yellow]Ignoring vectors of {file_path} computed with {sidecar.model_name}.[/yellow]'  # noqa: E501
+                )
+                continue
+            for row, uuid in enumerate(sidecar.ids):
+                self._rows[uuid] = (sidecar.vectors, row)
+
+    @property
+    def count(self) -> int:
+        return len(self._rows)
+
+    def get(self, uuid: str) -> Optional[List[float]]:
+        """Get the float32 vector of a chunk, or None if it was not precomputed."""  # noqa: E501
+        entry = self._rows.get(uuid)
+        if entry is None:
+            return None
+        vectors, row = entry
+        return vectors[row].astype(np.float32).tolist()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Precompute the embeddings of the processed chunks.'
+    )
+    parser.add_argument('root_path', nargs='?', default='data/processed/')
+    parser.add_argument('--batch-size', type=int, default=256)
+    parser.add_argument('--dtype', choices=VECTOR_DTYPES, default='float32')
+    args = parser.parse_args()
+
+    embed_corpus(
+        args.root_path,
+        create_query_embeddings(cache_size=0).embeddings,
+        embedding_model_name(settings.IS_LOCAL_EMBEDDING),
+        batch_size=args.batch_size,
+        dtype=args.dtype,
+    )
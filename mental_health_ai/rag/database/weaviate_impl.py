@@ -1,22 +1,70 @@
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from http import HTTPStatus
 from itertools import count
-from typing import Any, Dict, Generator, List, Optional, Union
+from threading import RLock
+from typing import (
+    Any,
+    AsyncGenerator,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+)
 
 import weaviate
 import weaviate.classes as wvc
+from langchain_core.embeddings import Embeddings
 from pydantic import ValidationError
 from rich import print
+from weaviate.classes.query import Filter, Sort
+from weaviate.collections import Collection, CollectionAsync
+from weaviate.collections.classes.batch import ErrorObject
 from weaviate.collections.classes.internal import ObjectSingleReturn
 from weaviate.collections.classes.types import WeaviateProperties
 from weaviate.exceptions import UnexpectedStatusCodeError
 
-from mental_health_ai.rag.database.db_interface import DatabaseInterface
-from mental_health_ai.rag.database.schemas import DataModel, WeaviateDocument
-from mental_health_ai.rag.database.utils import read_json_in_nested_path
+from mental_health_ai.rag.database.db_interface import (
+    DatabaseInterface,
+    InsertObject,
+    PageKey,
+)
+from mental_health_ai.rag.database.ingestion import (
+    MANIFEST_FILE_NAME,
+    IngestionManifest,
+    document_uuid,
+    iter_changed_chunks,
+)
+from mental_health_ai.rag.database.page_index import PageIndex
+from mental_health_ai.rag.database.snapshot import (
+    iter_snapshot,
+    read_snapshot_header,
+    write_snapshot,
+)
+from mental_health_ai.rag.database.utils import iter_json_files
+from mental_health_ai.rag.database.vectors import (
+    VECTORIZED_PROPERTY,
+    SidecarVectors,
+)
+from mental_health_ai.rag.embeddings import (
+    aembed_queries,
+    embed_queries,
+    embedding_model_name,
+)
 from mental_health_ai.settings import settings
 
+PAGE_LOOKUP_LIMIT = 1000
+PAGES_PER_QUERY = 50
+PAGE_QUERY_CONCURRENCY = 4
+SEARCH_CONCURRENCY = 8
+DELETE_BATCH_SIZE = 1000
 
-class WeaviateClient(DatabaseInterface):
+
+class WeaviateClient(DatabaseInterface):  # noqa: PLR0904
     """
     A client to interact with a Weaviate vector database.
 
@@ -26,28 +74,55 @@ class WeaviateClient(DatabaseInterface):
 
     Attributes:
         local_embeddings (bool): Whether to use local embeddings or a remote vectorizer.
-        insert_batch_size (int): Number of documents to insert in a single batch (default is 100).
-        insert_max_attempts (int): Maximum number of attempts to insert a batch (default is 3).
+        insert_batch_size (int): Number of documents sent in a single batch request (default is 100).
+        insert_max_attempts (int): Maximum number of attempts to insert a document (default is 3).
+        insert_concurrent_requests (int): Number of batch requests sent concurrently (default is 4).
+        use_page_index (bool): Whether to expand pages from an in-memory index instead of querying the database (default is True).
+        page_index (PageIndex): In-memory index from page keys to chunks, built on first use or by `build_page_index`, and rebuilt when a health check sees the document count change.
+        query_embeddings (Optional[Embeddings]): Model embedding queries in-process for `near_vector` searches. It must match the collection vectorizer. If None, searches use `near_text` and the Weaviate vectorizer.
+
+    The async methods (`averify_database`, `asearch`, `aget_documents_by_pages`)
+    use a `WeaviateAsyncClient`, created and connected lazily inside the running
+    event loop, so they never block it. Close it with `aclose` or `async with`.
     """  # noqa: E501
 
-    def __init__(
+    def __init__(  # noqa: PLR0913, PLR0917
         self,
         local_embeddings: bool = settings.IS_LOCAL_EMBEDDING,
         host: str = settings.WEAVIATE_URL,
         port: int = settings.WEAVIATE_PORT,
         insert_batch_size: int = 100,
         insert_max_attempts: int = 3,
+        insert_concurrent_requests: int = 4,
+        use_page_index: bool = True,
+        query_embeddings: Optional[Embeddings] = None,
     ):
         self.local_embeddings = local_embeddings
         self.insert_batch_size = insert_batch_size
         self.insert_max_attempts = insert_max_attempts
+        self.insert_concurrent_requests = insert_concurrent_requests
+        self.use_page_index = use_page_index
+        self.page_index = PageIndex()
+        self._page_index_lock = RLock()
+        self.query_embeddings = query_embeddings
+        self.host = host
+        self.port = port
         self.client = weaviate.connect_to_local(
             host=host,
             port=port,
             grpc_port=50051,
-            additional_config=wvc.init.AdditionalConfig(
-                timeout=wvc.init.Timeout(init=30, query=300, insert=400)
-            ),
+            additional_config=self._additional_config(),
+        )
+        self._async_client: Optional[weaviate.WeaviateAsyncClient] = None
+        self._async_client_lock = asyncio.Lock()
+        self._collection: Optional[Collection] = None
+        self._async_collection: Optional[CollectionAsync] = None
+
+    @staticmethod
+    def _additional_config() -> wvc.init.AdditionalConfig:
+        """Connection settings shared by the sync and async clients."""
+        return wvc.init.AdditionalConfig(
+            timeout=wvc.init.Timeout(init=30, query=300, insert=400)
         )
 
     def __enter__(self):
@@ -61,56 +136,180 @@ class WeaviateClient(DatabaseInterface):
         if self.client.is_connected():
             self.client.close()
 
-    @staticmethod
-    def _handle_exception(e: Exception, message: str):
-        """Handle exceptions and log the error message."""
-        print(f'[red]{message}: {e}[/red]')
-        raise e
+    async def __aenter__(self):
+        """Enter the async runtime context, connecting the async client."""
+        await self._get_async_client()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Exit the async runtime context and close the async client."""
+        await self.aclose()
+
+    async def _get_async_client(self) -> weaviate.WeaviateAsyncClient:
+        """Get the async client, creating and connecting it on first use."""
+        async with self._async_client_lock:
+            if self._async_client is None:
+                self._async_client = weaviate.use_async_with_local(
+                    host=self.host,
+                    port=self.port,
+                    grpc_port=50051,
+                    additional_config=self._additional_config(),
+                )
+            if not self._async_client.is_connected():
+                await self._async_client.connect()
+            return self._async_client
+
+    async def aclose(self) -> None:
+        """Close the async client connection, if it was opened."""
+        async with self._async_client_lock:
+            if self._async_client is not None:
+                await self._async_client.close()
+                self._async_client = None
+                self._async_collection = None
+
+    def _get_collection(self) -> Optional[Collection]:
+        """
+        Get the 'Documents' collection, checking that it exists only once.
+
+        The validated handle is reused by every operation until a schema
+        change or an error invalidates it, so hot paths such as `search` make
+        a single network call.
+
+        Returns:
+            Optional[Collection]: The collection, or None if it does not exist.
+        """
+        if self._collection is None:
+            document_collection = self.client.collections.get('Documents')
+            if not document_collection.exists():
+                return None
+            self._collection = document_collection
+        return self._collection
+
+    async def _aget_collection(self) -> Optional[CollectionAsync]:
+        """Async version of `_get_collection`, on the async client."""
+        if self._async_collection is None:
+            client = await self._get_async_client()
+            document_collection = client.collections.get('Documents')
+            if not await document_collection.exists():
+                return None
+            self._async_collection = document_collection
+        return self._async_collection
+
+    def _invalidate_collection(self) -> None:
+        """Forget the validated collection handles, so the next use checks again."""  # noqa: E501
+        self._collection = None
+        self._async_collection = None
+
+    def _handle_exception(self, e: Exception, message: str):
+        """Handle exceptions and log the error message.
+
+        The collection handle is invalidated, in case the error comes from a
+        collection that was deleted or recreated.
+        """
+        self._invalidate_collection()
+        super()._handle_exception(e, message)
 
     @staticmethod
-    def _validate_document(document: Dict[str, Any]) -> WeaviateDocument:
-        """Validate a single document using the Pydantic schema."""
-        try:
-            return WeaviateDocument(**document)
-        except ValidationError as e:
-            print(f'[red]Validation failed for document: {e}[/red]')
-            print(f'[red]Document: {document}[/red]')
-            raise e
+    def _filterable_properties() -> List[wvc.config.Property]:
+        """
+        Top-level properties used to filter documents by page.
 
-    def _validate_documents(
-        self,
-        documents: Union[List[Dict[str, Any]], List[List[Dict[str, Any]]]],
-        continue_on_error: bool = False,
-    ) -> DataModel:
+        Weaviate cannot filter on properties nested inside an OBJECT, so
+        `type`, `source` and `page_number` are copied from the metadata to the
+        top level with a filterable index and kept out of the vectorization.
+        `chunk_index` orders the chunks of a page.
+
+        Returns:
+            List[wvc.config.Property]: The filterable property definitions.
+        """  # noqa: E501
+        return [
+            wvc.config.Property(
+                name='type',
+                description='Lowercased type of the document, used for filtering',  # noqa: E501
+                data_type=wvc.config.DataType.TEXT,
+                tokenization=wvc.config.Tokenization.FIELD,
+                index_filterable=True,
+                index_searchable=False,
+                skip_vectorization=True,
+                vectorize_property_name=False,
+            ),
+            wvc.config.Property(
+                name='source',
+                description='Source of the document, used for filtering',
+                data_type=wvc.config.DataType.TEXT,
+                tokenization=wvc.config.Tokenization.FIELD,
+                index_filterable=True,
+                index_searchable=False,
+                skip_vectorization=True,
+                vectorize_property_name=False,
+            ),
+            wvc.config.Property(
+                name='page_number',
+                description='Page number of the document, used for filtering',  # noqa: E501
+                data_type=wvc.config.DataType.INT,
+                index_filterable=True,
+                skip_vectorization=True,
+                vectorize_property_name=False,
+            ),
+            wvc.config.Property(
+                name='chunk_index',
+                description='Position of the chunk within its page',
+                data_type=wvc.config.DataType.INT,
+                index_filterable=True,
+                skip_vectorization=True,
+                vectorize_property_name=False,
+            ),
+        ]
+
+    @staticmethod
+    def _filterable_values(metadata: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Validate a batch of documents using the Pydantic schema.
+        Extract the values of the top-level filterable properties from metadata.
 
         Args:
-            documents (Union[List[Dict[str, Any]], List[List[Dict[str, Any]]]]): Documents to validate.
-            continue_on_error (bool): Whether to continue validating after an error.
+            metadata (Dict[str, Any]): Metadata of the document.
 
         Returns:
-            DataModel: A DataModel containing validated documents.
-
-        Raises:
-            ValidationError: If no valid documents are found.
+            Dict[str, Any]: Filterable values, without the missing ones.
         """  # noqa: E501
-        validated_documents = []
-
-        if documents and isinstance(documents[0], list):
-            documents = [item for sublist in documents for item in sublist]
+        doc_type = metadata.get('type')
+        source = metadata.get('source')
+        page_number = metadata.get('page_number')
+
+        values = {
+            'type': doc_type.lower() if doc_type else None,
+            'source': source,
+            'page_number': (
+                int(page_number) if page_number is not None else None
+            ),
+        }
+        return {
+            key: value for key, value in values.items() if value is not None
+        }
+
+    def _to_weaviate_properties(
+        self, document: Dict[str, Any], chunk_index: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Build the Weaviate properties of a document, including the top-level filterable copies of its metadata.
 
-        for doc in documents:
-            try:
-                validated_documents.append(self._validate_document(doc))
-            except ValidationError as e:
-                print(f'[red]Validation failed for document: {e}[/red]')
-                if not continue_on_error:
-                    raise e
+        Args:
+            document (Dict[str, Any]): The document data.
+            chunk_index (Optional[int]): Position of the chunk within its page, if known.
 
-        if not validated_documents:
-            raise ValidationError('No valid documents found.')
-        return DataModel(documents=validated_documents)
+        Returns:
+            Dict[str, Any]: Properties ready to be inserted.
+        """  # noqa: E501
+        metadata = document.get('metadata', {}) or {}
+        properties = {
+            'title': document.get('title', ''),
+            'page_content': document.get('page_content', ''),
+            'metadata': metadata,
+            **self._filterable_values(metadata),
+        }
+        if chunk_index is not None:
+            properties['chunk_index'] = chunk_index
+        return properties
 
     def verify_database(self) -> bool:
         """
@@ -145,6 +344,40 @@ class WeaviateClient(DatabaseInterface):
             self._handle_exception(e, 'Failed to verify database')
             return False
 
+    async def averify_database(self) -> bool:
+        """
+        Asynchronously verify if the database is up and running.
+
+        Returns:
+            bool: True if the database is operational, False otherwise.
+        """
+        try:
+            print('Verifying database...')
+            client = await self._get_async_client()
+            if not await client.is_ready():
+                raise RuntimeError('Database is not ready.')
+
+            if not await client.is_live():
+                raise RuntimeError('Database is not live.')
+
+            document_collection = client.collections.get('Documents')
+
+            if not await document_collection.exists():
+                raise RuntimeError("Collection 'Documents' not found.")
+
+            aggregation_document = (
+                await document_collection.aggregate.over_all(total_count=True)
+            )
+
+            if aggregation_document.total_count == 0:
+                raise RuntimeError('Collection is empty.')
+
+            print('[green]Database is up and running.[/green]')
+            return True
+        except Exception as e:
+            self._handle_exception(e, 'Failed to verify database')
+            return False
+
     def initialize_database(self) -> None:
         """
         Initialize the database with the necessary classes and properties.
@@ -155,56 +388,12 @@ class WeaviateClient(DatabaseInterface):
             print("Creating class 'Documents'...")
             self.client.collections.create(
                 name='Documents',
-                vectorizer_config=(
-                    wvc.config.Configure.Vectorizer.text2vec_transformers()
-                    if self.local_embeddings
-                    else wvc.config.Configure.Vectorizer.text2vec_openai()
+                vectorizer_config=self._vectorizer_config(
+                    self.local_embeddings
                 ),
-                properties=[
-                    wvc.config.Property(
-                        name='title',
-                        description='Title of the document (e.g., article title)',  # noqa: E501
-                        data_type=wvc.config.DataType.TEXT,
-                    ),
-                    wvc.config.Property(
-                        name='page_content',
-                        description='The content of the document',
-                        data_type=wvc.config.DataType.TEXT,
-                    ),
-                    wvc.config.Property(
-                        name='metadata',
-                        description='Metadata of the document',
-                        data_type=wvc.config.DataType.OBJECT,
-                        nested_properties=[
-                            wvc.config.Property(
-                                name='type',
-                                description='Type of the document (e.g., article, blog post)',  # noqa: E501
-                                data_type=wvc.config.DataType.TEXT,
-                            ),
-                            wvc.config.Property(
-                                name='source',
-                                data_type=wvc.config.DataType.TEXT,
-                                description='The source of the document (e.g., URL, site name)',  # noqa: E501
-                            ),
-                            wvc.config.Property(
-                                name='page_number',
-                                description='The page number of the document',
-                                data_type=wvc.config.DataType.NUMBER,
-                            ),
-                            wvc.config.Property(
-                                name='source_description',
-                                description='Description of the source',
-                                data_type=wvc.config.DataType.TEXT,
-                            ),
-                            wvc.config.Property(
-                                name='date',
-                                description='The publication date of the document',  # noqa: E501
-                                data_type=wvc.config.DataType.DATE,
-                            ),
-                        ],
-                    ),
-                ],
+                properties=self._collection_properties(),
             )
+            self._invalidate_collection()
             print("[green]Class 'Documents' created successfully.[/green]")
         except UnexpectedStatusCodeError as e:
             if (
@@ -214,11 +403,149 @@ class WeaviateClient(DatabaseInterface):
                 print(
                     '[yellow]Collection already exists in the database.[/yellow]'  # noqa: E501
                 )
+                self.migrate_database()
             else:
                 self._handle_exception(e, 'Failed to create collection')
         except Exception as e:
             self._handle_exception(e, 'Failed to create collection')
 
+    @staticmethod
+    def _vectorizer_config(local_embeddings: bool) -> Any:
+        """
+        Vectorizer of the 'Documents' collection.
+
+        The collection name is not vectorized and the model is the one of the
+        query embeddings, so Weaviate embeds the same text into the same space
+        as the vector sidecars (see `vectorized_text`).
+
+        Args:
+            local_embeddings (bool): Whether to use `text2vec-transformers` instead of `text2vec-openai`.
+
+        Returns:
+            Any: The vectorizer configuration.
+        """  # noqa: E501
+        if local_embeddings:
+            return wvc.config.Configure.Vectorizer.text2vec_transformers(
+                vectorize_collection_name=False
+            )
+        return wvc.config.Configure.Vectorizer.text2vec_openai(
+            model=embedding_model_name(local_embeddings),
+            vectorize_collection_name=False,
+        )
+
+    @classmethod
+    def _collection_properties(cls) -> List[wvc.config.Property]:
+        """
+        Properties of the 'Documents' collection.
+
+        Only `VECTORIZED_PROPERTY` is vectorized, without its name, so the
+        vectorizer embeds the same text as `embed_file`.
+
+        Returns:
+            List[wvc.config.Property]: The property definitions.
+        """
+        return [
+            wvc.config.Property(
+                name='title',
+                description='Title of the document (e.g., article title)',  # noqa: E501
+                data_type=wvc.config.DataType.TEXT,
+                skip_vectorization=True,
+            ),
+            wvc.config.Property(
+                name=VECTORIZED_PROPERTY,
+                description='The content of the document',
+                data_type=wvc.config.DataType.TEXT,
+                vectorize_property_name=False,
+            ),
+            wvc.config.Property(
+                name='metadata',
+                description='Metadata of the document',
+                data_type=wvc.config.DataType.OBJECT,
+                skip_vectorization=True,
+                nested_properties=[
+                    wvc.config.Property(
+                        name='type',
+                        description='Type of the document (e.g., article, blog post)',  # noqa: E501
+                        data_type=wvc.config.DataType.TEXT,
+                    ),
+                    wvc.config.Property(
+                        name='source',
+                        data_type=wvc.config.DataType.TEXT,
+                        description='The source of the document (e.g., URL, site name)',  # noqa: E501
+                    ),
+                    wvc.config.Property(
+                        name='page_number',
+                        description='The page number of the document',
+                        data_type=wvc.config.DataType.NUMBER,
+                    ),
+                    wvc.config.Property(
+                        name='source_description',
+                        description='Description of the source',
+                        data_type=wvc.config.DataType.TEXT,
+                    ),
+                    wvc.config.Property(
+                        name='date',
+                        description='The publication date of the document',  # noqa: E501
+                        data_type=wvc.config.DataType.DATE,
+                    ),
+                ],
+            ),
+            *cls._filterable_properties(),
+        ]
+
+    def migrate_database(self) -> int:
+        """
+        Migrate an existing 'Documents' collection to the current schema.
+
+        Adds the top-level filterable properties that are missing and backfills
+        them from the metadata of the objects inserted before they existed.
+
+        Returns:
+            int: Number of objects updated.
+        """
+        try:
+            document_collection = self._get_collection()
+            if document_collection is None:
+                print("[yellow]Collection 'Documents' not found.[/yellow]")
+                return 0
+
+            existing_properties = {
+                prop.name
+                for prop in document_collection.config.get().properties
+            }
+            for prop in self._filterable_properties():
+                if prop.name not in existing_properties:
+                    print(f"Adding property '{prop.name}'...")
+                    document_collection.config.add_property(prop)
+
+            filterable_names = [
+                prop.name for prop in self._filterable_properties()
+            ]
+            updated = 0
+            for doc in document_collection.iterator(
+                return_properties=['metadata', *filterable_names]
+            ):
+                values = self._filterable_values(
+                    doc.properties.get('metadata', {}) or {}
+                )
+                if all(
+                    doc.properties.get(name) == value
+                    for name, value in values.items()
+                ):
+                    continue
+                document_collection.data.update(
+                    uuid=doc.uuid, properties=values
+                )
+                updated += 1
+
+            print(
+                f'[green]Migration finished, {updated} documents updated.[/green]'  # noqa: E501
+            )
+            return updated
+        except Exception as e:
+            self._handle_exception(e, 'Failed to migrate collection')
+            return 0
+
     def delete_all_collections(self) -> None:
         """
         Delete all collections in the database.
@@ -233,6 +560,9 @@ class WeaviateClient(DatabaseInterface):
                 print(f"Deleting collection '{collection}'...")
                 self.client.collections.delete(collection)
                 print(f"Collection '{collection}' deleted.")
+            self._invalidate_collection()
+            self.page_index = PageIndex()
+            self._bump_corpus_version()
             print('[green]All collections deleted successfully.[/green]')
         except Exception as e:
             self._handle_exception(e, 'Failed to delete collections')
@@ -242,8 +572,8 @@ class WeaviateClient(DatabaseInterface):
         Get information about the database, such as total documents and an example document.
         """  # noqa: E501
         try:
-            document_collection = self.client.collections.get('Documents')
-            if not document_collection.exists():
+            document_collection = self._get_collection()
+            if document_collection is None:
                 print("[yellow]Collection 'Documents' not found.[/yellow]")
                 return
 
@@ -263,96 +593,333 @@ class WeaviateClient(DatabaseInterface):
         except Exception as e:
             self._handle_exception(e, 'Failed to get database information')
 
-    def _batch_insert_documents(self, documents: List[Dict[str, Any]]):
+    @staticmethod
+    def _object_vector(obj) -> Optional[List[float]]:
+        """Get the default vector of an object returned with its vectors."""
+        vector = obj.vector
+        if isinstance(vector, dict):
+            vector = vector.get('default')
+        return list(vector) if vector else None
+
+    def export_snapshot(self, path: str, chunk_size: int = 1000) -> int:
         """
-        Helper function to insert documents in batches.
+        Export every object of the 'Documents' collection, with its vector, to a snapshot file.
+
+        Objects are streamed with the collection iterator and written in
+        compressed columnar chunks (see `write_snapshot`), so memory usage is
+        bounded by `chunk_size`.
 
         Args:
-            documents (List[Dict[str, Any]]): Documents to insert.
-        """
-        total_counter = count(start=1)
-        for batch in self._split_into_batches(documents):
-            attempts = 0
-            success = False
-            while attempts < self.insert_max_attempts and not success:
-                try:
-                    print(f'Inserting {len(batch)} documents...')
-                    document_collection = self.client.collections.get(
-                        'Documents'
+            path (str): Path of the snapshot file.
+            chunk_size (int): Number of objects per chunk of the snapshot.
+
+        Returns:
+            int: Number of objects exported.
+        """  # noqa: E501
+        try:
+            document_collection = self._get_collection()
+            if document_collection is None:
+                raise RuntimeError("Collection 'Documents' not found.")
+
+            print(f'Exporting documents to {path}...')
+            start_time = time.perf_counter()
+            exported = write_snapshot(
+                path,
+                (
+                    (str(obj.uuid), obj.properties, self._object_vector(obj))
+                    for obj in document_collection.iterator(
+                        include_vector=True
                     )
-                    if not document_collection.exists():
-                        raise RuntimeError("Collection 'Documents' not found.")
-
-                    for doc in batch:
-                        doc_number = next(total_counter)
-                        print(f'Inserting document {doc_number}...')
-                        uuid = document_collection.data.insert({
-                            'title': doc.get('title', ''),
-                            'page_content': doc.get('page_content', ''),
-                            'metadata': doc.get('metadata', {}),
-                        })
-                        print(f'Document added with UUID: {uuid}')
-                    success = True
-                except Exception as e:
-                    attempts += 1
-                    print(f'[red]Attempt {attempts} failed: {e}[/red]')
-                    if attempts >= self.insert_max_attempts:
-                        self._handle_exception(e, 'Failed to insert documents')
-            if not success:
+                ),
+                chunk_size=chunk_size,
+                metadata={
+                    'collection': 'Documents',
+                    'model_name': embedding_model_name(self.local_embeddings),
+                },
+            )
+            elapsed = time.perf_counter() - start_time
+            print(
+                f'[green]Exported {exported} documents in {elapsed:.1f}s.[/green]'  # noqa: E501
+            )
+            return exported
+        except Exception as e:
+            self._handle_exception(e, 'Failed to export documents')
+            return 0
+
+    def import_snapshot(self, path: str) -> int:
+        """
+        Restore the objects of a snapshot file into the 'Documents' collection.
+
+        Objects are inserted with the batch API, together with their exported
+        vectors, so the vectorizer is not called. The collection is created
+        if it does not exist, and objects already in it are overwritten.
+
+        Args:
+            path (str): Path of the snapshot file, written by `export_snapshot`.
+
+        Returns:
+            int: Number of objects imported.
+        """  # noqa: E501
+        try:
+            header = read_snapshot_header(path)
+            model_name = embedding_model_name(self.local_embeddings)
+            if header.get('model_name') != model_name:
                 print(
-                    f'Failed to insert batch of documents after {attempts} attempts.'  # noqa: E501
+                    f"[yellow]Snapshot vectors were computed with {header.get('model_name')}, not {model_name}.[/yellow]"  # noqa: E501
                 )
-                raise RuntimeError(
-                    'Batch insert failed after multiple attempts'
+
+            if self._get_collection() is None:
+                self.initialize_database()
+
+            print(f"Importing {header['objects']} documents from {path}...")
+            imported = self._batch_insert_documents(iter_snapshot(path))
+            print(f'[green]Imported {imported} documents.[/green]')
+            return imported
+        except Exception as e:
+            self._handle_exception(e, 'Failed to import documents')
+            return 0
+
+    def _index_chunk(self, uuid: Any, properties: Dict[str, Any]) -> None:
+        """Add an inserted chunk to the page index, if it is already built."""
+        if self.page_index.is_built:
+            self.page_index.add(uuid, properties)
+
+    def _insert_objects(
+        self,
+        document_collection,
+        objects: Iterable[InsertObject],
+    ) -> List[ErrorObject]:
+        """
+        Insert objects through the Weaviate batch API.
+
+        Args:
+            document_collection: The collection to insert into.
+            objects (Iterable[InsertObject]): (uuid, properties, vector) triples to insert. Objects without a vector are vectorized by Weaviate.
+
+        Returns:
+            List[ErrorObject]: Objects that failed to be inserted.
+        """  # noqa: E501
+        with document_collection.batch.fixed_size(
+            batch_size=self.insert_batch_size,
+            concurrent_requests=self.insert_concurrent_requests,
+        ) as batch:
+            for uuid, properties, vector in objects:
+                batch.add_object(
+                    properties=properties, uuid=uuid, vector=vector
                 )
+                self._index_chunk(uuid, properties)
+        return document_collection.batch.failed_objects
 
-    def _split_into_batches(
-        self, documents: List[Dict[str, Any]]
-    ) -> Generator[List[Dict[str, Any]], None, None]:
+    def _batch_insert_documents(self, objects: Iterable[InsertObject]) -> int:
         """
-        Split documents into batches.
+        Insert objects with the Weaviate batch API, retrying only the failed ones.
+
+        Every object carries its deterministic UUID, so a retry overwrites a
+        partially applied insert instead of duplicating it.
 
         Args:
-            documents (List[Dict[str, Any]]): Documents to split.
+            objects (Iterable[InsertObject]): (uuid, properties, vector) triples to insert.
 
         Returns:
-            Generator[List[Dict[str, Any]], None, None]: Generator yielding document batches.
+            int: Number of objects inserted.
+
+        Raises:
+            RuntimeError: If some objects still fail after `insert_max_attempts` attempts.
         """  # noqa: E501
-        for i in range(0, len(documents), self.insert_batch_size):
-            yield documents[i : i + self.insert_batch_size]
+        document_collection = self._get_collection()
+        if document_collection is None:
+            raise RuntimeError("Collection 'Documents' not found.")
+
+        # Counts the objects consumed by the batch.
+        total_counter = count()
+        objects = (obj for obj, _ in zip(objects, total_counter))
+
+        start_time = time.perf_counter()
+        attempts = 1
+        failed = self._insert_objects(document_collection, objects)
+        while failed and attempts < self.insert_max_attempts:
+            attempts += 1
+            print(
+                f'[yellow]Retrying {len(failed)} failed documents (attempt {attempts}): {failed[0].message}[/yellow]'  # noqa: E501
+            )
+            failed = self._insert_objects(
+                document_collection,
+                (
+                    (
+                        str(error.object_.uuid),
+                        error.object_.properties,
+                        error.object_.vector,
+                    )
+                    for error in failed
+                ),
+            )
+        elapsed = time.perf_counter() - start_time
+
+        total = next(total_counter)
+        if total:
+            self._bump_corpus_version()
+        for error in failed:
+            self.page_index.remove(error.object_.uuid)
+        inserted = total - len(failed)
+        print(
+            f'Inserted {inserted} documents in {elapsed:.1f}s ({inserted / max(elapsed, 1e-9):.1f} docs/sec).'  # noqa: E501
+        )
+
+        if failed:
+            raise RuntimeError(
+                f'Failed to insert {len(failed)} documents after {attempts} attempts: {failed[0].message}'  # noqa: E501
+            )
+        return inserted
+
+    def _delete_documents(self, uuids: List[str]) -> int:
+        """
+        Delete documents by UUID, in groups of `DELETE_BATCH_SIZE`.
+
+        Args:
+            uuids (List[str]): UUIDs of the documents to delete.
+
+        Returns:
+            int: Number of documents deleted.
+        """
+        if not uuids:
+            return 0
+
+        document_collection = self._get_collection()
+        if document_collection is None:
+            return 0
+
+        deleted = 0
+        for start in range(0, len(uuids), DELETE_BATCH_SIZE):
+            group = uuids[start : start + DELETE_BATCH_SIZE]
+            result = document_collection.data.delete_many(
+                where=Filter.by_id().contains_any(group)
+            )
+            deleted += result.successful
+            for uuid in group:
+                self.page_index.remove(uuid)
+        if deleted:
+            self._bump_corpus_version()
+        return deleted
+
+    def _find_legacy_uuids(self) -> List[str]:
+        """
+        Find the objects inserted before loading was incremental.
+
+        They have random UUIDs and no `chunk_index`, so loading their files
+        again inserts every chunk a second time next to them.
+
+        Returns:
+            List[str]: UUIDs of the objects without `chunk_index`.
+        """
+        document_collection = self._get_collection()
+        if document_collection is None:
+            return []
+        return [
+            str(doc.uuid)
+            for doc in document_collection.iterator(
+                return_properties=['chunk_index']
+            )
+            if doc.properties.get('chunk_index') is None
+        ]
 
-    def load_documents(
-        self, root_path: str, continue_on_error: bool = False
+    def load_documents(  # noqa: PLR0913, PLR0917
+        self,
+        root_path: str,
+        continue_on_error: bool = False,
+        manifest_path: Optional[str] = None,
+        use_vectors: bool = True,
+        replace_legacy: bool = False,
     ) -> bool:
         """
         Load documents into the database from JSON files in a directory.
 
+        Files are read, validated and inserted as a stream, so memory usage is
+        bounded by the largest JSON file (JSON Lines files are streamed line by
+        line) instead of the whole corpus.
+
+        Loading is incremental and idempotent: chunks get deterministic UUIDs,
+        and a manifest of the ingested files records their hashes and chunk UUIDs.
+        Unchanged files are skipped. Only new or changed chunks are inserted
+        (and vectorized), and chunks that are no longer on disk are deleted.
+
+        Without a manifest, a collection populated by an older version (objects
+        without `chunk_index`) is refused, since its chunks would be inserted
+        again under their new UUIDs. Reset the collection, or pass
+        `replace_legacy=True` to delete those objects once the new ones are
+        inserted.
+
+        Chunks with a precomputed vector in the sidecars of their file (see
+        `mental_health_ai.rag.database.vectors`) are inserted with it and
+        skip the Weaviate vectorizer.
+
         Args:
-            root_path (str): The root directory to search for JSON files.
+            root_path (str): The root directory to search for JSON and JSON Lines files.
             continue_on_error (bool): Whether to continue loading after an error.
+            manifest_path (Optional[str]): Path of the ingestion manifest. Defaults to `MANIFEST_FILE_NAME` inside `root_path`.
+            use_vectors (bool): Whether to attach the precomputed vectors of the embedding model of the collection.
+            replace_legacy (bool): Whether to delete the objects inserted by an older version instead of refusing to load.
 
         Returns:
             bool: True if documents were loaded successfully, False otherwise.
         """  # noqa: E501
-        json_files = read_json_in_nested_path(root_path)
-        if not json_files:
+        if not any(iter_json_files(root_path)):
             print('[yellow]No documents found.[/yellow]')
             return False
 
-        print(f'Validating {len(json_files)} files...')
+        manifest = IngestionManifest.load(
+            manifest_path or os.path.join(root_path, MANIFEST_FILE_NAME)
+        )
 
         try:
-            validated_data = self._validate_documents(
-                json_files, continue_on_error
+            if manifest.entries and self.count_documents() == 0:
+                print(
+                    '[yellow]Collection is empty, ignoring the ingestion manifest.[/yellow]'  # noqa: E501
+                )
+                manifest.clear()
+
+            legacy_uuids = (
+                [] if manifest.entries else self._find_legacy_uuids()
             )
-            print(
-                f'Adding {len(validated_data.documents)} validated documents to the database...'  # noqa: E501
+            if legacy_uuids and not replace_legacy:
+                print(
+                    f'[red]The collection has {len(legacy_uuids)} documents loaded by an older version, loading would duplicate them. Reset it with `delete_all_collections` and `initialize_database`, or load with `replace_legacy=True` to replace them.[/red]'  # noqa: E501
+                )
+                return False
+
+            vectors = (
+                SidecarVectors(
+                    root_path, embedding_model_name(self.local_embeddings)
+                )
+                if use_vectors
+                else None
             )
+            if vectors is not None and vectors.count:
+                print(f'Using {vectors.count} precomputed vectors.')
+
+            print(f'Loading documents from {root_path}...')
+            stale_uuids: List[str] = []
+            chunks = iter_changed_chunks(
+                root_path,
+                manifest,
+                lambda documents: self._validate_documents(
+                    documents, continue_on_error
+                ),
+                stale_uuids,
+            )
+            inserted = self._batch_insert_documents(
+                (
+                    uuid,
+                    self._to_weaviate_properties(document, chunk_index),
+                    vectors.get(uuid) if vectors is not None else None,
+                )
+                for uuid, chunk_index, document in chunks
+            )
+            deleted = self._delete_documents(stale_uuids + legacy_uuids)
+            manifest.save()
 
-            self._batch_insert_documents([
-                doc.model_dump() for doc in validated_data.documents
-            ])
-            print('[green]Documents loaded successfully.[/green]')
+            print(
+                f'[green]Documents loaded successfully: {inserted} inserted, {deleted} deleted.[/green]'  # noqa: E501
+            )
             return True
         except ValidationError as e:
             self._handle_exception(e, 'Failed to validate documents')
@@ -361,6 +928,42 @@ class WeaviateClient(DatabaseInterface):
             self._handle_exception(e, 'Failed to load documents')
             return False
 
+    def count_documents(self) -> int:
+        """Count the documents in the 'Documents' collection."""
+        document_collection = self._get_collection()
+        if document_collection is None:
+            return 0
+        return document_collection.aggregate.over_all(
+            total_count=True
+        ).total_count
+
+    async def acount_documents(self) -> int:
+        """Asynchronously count the documents in the 'Documents' collection."""
+        document_collection = await self._aget_collection()
+        if document_collection is None:
+            return 0
+        return (
+            await document_collection.aggregate.over_all(total_count=True)
+        ).total_count
+
+    def sync_document_count(self, document_count: int) -> bool:
+        """
+        Record the document count seen by a health check, rebuilding the page index when it changed.
+
+        Args:
+            document_count (int): Number of documents in the collection.
+
+        Returns:
+            bool: Whether the count changed since the previous check.
+        """  # noqa: E501
+        changed = super().sync_document_count(document_count)
+        if changed and self.page_index.is_built:
+            print(
+                '[yellow]Document count changed, rebuilding the page index.[/yellow]'  # noqa: E501
+            )
+            self.build_page_index()
+        return changed
+
     def search(self, query: str, limit: int = 5) -> List[WeaviateProperties]:
         """
         Search for documents in the database using a query.
@@ -373,19 +976,25 @@ class WeaviateClient(DatabaseInterface):
             List[WeaviateProperties]: List of documents that match the query.
         """
         try:
-            document_collection = self.client.collections.get('Documents')
+            document_collection = self._get_collection()
 
-            if not document_collection.exists():
+            if document_collection is None:
                 print("[yellow]Collection 'Documents' not found.[/yellow]")
                 return []
 
-            search_result = document_collection.query.near_text(
-                query=query,
-                limit=limit,
-                return_metadata=wvc.query.MetadataQuery(
-                    distance=True, score=True
-                ),
+            return_metadata = wvc.query.MetadataQuery(
+                distance=True, score=True
             )
+            if self.query_embeddings is not None:
+                search_result = document_collection.query.near_vector(
+                    near_vector=self.query_embeddings.embed_query(query),
+                    limit=limit,
+                    return_metadata=return_metadata,
+                )
+            else:
+                search_result = document_collection.query.near_text(
+                    query=query, limit=limit, return_metadata=return_metadata
+                )
 
             if not search_result.objects:
                 print('[yellow]No documents found.[/yellow]')
@@ -396,6 +1005,164 @@ class WeaviateClient(DatabaseInterface):
             self._handle_exception(e, 'Failed to search documents')
             return []
 
+    async def asearch(
+        self, query: str, limit: int = 5
+    ) -> List[WeaviateProperties]:
+        """
+        Asynchronously search for documents in the database using a query.
+
+        Args:
+            query (str): The query string.
+            limit (int): Maximum number of documents to return.
+
+        Returns:
+            List[WeaviateProperties]: List of documents that match the query.
+        """
+        try:
+            document_collection = await self._aget_collection()
+
+            if document_collection is None:
+                print("[yellow]Collection 'Documents' not found.[/yellow]")
+                return []
+
+            return_metadata = wvc.query.MetadataQuery(
+                distance=True, score=True
+            )
+            if self.query_embeddings is not None:
+                search_result = await document_collection.query.near_vector(
+                    near_vector=await self.query_embeddings.aembed_query(
+                        query
+                    ),
+                    limit=limit,
+                    return_metadata=return_metadata,
+                )
+            else:
+                search_result = await document_collection.query.near_text(
+                    query=query, limit=limit, return_metadata=return_metadata
+                )
+
+            if not search_result.objects:
+                print('[yellow]No documents found.[/yellow]')
+                return []
+
+            return search_result.objects
+        except Exception as e:
+            self._handle_exception(e, 'Failed to search documents')
+            return []
+
+    def search_many(
+        self, queries: List[str], limit: int = 5
+    ) -> List[List[WeaviateProperties]]:
+        """
+        Search for the documents of many queries, in query order.
+
+        With `query_embeddings`, the queries missing from the query cache
+        are embedded in a single batch before the `near_vector` searches.
+        The searches run concurrently, at most `SEARCH_CONCURRENCY` at a time.
+
+        Args:
+            queries (List[str]): The query strings.
+            limit (int): Maximum number of documents to return per query.
+
+        Returns:
+            List[List[WeaviateProperties]]: Documents that match each query.
+        """
+        try:
+            document_collection = self._get_collection()
+
+            if document_collection is None:
+                print("[yellow]Collection 'Documents' not found.[/yellow]")
+                return [[] for _ in queries]
+
+            return_metadata = wvc.query.MetadataQuery(
+                distance=True, score=True
+            )
+            if self.query_embeddings is not None:
+                searches = [
+                    partial(
+                        document_collection.query.near_vector,
+                        near_vector=vector,
+                    )
+                    for vector in embed_queries(self.query_embeddings, queries)
+                ]
+            else:
+                searches = [
+                    partial(document_collection.query.near_text, query=query)
+                    for query in queries
+                ]
+            if not searches:
+                return []
+
+            with ThreadPoolExecutor(
+                max_workers=min(SEARCH_CONCURRENCY, len(searches))
+            ) as executor:
+                return [
+                    search_result.objects
+                    for search_result in executor.map(
+                        lambda search: search(
+                            limit=limit, return_metadata=return_metadata
+                        ),
+                        searches,
+                    )
+                ]
+        except Exception as e:
+            self._handle_exception(e, 'Failed to search documents')
+            return []
+
+    async def asearch_many(
+        self, queries: List[str], limit: int = 5
+    ) -> List[List[WeaviateProperties]]:
+        """
+        Asynchronously search for the documents of many queries, in query order.
+
+        With `query_embeddings`, the queries missing from the query cache
+        are embedded in a single batch, and the searches run concurrently on
+        the async client.
+
+        Args:
+            queries (List[str]): The query strings.
+            limit (int): Maximum number of documents to return per query.
+
+        Returns:
+            List[List[WeaviateProperties]]: Documents that match each query.
+        """  # noqa: E501
+        try:
+            document_collection = await self._aget_collection()
+
+            if document_collection is None:
+                print("[yellow]Collection 'Documents' not found.[/yellow]")
+                return [[] for _ in queries]
+
+            return_metadata = wvc.query.MetadataQuery(
+                distance=True, score=True
+            )
+            if self.query_embeddings is not None:
+                searches = [
+                    document_collection.query.near_vector(
+                        near_vector=vector,
+                        limit=limit,
+                        return_metadata=return_metadata,
+                    )
+                    for vector in await aembed_queries(
+                        self.query_embeddings, queries
+                    )
+                ]
+            else:
+                searches = [
+                    document_collection.query.near_text(
+                        query=query,
+                        limit=limit,
+                        return_metadata=return_metadata,
+                    )
+                    for query in queries
+                ]
+
+            search_results = await asyncio.gather(*searches)
+            return [search_result.objects for search_result in search_results]
+        except Exception as e:
+            self._handle_exception(e, 'Failed to search documents')
+            return []
+
     def get_document_by_id(
         self, document_id: str
     ) -> Optional[ObjectSingleReturn]:
@@ -409,9 +1176,9 @@ class WeaviateClient(DatabaseInterface):
             Optional[ObjectSingleReturn]: The document if found, else None.
         """
         try:
-            document_collection = self.client.collections.get('Documents')
+            document_collection = self._get_collection()
 
-            if not document_collection.exists():
+            if document_collection is None:
                 print("[yellow]Collection 'Documents' not found.[/yellow]")
                 return None
 
@@ -437,6 +1204,8 @@ class WeaviateClient(DatabaseInterface):
         """
         Add a single document to the database.
 
+        The UUID is derived from the document, so adding it again is a no-op.
+
         Args:
             document (Dict[str, Any]): The document data.
 
@@ -460,17 +1229,30 @@ class WeaviateClient(DatabaseInterface):
         validated_document = self._validate_document(document)
 
         try:
-            document_collection = self.client.collections.get('Documents')
+            document_collection = self._get_collection()
 
-            if not document_collection.exists():
+            if document_collection is None:
                 print("[yellow]Collection 'Documents' not found.[/yellow]")
                 return False
 
+            document = validated_document.model_dump()
+            properties = self._to_weaviate_properties(document)
             uuid = document_collection.data.insert(
-                validated_document.model_dump()
+                properties, uuid=document_uuid(document)
             )
+            self._index_chunk(uuid, properties)
+            self._bump_corpus_version()
             print(f'Document added with UUID: {uuid}')
             return True
+        except UnexpectedStatusCodeError as e:
+            if (
+                e.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+                and 'already exists' in e.message
+            ):
+                print('[yellow]Document already exists.[/yellow]')
+                return True
+            self._handle_exception(e, 'Failed to add document to the database')
+            return False
         except Exception as e:
             self._handle_exception(e, 'Failed to add document to the database')
             return False
@@ -483,62 +1265,326 @@ class WeaviateClient(DatabaseInterface):
             document_id (str): UUID of the document to be deleted.
         """
         try:
-            document_collection = self.client.collections.get('Documents')
+            document_collection = self._get_collection()
 
-            if not document_collection.exists():
+            if document_collection is None:
                 print("[yellow]Collection 'Documents' not found.[/yellow]")
                 return
 
             document_collection.data.delete_by_id(document_id)
+            self.page_index.remove(document_id)
+            self._bump_corpus_version()
             print(f'Document with ID {document_id} deleted.')
         except ValueError as e:
             print(f'[red]Invalid document ID {document_id}: {e}[/red]')
         except Exception as e:
             self._handle_exception(e, 'Failed to delete document')
 
-    def get_documents_by_type_and_page_number(
-        self, doc_type: str, page_number: int, source: Optional[str] = None
-    ) -> List[WeaviateProperties]:
+    @staticmethod
+    def _page_filter(page: PageKey):
+        """Build the filter matching every chunk of a single page."""
+        doc_type, source, page_number = page
+        filters = Filter.by_property('type').equal(
+            doc_type.lower()
+        ) & Filter.by_property('page_number').equal(int(page_number))
+        if source is not None:
+            filters &= Filter.by_property('source').equal(source)
+        return filters
+
+    @staticmethod
+    def _fetch_all_filtered(
+        document_collection, filters
+    ) -> Generator[Any, None, None]:
         """
-        Get documents by type, page number, and optionally source.
+        Fetch every object matching the filters, paging by offset.
 
         Args:
-            doc_type (str): The type of the document (e.g., 'article', 'dsm-5').
-            page_number (int): The page number.
-            source (str, optional): The source of the document.
+            document_collection: The collection to query.
+            filters: The filters to apply.
 
         Returns:
-            List[WeaviateProperties]: List of documents matching the criteria.
+            Generator[Any, None, None]: Generator yielding the matching objects.
+        """  # noqa: E501
+        offset = 0
+        while True:
+            objects = document_collection.query.fetch_objects(
+                filters=filters,
+                limit=PAGE_LOOKUP_LIMIT,
+                offset=offset,
+                sort=Sort.by_property('chunk_index'),
+            ).objects
+            yield from objects
+
+            if len(objects) < PAGE_LOOKUP_LIMIT:
+                return
+            offset += PAGE_LOOKUP_LIMIT
+
+    @staticmethod
+    async def _afetch_all_filtered(
+        document_collection, filters
+    ) -> AsyncGenerator[Any, None]:
+        """Async version of `_fetch_all_filtered` for an async collection."""
+        offset = 0
+        while True:
+            objects = (
+                await document_collection.query.fetch_objects(
+                    filters=filters,
+                    limit=PAGE_LOOKUP_LIMIT,
+                    offset=offset,
+                    sort=Sort.by_property('chunk_index'),
+                )
+            ).objects
+            for doc in objects:
+                yield doc
+
+            if len(objects) < PAGE_LOOKUP_LIMIT:
+                return
+            offset += PAGE_LOOKUP_LIMIT
+
+    @staticmethod
+    def _requested_pages(pages: Iterable[PageKey]) -> List[PageKey]:
+        """Normalize and deduplicate page keys, keeping the request order."""
+        return list(
+            dict.fromkeys(
+                (doc_type.lower(), source, int(page_number))
+                for doc_type, source, page_number in pages
+            )
+        )
+
+    @staticmethod
+    def _group_by_page(
+        grouped: Dict[PageKey, List[WeaviateProperties]], doc
+    ) -> None:
+        """Append a document to the requested pages it belongs to."""
+        doc_type = doc.properties.get('type')
+        source = doc.properties.get('source')
+        page_number = doc.properties.get('page_number')
+        if (doc_type, source, page_number) in grouped:
+            grouped[doc_type, source, page_number].append(doc)
+        if source is not None and (doc_type, None, page_number) in grouped:
+            grouped[doc_type, None, page_number].append(doc)
+
+    def _fetch_pages(
+        self, document_collection, pages: List[PageKey]
+    ) -> List[Any]:
+        """Fetch every chunk of a group of pages with one OR-filtered query."""
+        filters = Filter.any_of([self._page_filter(page) for page in pages])
+        return list(self._fetch_all_filtered(document_collection, filters))
+
+    async def _afetch_pages(
+        self, document_collection, pages: List[PageKey]
+    ) -> List[Any]:
+        """Async version of `_fetch_pages` for an async collection."""
+        filters = Filter.any_of([self._page_filter(page) for page in pages])
+        return [
+            doc
+            async for doc in self._afetch_all_filtered(
+                document_collection, filters
+            )
+        ]
+
+    def _query_pages(
+        self, requested: List[PageKey]
+    ) -> Dict[PageKey, List[WeaviateProperties]]:
+        """
+        Query the documents of normalized pages from the database, grouped by page.
+
+        Pages are requested in groups of `PAGES_PER_QUERY`, up to
+        `PAGE_QUERY_CONCURRENCY` groups at a time, and merged in request order.
         """  # noqa: E501
+        grouped: Dict[PageKey, List[WeaviateProperties]] = {
+            page: [] for page in requested
+        }
+        if not requested:
+            return grouped
+
         try:
-            document_collection = self.client.collections.get('Documents')
-            if not document_collection.exists():
+            document_collection = self._get_collection()
+            if document_collection is None:
                 print("[red]Collection 'Documents' not found.[/red]")
-                return []
+                return grouped
+
+            groups = [
+                requested[start : start + PAGES_PER_QUERY]
+                for start in range(0, len(requested), PAGES_PER_QUERY)
+            ]
+            with ThreadPoolExecutor(
+                max_workers=min(PAGE_QUERY_CONCURRENCY, len(groups))
+            ) as executor:
+                for docs in executor.map(
+                    partial(self._fetch_pages, document_collection), groups
+                ):
+                    for doc in docs:
+                        self._group_by_page(grouped, doc)
 
-            documents: List[WeaviateProperties] = []
+            return grouped
+        except Exception as e:
+            self._handle_exception(e, 'Failed to get documents by pages')
+            return grouped
+
+    async def _aquery_pages(
+        self, requested: List[PageKey]
+    ) -> Dict[PageKey, List[WeaviateProperties]]:
+        """Async version of `_query_pages`, on the async client."""
+        grouped: Dict[PageKey, List[WeaviateProperties]] = {
+            page: [] for page in requested
+        }
+        if not requested:
+            return grouped
 
-            for doc in document_collection.iterator():
-                metadata = doc.properties.get('metadata', {})
-                if (
-                    metadata.get('type', '').lower() == doc_type.lower()
-                    and int(metadata.get('page_number', -1)) == page_number
-                    and (
-                        source is None or metadata.get('source', '') == source
-                    )
-                ):
-                    print(
-                        f"Found document: {doc.properties.get('title', 'No Title')}"  # noqa: E501
-                    )
-                    documents.append(doc)
+        try:
+            document_collection = await self._aget_collection()
+            if document_collection is None:
+                print("[red]Collection 'Documents' not found.[/red]")
+                return grouped
 
-            if not documents:
-                print(
-                    '[yellow]No documents found matching the criteria.[/yellow]'  # noqa: E501
+            semaphore = asyncio.Semaphore(PAGE_QUERY_CONCURRENCY)
+
+            async def fetch(group: List[PageKey]) -> List[Any]:
+                async with semaphore:
+                    return await self._afetch_pages(document_collection, group)
+
+            results = await asyncio.gather(
+                *(
+                    fetch(requested[start : start + PAGES_PER_QUERY])
+                    for start in range(0, len(requested), PAGES_PER_QUERY)
                 )
-            return documents
+            )
+            for docs in results:
+                for doc in docs:
+                    self._group_by_page(grouped, doc)
+
+            return grouped
         except Exception as e:
-            self._handle_exception(
-                e, 'Failed to get documents by type and page number'
+            self._handle_exception(e, 'Failed to get documents by pages')
+            return grouped
+
+    def _get_page_index(self) -> Optional[PageIndex]:
+        """
+        Get the page index, building it on first use.
+
+        Concurrent first calls wait for a single build.
+
+        Returns:
+            Optional[PageIndex]: The built page index, or None if `use_page_index` is off or the index could not be built.
+        """  # noqa: E501
+        if not self.use_page_index:
+            return None
+        if not self.page_index.is_built:
+            with self._page_index_lock:
+                if not self.page_index.is_built:
+                    self.build_page_index()
+        return self.page_index if self.page_index.is_built else None
+
+    @staticmethod
+    def _merge_queried_pages(
+        page_index: PageIndex,
+        grouped: Dict[PageKey, List[Any]],
+        fetched: Dict[PageKey, List[WeaviateProperties]],
+    ) -> None:
+        """Merge the pages queried from the database and add them to the index."""  # noqa: E501
+        for page, docs in fetched.items():
+            grouped[page] = docs
+            for doc in docs:
+                page_index.add(doc.uuid, doc.properties)
+
+    def get_documents_by_pages(
+        self, pages: Iterable[PageKey]
+    ) -> Dict[PageKey, List[WeaviateProperties]]:
+        """
+        Get the documents of many pages with OR-filtered queries, grouped by page.
+
+        Pages are served from the in-memory page index when `use_page_index`
+        is set. Pages missing from the index, such as the pages of documents
+        loaded by another process since it was built, and every page when the
+        index cannot be built, are queried from the database. They are
+        requested in groups of `PAGES_PER_QUERY`, so a whole context is
+        usually fetched in a single round trip. Larger requests, such as the
+        pages of a batch of queries, run up to `PAGE_QUERY_CONCURRENCY` groups
+        at a time and are merged in request order.
+
+        Args:
+            pages (Iterable[PageKey]): (type, source, page_number) keys. A `None` source matches any source.
+
+        Returns:
+            Dict[PageKey, List[WeaviateProperties]]: Documents of each requested page, keyed by the normalized key (lowercased type, integer page) in request order. Pages without documents map to an empty list.
+        """  # noqa: E501
+        requested = self._requested_pages(pages)
+        page_index = self._get_page_index()
+        if page_index is None:
+            return self._query_pages(requested)
+
+        grouped = page_index.get_many(requested)
+        missing = [page for page, docs in grouped.items() if not docs]
+        if missing:
+            self._merge_queried_pages(
+                page_index, grouped, self._query_pages(missing)
             )
-            return []
+        return grouped
+
+    async def aget_documents_by_pages(
+        self, pages: Iterable[PageKey]
+    ) -> Dict[PageKey, List[WeaviateProperties]]:
+        """
+        Asynchronously get the documents of many pages, grouped by page.
+
+        Same behavior as `get_documents_by_pages`. Building the page index on
+        first use runs in a worker thread, and the database queries run
+        concurrently on the async client.
+
+        Args:
+            pages (Iterable[PageKey]): (type, source, page_number) keys. A `None` source matches any source.
+
+        Returns:
+            Dict[PageKey, List[WeaviateProperties]]: Documents of each requested page, keyed by the normalized key in request order.
+        """  # noqa: E501
+        requested = self._requested_pages(pages)
+        page_index = (
+            self.page_index
+            if self.use_page_index and self.page_index.is_built
+            else await asyncio.to_thread(self._get_page_index)
+        )
+        if page_index is None:
+            return await self._aquery_pages(requested)
+
+        grouped = page_index.get_many(requested)
+        missing = [page for page, docs in grouped.items() if not docs]
+        if missing:
+            self._merge_queried_pages(
+                page_index, grouped, await self._aquery_pages(missing)
+            )
+        return grouped
+
+    def build_page_index(self) -> int:
+        """
+        Build the page index from a single paged export of the collection.
+
+        The export fills a new index, swapped in only once complete, so
+        queries keep reading the previous index during a rebuild and never
+        see a partial one. If the collection does not exist, the index stays
+        unbuilt and pages are queried from the database.
+
+        Returns:
+            int: Number of chunks indexed.
+        """
+        with self._page_index_lock:
+            try:
+                print('Building page index...')
+                document_collection = self._get_collection()
+                if document_collection is None:
+                    print("[yellow]Collection 'Documents' not found.[/yellow]")
+                    return 0
+
+                page_index = PageIndex()
+                for doc in document_collection.iterator():
+                    page_index.add(doc.uuid, doc.properties)
+                page_index.is_built = True
+                self.page_index = page_index
+
+                print(
+                    f'[green]Page index built with {len(page_index)} chunks.[/green]'  # noqa: E501
+                )
+                return len(page_index)
+            except Exception as e:
+                self._handle_exception(e, 'Failed to build page index')
+                return 0
@@ -0,0 +1,248 @@
+from collections import OrderedDict
+from threading import RLock
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.embeddings import Embeddings
+from langchain_openai import OpenAIEmbeddings
+
+from mental_health_ai.rag.cache import normalize_query
+from mental_health_ai.settings import settings
+
+DEFAULT_LOCAL_EMBEDDING_MODEL = 'sentence-transformers/all-mpnet-base-v2'
+DEFAULT_OPENAI_EMBEDDING_MODEL = 'text-embedding-3-small'
+
+
+class SentenceTransformerEmbeddings(Embeddings):
+    """
+    Embeddings computed in-process with a sentence-transformers model.
+
+    Use the model of the `text2vec-transformers` container that vectorized
+    the collection, so query vectors live in the same space as the documents.
+
+    Attributes:
+        model_name (str): Name of the sentence-transformers model.
+    """
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_LOCAL_EMBEDDING_MODEL,
+        device: Optional[str] = None,
+    ):
+        # torch is slow to import and only this embedding mode needs it.
+        from sentence_transformers import SentenceTransformer  # noqa: PLC0415
+
+        self.model_name = model_name
+        self.model = SentenceTransformer(model_name, device=device)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.model.encode(
+            list(texts), normalize_embeddings=True, convert_to_numpy=True
+        ).tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+
+class CachedQueryEmbeddings(Embeddings):
+    """
+    Embeddings wrapper memoizing query embeddings in an LRU.
+
+    Queries are keyed by their normalized text (see `normalize_query`), so a
+    repeated question is embedded once, and a single instance can be shared
+    by the vector search and the semantic answer cache.
+
+    Attributes:
+        embeddings (Embeddings): The wrapped embeddings model.
+        max_size (int): Maximum number of cached query embeddings (default is 1024).
+        hits (int): Number of queries served from the cache.
+        misses (int): Number of queries embedded by the model.
+
+    Examples:
+        >>> embeddings = CachedQueryEmbeddings(SentenceTransformerEmbeddings())
+        >>> vector_db = WeaviateClient(query_embeddings=embeddings)
+    """  # noqa: E501
+
+    def __init__(self, embeddings: Embeddings, max_size: int = 1024):
+        self.embeddings = embeddings
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._vectors: OrderedDict[str, List[float]] = OrderedDict()
+        self._lock = RLock()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.embeddings.embed_documents(texts)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await self.embeddings.aembed_documents(texts)
+
+    def _get(self, key: str) -> Optional[List[float]]:
+        with self._lock:
+            vector = self._vectors.get(key)
+            if vector is None:
+                self.misses += 1
+                return None
+            self._vectors.move_to_end(key)
+            self.hits += 1
+            return vector
+
+    def _put(self, key: str, vector: List[float]) -> None:
+        with self._lock:
+            self._vectors[key] = vector
+            self._vectors.move_to_end(key)
+            while len(self._vectors) > self.max_size:
+                self._vectors.popitem(last=False)
+
+    def embed_query(self, text: str) -> List[float]:
+        key = normalize_query(text)
+        vector = self._get(key)
+        if vector is None:
+            vector = self.embeddings.embed_query(text)
+            self._put(key, vector)
+        return vector
+
+    async def aembed_query(self, text: str) -> List[float]:
+        key = normalize_query(text)
+        vector = self._get(key)
+        if vector is None:
+            vector = await self.embeddings.aembed_query(text)
+            self._put(key, vector)
+        return vector
+
+    def _lookup_many(
+        self, texts: List[str]
+    ) -> Tuple[List[str], Dict[str, Optional[List[float]]], List[str]]:
+        """Look up queries, returning their keys, cached vectors and missing texts."""  # noqa: E501
+        keys = [normalize_query(text) for text in texts]
+        texts_by_key: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            texts_by_key.setdefault(key, text)
+        vectors = {key: self._get(key) for key in texts_by_key}
+        missing = [
+            texts_by_key[key]
+            for key, vector in vectors.items()
+            if vector is None
+        ]
+        return keys, vectors, missing
+
+    def _store_many(
+        self,
+        vectors: Dict[str, Optional[List[float]]],
+        missing: List[str],
+        embedded: List[List[float]],
+    ) -> None:
+        for text, vector in zip(missing, embedded):
+            key = normalize_query(text)
+            self._put(key, vector)
+            vectors[key] = vector
+
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed many queries through the cache.
+
+        Repeated queries are looked up once and the missing ones are
+        embedded together in a single `embed_documents` call.
+
+        Args:
+            texts (List[str]): The queries to embed.
+
+        Returns:
+            List[List[float]]: The embedding of each query, in input order.
+        """
+        keys, vectors, missing = self._lookup_many(texts)
+        if missing:
+            self._store_many(
+                vectors, missing, self.embeddings.embed_documents(missing)
+            )
+        return [vectors[key] for key in keys]
+
+    async def aembed_queries(self, texts: List[str]) -> List[List[float]]:
+        """Asynchronously embed many queries through the cache, see `embed_queries`."""  # noqa: E501
+        keys, vectors, missing = self._lookup_many(texts)
+        if missing:
+            self._store_many(
+                vectors,
+                missing,
+                await self.embeddings.aembed_documents(missing),
+            )
+        return [vectors[key] for key in keys]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the hit and miss counters of the cache.
+
+        Returns:
+            Dict[str, Any]: Hits, misses, size and hit rate of the cache.
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._vectors),
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+
+def embed_queries(
+    embeddings: Embeddings, queries: List[str]
+) -> List[List[float]]:
+    """
+    Embed a batch of queries, through the query cache when there is one.
+
+    Args:
+        embeddings (Embeddings): The query embeddings, possibly a `CachedQueryEmbeddings`.
+        queries (List[str]): The queries to embed.
+
+    Returns:
+        List[List[float]]: The embedding of each query, in input order.
+    """  # noqa: E501
+    if isinstance(embeddings, CachedQueryEmbeddings):
+        return embeddings.embed_queries(queries)
+    return embeddings.embed_documents(queries)
+
+
+async def aembed_queries(
+    embeddings: Embeddings, queries: List[str]
+) -> List[List[float]]:
+    """Asynchronously embed a batch of queries, see `embed_queries`."""
+    if isinstance(embeddings, CachedQueryEmbeddings):
+        return await embeddings.aembed_queries(queries)
+    return await embeddings.aembed_documents(queries)
+
+
+def embedding_model_name(
+    local_embeddings: bool = settings.IS_LOCAL_EMBEDDING,
+    model_name: str = settings.QUERY_EMBEDDING_MODEL,
+) -> str:
+    """Get the embedding model of a mode, `model_name` or the mode default."""
+    if model_name:
+        return model_name
+    if local_embeddings:
+        return DEFAULT_LOCAL_EMBEDDING_MODEL
+    return DEFAULT_OPENAI_EMBEDDING_MODEL
+
+
+def create_query_embeddings(
+    local_embeddings: bool = settings.IS_LOCAL_EMBEDDING,
+    model_name: str = settings.QUERY_EMBEDDING_MODEL,
+    cache_size: int = settings.QUERY_EMBEDDING_CACHE_SIZE,
+) -> CachedQueryEmbeddings:
+    """
+    Create the in-process query embeddings matching the collection vectorizer.
+
+    Args:
+        local_embeddings (bool): Whether the collection uses `text2vec-transformers` instead of `text2vec-openai`.
+        model_name (str): Embedding model, it must be the one used by the vectorizer. Empty for the default of each mode.
+        cache_size (int): Maximum number of cached query embeddings.
+
+    Returns:
+        CachedQueryEmbeddings: The memoized query embeddings.
+    """  # noqa: E501
+    model_name = embedding_model_name(local_embeddings, model_name)
+    if local_embeddings:
+        embeddings = SentenceTransformerEmbeddings(model_name)
+    else:
+        embeddings = OpenAIEmbeddings(
+            model=model_name, api_key=settings.OPENAI_API_KEY
+        )
+    return CachedQueryEmbeddings(embeddings, max_size=cache_size)
@@ -1,6 +1,14 @@
+import asyncio
 from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
+from langchain_core.language_models import BaseChatModel
 from langchain_core.language_models.base import LanguageModelInput
+from langchain_core.messages import BaseMessage
+from rich import print
+
+LLM_ERROR_MESSAGE = 'Desculpe, ocorreu um erro ao gerar a resposta.'
+"""Answer returned in place of the response when the LLM fails."""
 
 
 class LLMInterface(ABC):
@@ -22,3 +30,161 @@ class LLMInterface(ABC):
             "Olá, estou bem, obrigado. Como posso ajudar?"
         """  # noqa: E501
         raise NotImplementedError
+
+    async def agenerate_response(self, messages: LanguageModelInput) -> str:
+        """Asynchronously generate a response from the LLM for the given list of messages.
+
+        Runs `generate_response` in a worker thread unless overridden.
+
+        Parameters:
+            messages (LanguageModelInput): The list of messages to generate a response for.
+
+        Returns:
+            str: The response generated by the LLM.
+        """  # noqa: E501
+        return await asyncio.to_thread(self.generate_response, messages)
+
+    def generate_responses(
+        self, messages_list: List[LanguageModelInput], max_concurrency: int = 4
+    ) -> List[str]:
+        """Generate the responses of many lists of messages, in input order.
+
+        Generates them one after another unless overridden.
+
+        Parameters:
+            messages_list (List[LanguageModelInput]): The lists of messages to generate responses for.
+            max_concurrency (int): Maximum number of responses generated at the same time.
+
+        Returns:
+            List[str]: The responses generated by the LLM.
+        """  # noqa: E501
+        return [self.generate_response(messages) for messages in messages_list]
+
+    async def agenerate_responses(
+        self, messages_list: List[LanguageModelInput], max_concurrency: int = 4
+    ) -> List[str]:
+        """Asynchronously generate the responses of many lists of messages, in input order.
+
+        Runs `agenerate_response` concurrently, at most `max_concurrency` at a
+        time, unless overridden.
+
+        Parameters:
+            messages_list (List[LanguageModelInput]): The lists of messages to generate responses for.
+            max_concurrency (int): Maximum number of responses generated at the same time.
+
+        Returns:
+            List[str]: The responses generated by the LLM.
+        """  # noqa: E501
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def generate(messages: LanguageModelInput) -> str:
+            async with semaphore:
+                return await self.agenerate_response(messages)
+
+        return list(
+            await asyncio.gather(
+                *(generate(messages) for messages in messages_list)
+            )
+        )
+
+    def count_tokens(self, text: str) -> int:  # noqa: PLR6301
+        """Count the tokens of a text with the tokenizer of the model.
+
+        Estimates four characters per token unless overridden.
+
+        Parameters:
+            text (str): The text to count.
+
+        Returns:
+            int: The number of tokens of the text.
+        """
+        return -(-len(text) // 4)
+
+    def prompt_cache_stats(self) -> Optional[Dict[str, Any]]:  # noqa: PLR6301
+        """Get the prompt tokens billed so far and how many were cached.
+
+        Returns None, for a model not reporting its prompt cache, unless
+        overridden.
+
+        Returns:
+            Optional[Dict[str, Any]]: Prompt tokens, cached prompt tokens and the cached ratio, or None.
+        """  # noqa: E501
+        return None
+
+    def stream_response(self, messages: LanguageModelInput) -> Iterator[str]:
+        """Stream the response from the LLM for the given list of messages as it is generated.
+
+        Yields the whole response at once unless overridden.
+
+        Parameters:
+            messages (LanguageModelInput): The list of messages to generate a response for.
+
+        Returns:
+            Iterator[str]: The pieces of the response, in order.
+        """  # noqa: E501
+        yield self.generate_response(messages)
+
+    async def astream_response(
+        self, messages: LanguageModelInput
+    ) -> AsyncIterator[str]:
+        """Asynchronously stream the response from the LLM for the given list of messages.
+
+        Yields the whole response at once unless overridden.
+
+        Parameters:
+            messages (LanguageModelInput): The list of messages to generate a response for.
+
+        Returns:
+            AsyncIterator[str]: The pieces of the response, in order.
+        """  # noqa: E501
+        yield await self.agenerate_response(messages)
+
+
+class ChatModelBatchMixin:
+    """Batch generation of an `LLMInterface` wrapping a LangChain chat model in `self.llm`.
+
+    The batch goes through `llm.batch` / `llm.abatch`, which run the requests
+    concurrently, and a failed request is answered with `LLM_ERROR_MESSAGE`
+    without failing the others. `_record_usage` is called with every other
+    response.
+
+    Examples:
+        >>> class OllamaLLM(ChatModelBatchMixin, LLMInterface): ...
+    """  # noqa: E501
+
+    llm: BaseChatModel
+
+    def _record_usage(self, response: BaseMessage) -> None:
+        """Record the usage of a response, nothing unless overridden."""
+
+    def _batch_contents(self, responses: list) -> List[str]:
+        """Get the content of batched responses, failed ones as the error message."""  # noqa: E501
+        contents = []
+        for response in responses:
+            if isinstance(response, Exception):
+                print(f'Error generating response: {response}')
+                contents.append(LLM_ERROR_MESSAGE)
+            else:
+                self._record_usage(response)
+                contents.append(response.content)
+        return contents
+
+    def generate_responses(
+        self, messages_list: List[LanguageModelInput], max_concurrency: int = 4
+    ) -> List[str]:
+        responses = self.llm.batch(
+            messages_list,
+            config={'max_concurrency': max_concurrency},
+            return_exceptions=True,
+        )
+        return self._batch_contents(responses)
+
+    async def agenerate_responses(
+        self, messages_list: List[LanguageModelInput], max_concurrency: int = 4
+    ) -> List[str]:
+        responses = await self.llm.abatch(
+            messages_list,
+            config={'max_concurrency': max_concurrency},
+            return_exceptions=True,
+        )
+        return self._batch_contents(responses)
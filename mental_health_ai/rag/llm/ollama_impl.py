@@ -1,15 +1,31 @@
+import math
+from typing import Any, AsyncIterator, Iterator, Optional
+
 from langchain_core.language_models.base import LanguageModelInput
 from langchain_ollama import ChatOllama
 
-from mental_health_ai.rag.llm.llm_interface import LLMInterface
+from mental_health_ai.rag.llm.llm_interface import (
+    LLM_ERROR_MESSAGE,
+    ChatModelBatchMixin,
+    LLMInterface,
+)
 from mental_health_ai.settings import settings
 
+CONSERVATIVE_CHARS_PER_TOKEN = 2.5
+"""Characters per token assumed without a tokenizer, few enough for Portuguese."""  # noqa: E501
+
 
-class OllamaLLM(LLMInterface):
+class OllamaLLM(ChatModelBatchMixin, LLMInterface):
     """Implementation of the LLMInterface using the Ollama language model.
 
+    Tokens are counted with the Hugging Face tokenizer `tokenizer_name`,
+    which must be the tokenizer of the Ollama model. Without it, they are
+    overestimated at `CONSERVATIVE_CHARS_PER_TOKEN` characters per token, so
+    the context stays within the context window of the model.
+
     Attributes:
         model_name (str): The name of the language model to use.
+        tokenizer_name (str): Hugging Face tokenizer of the model, empty to estimate the tokens.
 
     Examples:
         >>> llm = OllamaLLM()
@@ -22,9 +38,22 @@ class OllamaLLM(LLMInterface):
     def __init__(
         self,
         model_name: str = settings.LLM_MODEL_NAME,
+        tokenizer_name: str = settings.OLLAMA_TOKENIZER,
     ):
         self.model_name = model_name
         self.llm = ChatOllama(model=self.model_name)
+        self.tokenizer_name = tokenizer_name
+        self.tokenizer: Optional[Any] = None
+        if tokenizer_name:
+            # transformers is slow to import and only this mode needs it.
+            from transformers import AutoTokenizer  # noqa: PLC0415
+
+            self.tokenizer = AutoTokenizer.from_pretrained(tokenizer_name)
+
+    def count_tokens(self, text: str) -> int:
+        if self.tokenizer is None:
+            return math.ceil(len(text) / CONSERVATIVE_CHARS_PER_TOKEN)
+        return len(self.tokenizer.encode(text, add_special_tokens=False))
 
     def generate_response(self, messages: LanguageModelInput) -> str:
         try:
@@ -32,4 +61,32 @@ class OllamaLLM(LLMInterface):
             return response.content
         except Exception as e:
             print(f'Error generating response: {e}')
-            return 'Desculpe, ocorreu um erro ao gerar a resposta.'
+            return LLM_ERROR_MESSAGE
+
+    async def agenerate_response(self, messages: LanguageModelInput) -> str:
+        try:
+            response = await self.llm.ainvoke(messages)
+            return response.content
+        except Exception as e:
+            print(f'Error generating response: {e}')
+            return LLM_ERROR_MESSAGE
+
+    def stream_response(self, messages: LanguageModelInput) -> Iterator[str]:
+        try:
+            for chunk in self.llm.stream(messages):
+                if chunk.content:
+                    yield chunk.content
+        except Exception as e:
+            print(f'Error generating response: {e}')
+            yield LLM_ERROR_MESSAGE
+
+    async def astream_response(
+        self, messages: LanguageModelInput
+    ) -> AsyncIterator[str]:
+        try:
+            async for chunk in self.llm.astream(messages):
+                if chunk.content:
+                    yield chunk.content
+        except Exception as e:
+            print(f'Error generating response: {e}')
+            yield LLM_ERROR_MESSAGE
@@ -1,15 +1,26 @@
+from threading import Lock
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
+
 from langchain_core.language_models.base import LanguageModelInput
+from langchain_core.messages import BaseMessage
 from langchain_openai import ChatOpenAI
+from rich import print
 
-from mental_health_ai.rag.llm.llm_interface import LLMInterface
+from mental_health_ai.rag.llm.llm_interface import (
+    LLM_ERROR_MESSAGE,
+    ChatModelBatchMixin,
+    LLMInterface,
+)
 from mental_health_ai.settings import settings
 
 
-class OpenAILLM(LLMInterface):
+class OpenAILLM(ChatModelBatchMixin, LLMInterface):
     """Implementation of the LLMInterface using the OpenAI language model.
 
     Attributes:
         model_name (str): The name of the language model to use.
+        prompt_tokens (int): Prompt tokens billed so far.
+        cached_prompt_tokens (int): Prompt tokens served from the OpenAI prompt cache so far.
 
     Examples:
         >>> llm = OpenAIModel()
@@ -28,12 +39,94 @@ class OpenAILLM(LLMInterface):
         self.api_key = settings.OPENAI_API_KEY
         if use_auth_token and not self.api_key:
             raise ValueError('API key for OpenAI is required!')
-        self.llm = ChatOpenAI(model=self.model_name, api_key=self.api_key)
+        # Streams only report the token usage, in their last chunk, on request.
+        self.llm = ChatOpenAI(
+            model=self.model_name, api_key=self.api_key, stream_usage=True
+        )
+        self.prompt_tokens = 0
+        self.cached_prompt_tokens = 0
+        self._usage_lock = Lock()
+
+    @staticmethod
+    def _cached_tokens(response: BaseMessage) -> int:
+        """Get the prompt tokens of a response read from the prompt cache."""
+        details = (response.usage_metadata or {}).get('input_token_details')
+        if details and details.get('cache_read') is not None:
+            return details['cache_read']
+        token_usage = response.response_metadata.get('token_usage') or {}
+        return (token_usage.get('prompt_tokens_details') or {}).get(
+            'cached_tokens'
+        ) or 0
+
+    def _record_usage(self, response: BaseMessage) -> None:
+        """Count the prompt tokens of a response and how many were cached."""
+        if not response.usage_metadata:
+            return
+        prompt_tokens = response.usage_metadata.get('input_tokens', 0)
+        cached_tokens = self._cached_tokens(response)
+        with self._usage_lock:
+            self.prompt_tokens += prompt_tokens
+            self.cached_prompt_tokens += cached_tokens
+        print(
+            f'[cyan]Prompt: {prompt_tokens} tokens, {cached_tokens} cached.[/cyan]'  # noqa: E501
+        )
+
+    def prompt_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the prompt tokens billed so far and how many were cached.
+
+        Returns:
+            Optional[Dict[str, Any]]: Prompt tokens, cached prompt tokens and the cached ratio.
+        """  # noqa: E501
+        return {
+            'prompt_tokens': self.prompt_tokens,
+            'cached_prompt_tokens': self.cached_prompt_tokens,
+            'hit_rate': self.cached_prompt_tokens / self.prompt_tokens
+            if self.prompt_tokens
+            else 0.0,
+        }
 
     def generate_response(self, messages: LanguageModelInput) -> str:
         try:
             response = self.llm.invoke(messages)
+            self._record_usage(response)
+            return response.content
+        except Exception as e:
+            print(f'Error generating response: {e}')
+            return LLM_ERROR_MESSAGE
+
+    async def agenerate_response(self, messages: LanguageModelInput) -> str:
+        try:
+            response = await self.llm.ainvoke(messages)
+            self._record_usage(response)
             return response.content
         except Exception as e:
             print(f'Error generating response: {e}')
-            return 'Desculpe, ocorreu um erro ao gerar a resposta.'
+            return LLM_ERROR_MESSAGE
+
+    def count_tokens(self, text: str) -> int:
+        return self.llm.get_num_tokens(text)
+
+    def stream_response(self, messages: LanguageModelInput) -> Iterator[str]:
+        try:
+            for chunk in self.llm.stream(messages):
+                if chunk.usage_metadata:
+                    self._record_usage(chunk)
+                if chunk.content:
+                    yield chunk.content
+        except Exception as e:
+            print(f'Error generating response: {e}')
+            yield LLM_ERROR_MESSAGE
+
+    async def astream_response(
+        self, messages: LanguageModelInput
+    ) -> AsyncIterator[str]:
+        try:
+            async for chunk in self.llm.astream(messages):
+                if chunk.usage_metadata:
+                    self._record_usage(chunk)
+                if chunk.content:
+                    yield chunk.content
+        except Exception as e:
+            print(f'Error generating response: {e}')
+            yield LLM_ERROR_MESSAGE
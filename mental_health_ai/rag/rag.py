@@ -1,7 +1,56 @@
+from typing import AsyncIterator, Optional
+
+import numpy as np
 from rich import print
 
-from mental_health_ai.rag.database.db_interface import DatabaseInterface
-from mental_health_ai.rag.llm.llm_interface import LLMInterface
+from mental_health_ai.rag.cache import (
+    CachedAnswer,
+    RetrievalCache,
+    SemanticCache,
+    normalize_query,
+)
+from mental_health_ai.rag.context import (
+    ContextBlock,
+    pack_context,
+    page_overhead,
+    render_context,
+    source_overhead,
+)
+from mental_health_ai.rag.database.db_interface import (
+    DatabaseInterface,
+    PageKey,
+)
+from mental_health_ai.rag.database.health import HealthMonitor
+from mental_health_ai.rag.llm.llm_interface import (
+    LLM_ERROR_MESSAGE,
+    LLMInterface,
+)
+from mental_health_ai.settings import settings
+
+CONTEXT_TYPES = ('dsm-5', 'article')
+"""Types of the documents expanded into the context, in context order."""
+
+NO_CONTEXT_MESSAGE = (
+    'Desculpe, não encontrei informações sobre essa pergunta na base de dados.'
+)
+"""Answer of a batched query without documents or context."""
+
+SYSTEM_PROMPT = """Papel: Você é um chatbot especializado em saúde mental que receberá um contexto com informações confiáveis relacionadas à pergunta do usuário, provenientes de uma base de dados vetorial.
+Regras:
+    - Você não é um profissional de saúde e não pode fornecer diagnósticos ou tratamentos;
+    - O conteúdo fornecido pode estar segmentado e fora de ordem; ao responder, organize as informações de forma coerente e cite a fonte de forma humanizada e fácil de entender (ex.: não apenas o nome do pdf, mas sim o nome do artigo/livro/...);
+    - O contexto lista as fontes uma única vez, numeradas, e cada trecho indica a sua fonte e página no formato [fonte, p. página];
+    - Você pode utilizar o contexto para fornecer informações embasadas e verdadeiras. Caso o contexto não seja suficiente, você deve informar ao usuário, mas nunca inventar informações;
+    - Detalhe bem suas respostas, mas mantenha-as certas, não invente informações.
+    - Ao final de todas as respostas, mencione as fontes utilizadas para a resposta. No caso de artigos, mencione o nome do artigo e outras informações relevantes para que o usuário possa acessar a fonte original.
+    - Apenas referencie na resposta os contextos passados dentro da tag <contexto>. E caso o contexto seja de um artigo e o texto cite uma referência, não cite-a como se tivesse acesso à ela pois você só conhece o texto passado na tag contexto.
+    - Ao citar as fontes no final da pergunta, apenas cite as que realmente foram úteis para o texto."""  # noqa: E501
+"""Instructions sent first and unchanged in every prompt, so providers can
+cache the prompt prefix (OpenAI prompt caching, Ollama KV cache)."""
+
+
+class NoContextFoundError(Exception):
+    """Raised when none of the retrieved documents has a page to expand."""
 
 
 class RAGFactory:
@@ -13,6 +62,10 @@ class RAGFactory:
     Attributes:
         vector_db (DatabaseInterface): The vector database instance used for retrieving relevant documents.
         llm (LLMInterface): The language model instance used for generating responses.
+        health_monitor (Optional[HealthMonitor]): Monitor whose cached status replaces the `verify_database` call on every query, if given.
+        answer_cache (Optional[SemanticCache]): Cache serving the stored answer of semantically similar queries, if given.
+        retrieval_cache (Optional[RetrievalCache]): Cache serving the documents and context of repeated queries, if given.
+        context_token_budget (Optional[int]): Maximum number of tokens of the context, counted with the tokenizer of the LLM. None for no limit.
 
     Examples:
         >>> from mental_health_ai.rag.database.weaviate_impl import WeaviateClient
@@ -25,214 +78,702 @@ class RAGFactory:
         >>> print(f'Response: {response}')
     """  # noqa: E501
 
-    def __init__(self, vector_db: DatabaseInterface, llm: LLMInterface):
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        vector_db: DatabaseInterface,
+        llm: LLMInterface,
+        health_monitor: Optional[HealthMonitor] = None,
+        answer_cache: Optional[SemanticCache] = None,
+        retrieval_cache: Optional[RetrievalCache] = None,
+        context_token_budget: Optional[int] = settings.CONTEXT_TOKEN_BUDGET,
+    ):
         self.vector_db = vector_db
         self.llm = llm
+        self.health_monitor = health_monitor
+        self.answer_cache = answer_cache
+        self.retrieval_cache = retrieval_cache
+        self.context_token_budget = context_token_budget
+
+    def _is_database_available(self) -> bool:
+        """Check the database, from the cached health status if monitored."""
+        if self.health_monitor is not None:
+            return self.health_monitor.is_ready
+        return self.vector_db.verify_database()
+
+    async def _ais_database_available(self) -> bool:
+        """Asynchronously check the database, from the cached health status if monitored."""  # noqa: E501
+        if self.health_monitor is not None:
+            return self.health_monitor.is_ready
+        return await self.vector_db.averify_database()
 
     @staticmethod
-    def _get_documents_by_contexts(documents: list) -> tuple[list, list]:
+    def _get_context_page_keys(documents: list) -> list[PageKey]:
         """
-        Categorize documents by their types (DSM-5 and articles).
+        Get the unique keys of the pages to expand, in relevance order.
 
         Args:
-            documents (list): List of retrieved documents.
+            documents (list): List of retrieved documents, most relevant first.
 
         Returns:
-            tuple[list, list]: A tuple containing two lists:
-                - dsm5_docs: Documents of type 'DSM-5'.
-                - articles: Documents of type 'article'.
+            list[PageKey]: (type, source, page_number) keys of the DSM-5 and article pages, fetched together in one bulk call.
+        """  # noqa: E501
+        page_keys = []
+        for doc in documents:
+            metadata = doc.properties['metadata']
+            doc_type = metadata.get('type', '').lower()
+            if doc_type not in CONTEXT_TYPES:
+                continue
+            if metadata.get('page_number') is None:
+                continue
+            page_keys.append((
+                doc_type,
+                metadata.get('source'),
+                int(metadata['page_number']),
+            ))
+        return list(dict.fromkeys(page_keys))
+
+    def _build_context_blocks(
+        self, page_keys: list[PageKey], pages: dict[PageKey, list]
+    ) -> list[ContextBlock]:
         """
-        dsm5_docs = [
-            doc
-            for doc in documents
-            if doc.properties['metadata'].get('type', '').lower() == 'dsm-5'
-        ]
+        Build a block of each of the given pages from its prefetched chunks.
 
-        articles = [
-            doc
-            for doc in documents
-            if doc.properties['metadata'].get('type', '').lower() == 'article'
-        ]
+        Args:
+            page_keys (list[PageKey]): Keys of the pages, in relevance order.
+            pages (dict[PageKey, list]): Chunks of each page, as returned by `get_documents_by_pages`.
+
+        Returns:
+            list[ContextBlock]: Block of each page that has documents, with the tokens of its formatting.
+        """  # noqa: E501
+        blocks = []
+        for page_key in page_keys:
+            _, source, page_number = page_key
+            all_docs_for_page = pages.get(page_key, [])
+            if not all_docs_for_page:
+                print(
+                    f'[yellow]No documents found for page {page_number} of {source}.[/yellow]'  # noqa: E501
+                )
+                continue
 
-        return dsm5_docs, articles
+            first_doc = all_docs_for_page[0]
+            blocks.append(
+                ContextBlock(
+                    key=page_key,
+                    document=first_doc,
+                    chunks=[
+                        doc.properties.get('page_content', '')
+                        for doc in all_docs_for_page
+                    ],
+                    overhead=page_overhead(
+                        self.llm.count_tokens, len(page_keys), page_number
+                    ),
+                    source_overhead=source_overhead(
+                        self.llm.count_tokens, first_doc, len(page_keys)
+                    ),
+                )
+            )
+        return blocks
 
     @staticmethod
-    def _format_document_context_single(doc, content: str) -> str:
+    def _render_context(blocks: list[ContextBlock]) -> str:
+        """
+        Format the packed pages, DSM-5 pages first and then articles.
+
+        Pages are sorted by source and then page number instead of relevance,
+        so the same pages always render to the same text, and sources are
+        described once with a compact `[source, p. page]` reference on each
+        page (see `render_context`).
+
+        Args:
+            blocks (list[ContextBlock]): Pages selected by `pack_context`.
+
+        Returns:
+            str: The context sent to the LLM.
+        """
+        return render_context(
+            sorted(
+                blocks,
+                key=lambda block: (
+                    CONTEXT_TYPES.index(block.key[0]),
+                    block.key[1] or '',
+                    block.key[2],
+                ),
+            )
+        )
+
+    def _combine_contexts(
+        self, documents: list, pages: dict[PageKey, list]
+    ) -> str:
         """
-        Format a single document's content and metadata into a string.
+        Pack the pages of the retrieved documents into the token budget.
+
+        Pages are added in relevance order, so with a large `top_k` the
+        least relevant pages are the ones truncated or left out, and the
+        context never exceeds `context_token_budget`.
 
         Args:
-            doc: A document object.
-            content (str): The concatenated content for the page.
+            documents (list): List of retrieved documents.
+            pages (dict[PageKey, list]): Prefetched chunks of the pages.
 
         Returns:
-            str: Formatted string containing the document's content and metadata.
+            str: Combined context from all document types.
+
+        Raises:
+            NoContextFoundError: If no context is found.
         """  # noqa: E501
-        title = doc.properties.get('title', 'No Title')
-        metadata = doc.properties.get('metadata', {})
-        page_number = metadata.get('page_number', 'N/A')
-        source = metadata.get('source', 'N/A')
-        source_description = metadata.get('source_description', 'N/A')
-        metadata = doc.properties.get('metadata', {})
-
-        formatted_context = (
-            f'Título: {title}\n'
-            f'Número da página: {page_number}\n'
-            f'Fonte: {source}\n'
-            f'Descrição da fonte: {source_description}\n'
-            f'Metadados: {metadata}\n'
-            f'Content:\n{content}\n'
-            '---------------------\n'
+        packed = pack_context(
+            self._build_context_blocks(
+                self._get_context_page_keys(documents), pages
+            ),
+            self.context_token_budget,
+            self.llm.count_tokens,
         )
 
-        return formatted_context
+        if not packed.blocks:
+            print('[red]Nenhum contexto encontrado![/red]')
+            raise NoContextFoundError('No context found.')
+
+        print(
+            f'Contexto: {packed.tokens} tokens em {len(packed.blocks)} páginas ({packed.dropped_chunks} trechos descartados).'  # noqa: E501
+        )
+        return self._render_context(packed.blocks)
 
-    def _gather_dsm5_context(self, dsm5_docs: list) -> str:
+    def _handle_contexts(self, documents: list) -> str:
         """
-        Gather context from DSM-5 documents.
+        Handle contexts for all types of documents.
 
         Args:
-            dsm5_docs (list): List of DSM-5 documents.
+            documents (list): List of retrieved documents.
 
         Returns:
-            str: Combined context from DSM-5 documents.
+            str: Combined context from all document types.
 
         Raises:
-            Exception: If no DSM-5 context is found.
+            NoContextFoundError: If no context is found.
         """
-        if not dsm5_docs:
-            print('[red]Nenhum documento DSM-5 encontrado![/red]')
-            raise Exception('No DSM-5 documents found.')
-
-        page_numbers = {
-            doc.properties['metadata'].get('page_number')
-            for doc in dsm5_docs
-            if doc.properties['metadata'].get('page_number') is not None
-        }
+        pages = self.vector_db.get_documents_by_pages(
+            self._get_context_page_keys(documents)
+        )
+        return self._combine_contexts(documents, pages)
 
-        full_context = []
+    async def _ahandle_contexts(self, documents: list) -> str:
+        """
+        Asynchronously handle contexts for all types of documents.
 
-        for page_number in page_numbers:
-            all_docs_for_page = (
-                self.vector_db.get_documents_by_type_and_page_number(
-                    doc_type='dsm-5', page_number=page_number
-                )
-            )
+        Args:
+            documents (list): List of retrieved documents.
 
-            if not all_docs_for_page:
-                print(
-                    f'[yellow]No documents found for page {page_number}.[/yellow]'  # noqa: E501
-                )
-                continue
+        Returns:
+            str: Combined context from all document types.
 
-            concatenated_content = '\n'.join(
-                doc.properties.get('page_content', '')
-                for doc in all_docs_for_page
-            )
+        Raises:
+            NoContextFoundError: If no context is found.
+        """
+        pages = await self.vector_db.aget_documents_by_pages(
+            self._get_context_page_keys(documents)
+        )
+        return self._combine_contexts(documents, pages)
 
-            first_doc = all_docs_for_page[0]
-            formatted_context = self._format_document_context_single(
-                doc=first_doc, content=concatenated_content
-            )
-            full_context.append(formatted_context)
+    @staticmethod
+    def _build_messages(query: str, context: str) -> list[tuple[str, str]]:
+        """
+        Build the messages sent to the LLM from the query and its context.
+
+        The static `SYSTEM_PROMPT` comes first and the variable context and
+        query only in the human message, so every prompt shares the same
+        prefix.
 
-        if not full_context:
-            print('[red]Nenhum contexto DSM-5 encontrado![/red]')
-            raise Exception('No DSM-5 context found.')
+        Args:
+            query (str): The user query.
+            context (str): Combined context from the retrieved documents.
 
-        return '\n'.join(full_context)
+        Returns:
+            list[tuple[str, str]]: The system and human messages.
+        """
+        return [
+            ('system', SYSTEM_PROMPT),
+            (
+                'human',
+                f'<contexto>{context}</contexto>\n\nPergunta: {query}\n\nResposta:',  # noqa: E501
+            ),
+        ]
 
-    def _gather_article_context(self, article_docs: list) -> str:
+    def _embed_query(self, query: str) -> Optional[np.ndarray]:
+        """Embed a query for the semantic cache, if there is one."""
+        if self.answer_cache is None:
+            return None
+        return self.answer_cache.embed(query)
+
+    def _embed_queries(self, queries: list[str]) -> list[Optional[np.ndarray]]:
+        """Embed many queries in one batch for the semantic cache, if there is one."""  # noqa: E501
+        if self.answer_cache is None:
+            return [None] * len(queries)
+        return self.answer_cache.embed_many(queries)
+
+    def _lookup_answer(
+        self, vector: Optional[np.ndarray], top_k: int, corpus_version: int
+    ) -> Optional[CachedAnswer]:
         """
-        Gather context from articles.
+        Look up the answer of a similar query in the semantic cache.
 
         Args:
-            article_docs (list): List of article documents.
+            vector (Optional[np.ndarray]): Normalized embedding of the query.
+            top_k (int): The number of documents to retrieve from the database.
+            corpus_version (int): Version of the corpus when the query arrived.
 
         Returns:
-            str: Combined context from article documents.
-        """
-        if not article_docs:
-            print('[red]Nenhum documento de artigo encontrado![/red]')
-            raise Exception('No article documents found.')
+            Optional[CachedAnswer]: The cached answer, or None on a miss or without a cache.
+        """  # noqa: E501
+        if self.answer_cache is None:
+            return None
+
+        cached = self.answer_cache.lookup(vector, top_k, corpus_version)
+        if cached is not None:
+            print(f'[green]Resposta servida do cache: {cached.query}[/green]')
+        return cached
+
+    def _store_answer(  # noqa: PLR0913, PLR0917
+        self,
+        vector: Optional[np.ndarray],
+        query: str,
+        response: str,
+        retrieved_documents: list,
+        top_k: int,
+        corpus_version: int,
+    ) -> None:
+        """Store a generated answer in the semantic cache, unless the LLM failed."""  # noqa: E501
+        if self.answer_cache is None or response.endswith(LLM_ERROR_MESSAGE):
+            return
+
+        self.answer_cache.store(
+            vector, query, response, retrieved_documents, top_k, corpus_version
+        )
 
-        article_and_page = {
-            (
-                doc.properties['metadata'].get('source'),
-                doc.properties['metadata'].get('page_number'),
+    def _lookup_retrieval(
+        self, query: str, top_k: int, corpus_version: int
+    ) -> Optional[tuple[str, list]]:
+        """Look up the context and documents of a query in the retrieval cache."""  # noqa: E501
+        if self.retrieval_cache is None:
+            return None
+        return self.retrieval_cache.get(query, top_k, corpus_version)
+
+    def _store_retrieval(  # noqa: PLR0913, PLR0917
+        self,
+        query: str,
+        top_k: int,
+        corpus_version: int,
+        context: str,
+        retrieved_documents: list,
+    ) -> None:
+        """Store the context and documents of a query in the retrieval cache."""  # noqa: E501
+        if self.retrieval_cache is not None:
+            self.retrieval_cache.put(
+                query, top_k, corpus_version, context, retrieved_documents
             )
-            for doc in article_docs
-        }
 
-        full_context = []
+    def _retrieve_context(
+        self, query: str, top_k: int, corpus_version: int
+    ) -> tuple[str, list]:
+        """
+        Retrieve the documents of a query and assemble their context.
+
+        Args:
+            query (str): The query to retrieve documents for.
+            top_k (int): The number of documents to retrieve from the database.
+            corpus_version (int): Version of the corpus when the query arrived.
 
-        for source, page_number in article_and_page:
-            all_docs_for_page = (
-                self.vector_db.get_documents_by_type_and_page_number(
-                    doc_type='article', page_number=page_number, source=source
-                )
+        Returns:
+            tuple[str, list]: The combined context and the list of retrieved documents.
+
+        Raises:
+            Exception: If the database is not available or no documents are found.
+        """  # noqa: E501
+        cached = self._lookup_retrieval(query, top_k, corpus_version)
+        if cached is not None:
+            return cached
+
+        if not self._is_database_available():
+            print('[red]O banco de dados não está disponível![/red]')
+            raise Exception('Database not available or empty.')
+
+        retrieved_documents = self.vector_db.search(query, limit=top_k)
+
+        if not retrieved_documents:
+            print('[red]Nenhum documento encontrado![/red]')
+            raise Exception('No documents found.')  # noqa: E501
+
+        context = self._handle_contexts(retrieved_documents)
+        self._store_retrieval(
+            query, top_k, corpus_version, context, retrieved_documents
+        )
+        return context, retrieved_documents
+
+    async def _aretrieve_context(
+        self, query: str, top_k: int, corpus_version: int
+    ) -> tuple[str, list]:
+        """Asynchronous version of `_retrieve_context`."""
+        cached = self._lookup_retrieval(query, top_k, corpus_version)
+        if cached is not None:
+            return cached
+
+        if not await self._ais_database_available():
+            print('[red]O banco de dados não está disponível![/red]')
+            raise Exception('Database not available or empty.')
+
+        retrieved_documents = await self.vector_db.asearch(query, limit=top_k)
+
+        if not retrieved_documents:
+            print('[red]Nenhum documento encontrado![/red]')
+            raise Exception('No documents found.')  # noqa: E501
+
+        context = await self._ahandle_contexts(retrieved_documents)
+        self._store_retrieval(
+            query, top_k, corpus_version, context, retrieved_documents
+        )
+        return context, retrieved_documents
+
+    def generate_response(
+        self, query: str, top_k: int = 5
+    ) -> tuple[str, list]:
+        """
+        Generates a response to a given query using the RAG model.
+
+        Args:
+            query (str): The query to generate a response for.
+            top_k (int, optional): The number of documents to retrieve from the database. Defaults to 5.
+
+        Returns:
+            tuple[str, list]: The response generated by the RAG model and the list of retrieved documents.
+
+        Raises:
+            Exception: If the database is not available or no documents are found.
+        """  # noqa: E501
+        corpus_version = self.vector_db.corpus_version
+        vector = self._embed_query(query)
+        cached = self._lookup_answer(vector, top_k, corpus_version)
+        if cached is not None:
+            return cached.response, cached.source_documents
+
+        context, retrieved_documents = self._retrieve_context(
+            query, top_k, corpus_version
+        )
+        print(f'Context: {context}')
+
+        messages = self._build_messages(query, context)
+        response = self.llm.generate_response(messages)
+        self._store_answer(
+            vector, query, response, retrieved_documents, top_k, corpus_version
+        )
+        return response, retrieved_documents
+
+    @staticmethod
+    def _unique_queries(queries: list[str]) -> dict[str, str]:
+        """Map each normalized query of a batch to its first spelling."""
+        unique: dict[str, str] = {}
+        for query in queries:
+            unique.setdefault(normalize_query(query), query)
+        return unique
+
+    def _lookup_answers(
+        self,
+        unique: dict[str, str],
+        vectors: dict[str, Optional[np.ndarray]],
+        top_k: int,
+        corpus_version: int,
+    ) -> dict[str, tuple[str, list]]:
+        """Look up the cached answers of a batch, keyed by normalized query."""
+        answers = {}
+        for key in unique:
+            cached = self._lookup_answer(vectors[key], top_k, corpus_version)
+            if cached is not None:
+                answers[key] = (cached.response, cached.source_documents)
+        return answers
+
+    def _split_retrieval_misses(
+        self, pending: dict[str, str], top_k: int, corpus_version: int
+    ) -> tuple[dict[str, Optional[tuple[str, list]]], dict[str, str]]:
+        """Split a batch into cached retrievals and queries to search."""
+        contexts: dict[str, Optional[tuple[str, list]]] = {}
+        misses = {}
+        for key, query in pending.items():
+            cached = self._lookup_retrieval(query, top_k, corpus_version)
+            if cached is not None:
+                contexts[key] = cached
+            else:
+                misses[key] = query
+        return contexts, misses
+
+    def _get_batch_page_keys(self, searches: list[list]) -> list[PageKey]:
+        """Merge the page keys of every search of a batch, without duplicates."""  # noqa: E501
+        return list(
+            dict.fromkeys(
+                key
+                for documents in searches
+                for key in self._get_context_page_keys(documents)
             )
+        )
 
-            if not all_docs_for_page:
-                print(
-                    f'[yellow]No documents found for page {page_number} of {source}.[/yellow]'  # noqa: E501
-                )
+    def _build_batch_contexts(  # noqa: PLR0913, PLR0917
+        self,
+        misses: dict[str, str],
+        searches: list[list],
+        pages: dict[PageKey, list],
+        top_k: int,
+        corpus_version: int,
+    ) -> dict[str, Optional[tuple[str, list]]]:
+        """
+        Assemble the context of each searched query of a batch from the shared pages.
+
+        Args:
+            misses (dict[str, str]): Searched queries, keyed by normalized query.
+            searches (list[list]): Retrieved documents of each searched query, in the same order.
+            pages (dict[PageKey, list]): Chunks of the pages of every query, fetched together.
+            top_k (int): The number of documents retrieved per query.
+            corpus_version (int): Version of the corpus when the batch arrived.
+
+        Returns:
+            dict[str, Optional[tuple[str, list]]]: Context and documents of each query, None if nothing was found.
+        """  # noqa: E501
+        contexts: dict[str, Optional[tuple[str, list]]] = {}
+        for (key, query), documents in zip(misses.items(), searches):
+            contexts[key] = None
+            if not documents:
+                print(f'[red]Nenhum documento encontrado: {query}[/red]')
+                continue
+            try:
+                context = self._combine_contexts(documents, pages)
+            except NoContextFoundError:
+                print(f'[red]Nenhum contexto encontrado: {query}[/red]')
                 continue
 
-            concatenated_content = '\n'.join(
-                doc.properties.get('page_content', '')
-                for doc in all_docs_for_page
+            contexts[key] = (context, documents)
+            self._store_retrieval(
+                query, top_k, corpus_version, context, documents
             )
+        return contexts
 
-            first_doc = all_docs_for_page[0]
-            formatted_context = self._format_document_context_single(
-                doc=first_doc, content=concatenated_content
+    def _retrieve_contexts(
+        self, pending: dict[str, str], top_k: int, corpus_version: int
+    ) -> dict[str, Optional[tuple[str, list]]]:
+        """
+        Retrieve the contexts of a batch with one search call and one page lookup.
+
+        Args:
+            pending (dict[str, str]): Queries keyed by normalized query.
+            top_k (int): The number of documents to retrieve per query.
+            corpus_version (int): Version of the corpus when the batch arrived.
+
+        Returns:
+            dict[str, Optional[tuple[str, list]]]: Context and documents of each query, None if nothing was found.
+
+        Raises:
+            Exception: If the database is not available.
+        """  # noqa: E501
+        contexts, misses = self._split_retrieval_misses(
+            pending, top_k, corpus_version
+        )
+        if not misses:
+            return contexts
+
+        if not self._is_database_available():
+            print('[red]O banco de dados não está disponível![/red]')
+            raise Exception('Database not available or empty.')
+
+        searches = self.vector_db.search_many(list(misses.values()), top_k)
+        pages = self.vector_db.get_documents_by_pages(
+            self._get_batch_page_keys(searches)
+        )
+        contexts.update(
+            self._build_batch_contexts(
+                misses, searches, pages, top_k, corpus_version
             )
-            full_context.append(formatted_context)
+        )
+        return contexts
+
+    async def _aretrieve_contexts(
+        self, pending: dict[str, str], top_k: int, corpus_version: int
+    ) -> dict[str, Optional[tuple[str, list]]]:
+        """Asynchronous version of `_retrieve_contexts`."""
+        contexts, misses = self._split_retrieval_misses(
+            pending, top_k, corpus_version
+        )
+        if not misses:
+            return contexts
 
-        if not full_context:
-            print('[red]Nenhum contexto de artigos encontrado![/red]')
-            raise Exception('No article context found.')
+        if not await self._ais_database_available():
+            print('[red]O banco de dados não está disponível![/red]')
+            raise Exception('Database not available or empty.')
 
-        return '\n'.join(full_context)
+        searches = await self.vector_db.asearch_many(
+            list(misses.values()), top_k
+        )
+        pages = await self.vector_db.aget_documents_by_pages(
+            self._get_batch_page_keys(searches)
+        )
+        contexts.update(
+            self._build_batch_contexts(
+                misses, searches, pages, top_k, corpus_version
+            )
+        )
+        return contexts
 
-    def _handle_contexts(self, documents: list) -> str:
+    def generate_responses(
+        self, queries: list[str], top_k: int = 5, max_concurrency: int = 4
+    ) -> list[tuple[str, list]]:
         """
-        Handle contexts for all types of documents.
+        Generates the responses of many queries, sharing the retrieval work.
+
+        Identical queries (after `normalize_query`) are answered once, the
+        vector searches are batched, the pages of every query are fetched in
+        a single lookup and the LLM calls run `max_concurrency` at a time.
+        Queries without documents are answered with `NO_CONTEXT_MESSAGE`.
 
         Args:
-            documents (list): List of retrieved documents.
+            queries (list[str]): The queries to generate responses for.
+            top_k (int, optional): The number of documents to retrieve per query. Defaults to 5.
+            max_concurrency (int, optional): Maximum number of concurrent LLM calls. Defaults to 4.
 
         Returns:
-            str: Combined context from all document types.
+            list[tuple[str, list]]: The response and the retrieved documents of each query, in input order.
 
         Raises:
-            Exception: If no context is found.
+            Exception: If the database is not available.
+        """  # noqa: E501
+        corpus_version = self.vector_db.corpus_version
+        unique = self._unique_queries(queries)
+        vectors = dict(zip(unique, self._embed_queries(list(unique.values()))))
+        results = self._lookup_answers(unique, vectors, top_k, corpus_version)
+
+        pending = {
+            key: query for key, query in unique.items() if key not in results
+        }
+        contexts = self._retrieve_contexts(pending, top_k, corpus_version)
+        answered = [key for key in pending if contexts[key] is not None]
+        responses = self.llm.generate_responses(
+            [
+                self._build_messages(unique[key], contexts[key][0])
+                for key in answered
+            ],
+            max_concurrency=max_concurrency,
+        )
+
+        for key, response in zip(answered, responses):
+            retrieved_documents = contexts[key][1]
+            self._store_answer(
+                vectors[key],
+                unique[key],
+                response,
+                retrieved_documents,
+                top_k,
+                corpus_version,
+            )
+            results[key] = (response, retrieved_documents)
+        return [
+            results.get(normalize_query(query), (NO_CONTEXT_MESSAGE, []))
+            for query in queries
+        ]
+
+    async def agenerate_responses(
+        self, queries: list[str], top_k: int = 5, max_concurrency: int = 4
+    ) -> list[tuple[str, list]]:
         """
-        dsm5_docs, article_docs = self._get_documents_by_contexts(documents)
-        context_parts = []
+        Asynchronously generates the responses of many queries, see `generate_responses`.
 
-        if dsm5_docs:
-            dsm5_context = self._gather_dsm5_context(dsm5_docs)
-            if dsm5_context:
-                context_parts.append(dsm5_context)
+        Args:
+            queries (list[str]): The queries to generate responses for.
+            top_k (int, optional): The number of documents to retrieve per query. Defaults to 5.
+            max_concurrency (int, optional): Maximum number of concurrent LLM calls. Defaults to 4.
 
-        if article_docs:
-            article_context = self._gather_article_context(article_docs)
-            if article_context:
-                context_parts.append(article_context)
+        Returns:
+            list[tuple[str, list]]: The response and the retrieved documents of each query, in input order.
 
-        if not context_parts:
-            print('[red]Nenhum contexto encontrado![/red]')
-            raise Exception('No context found.')  # noqa: E501
+        Raises:
+            Exception: If the database is not available.
+        """  # noqa: E501
+        corpus_version = self.vector_db.corpus_version
+        unique = self._unique_queries(queries)
+        vectors = dict(
+            zip(unique, await self._aembed_queries(list(unique.values())))
+        )
+        results = self._lookup_answers(unique, vectors, top_k, corpus_version)
 
-        return '\n\n'.join(context_parts)
+        pending = {
+            key: query for key, query in unique.items() if key not in results
+        }
+        contexts = await self._aretrieve_contexts(
+            pending, top_k, corpus_version
+        )
+        answered = [key for key in pending if contexts[key] is not None]
+        responses = await self.llm.agenerate_responses(
+            [
+                self._build_messages(unique[key], contexts[key][0])
+                for key in answered
+            ],
+            max_concurrency=max_concurrency,
+        )
 
-    def generate_response(
+        for key, response in zip(answered, responses):
+            retrieved_documents = contexts[key][1]
+            self._store_answer(
+                vectors[key],
+                unique[key],
+                response,
+                retrieved_documents,
+                top_k,
+                corpus_version,
+            )
+            results[key] = (response, retrieved_documents)
+        return [
+            results.get(normalize_query(query), (NO_CONTEXT_MESSAGE, []))
+            for query in queries
+        ]
+
+    async def _aprepare_messages(
+        self, query: str, top_k: int, corpus_version: int
+    ) -> tuple[list[tuple[str, str]], list]:
+        """
+        Asynchronously retrieve the documents of a query and build the LLM messages.
+
+        Args:
+            query (str): The query to generate a response for.
+            top_k (int): The number of documents to retrieve from the database.
+            corpus_version (int): Version of the corpus when the query arrived.
+
+        Returns:
+            tuple[list[tuple[str, str]], list]: The messages for the LLM and the list of retrieved documents.
+
+        Raises:
+            Exception: If the database is not available or no documents are found.
+        """  # noqa: E501
+        context, retrieved_documents = await self._aretrieve_context(
+            query, top_k, corpus_version
+        )
+        print(f'Context: {context}')
+
+        return self._build_messages(query, context), retrieved_documents
+
+    async def _aembed_query(self, query: str) -> Optional[np.ndarray]:
+        """Embed a query for the semantic cache, if there is one."""
+        if self.answer_cache is None:
+            return None
+        return await self.answer_cache.aembed(query)
+
+    async def _aembed_queries(
+        self, queries: list[str]
+    ) -> list[Optional[np.ndarray]]:
+        """Embed many queries in one batch for the semantic cache, if there is one."""  # noqa: E501
+        if self.answer_cache is None:
+            return [None] * len(queries)
+        return await self.answer_cache.aembed_many(queries)
+
+    async def agenerate_response(
         self, query: str, top_k: int = 5
     ) -> tuple[str, list]:
         """
-        Generates a response to a given query using the RAG model.
+        Asynchronously generates a response to a given query using the RAG model.
+
+        Every database and LLM round trip is awaited, so a single event loop
+        can serve many queries concurrently.
 
         Args:
             query (str): The query to generate a response for.
@@ -244,38 +785,72 @@ class RAGFactory:
         Raises:
             Exception: If the database is not available or no documents are found.
         """  # noqa: E501
-        if not self.vector_db.verify_database():
-            print('[red]O banco de dados não está disponível![/red]')
-            raise Exception('Database not available or empty.')
-
-        retrieved_documents = self.vector_db.search(query, limit=top_k)
+        corpus_version = self.vector_db.corpus_version
+        vector = await self._aembed_query(query)
+        cached = self._lookup_answer(vector, top_k, corpus_version)
+        if cached is not None:
+            return cached.response, cached.source_documents
+
+        messages, retrieved_documents = await self._aprepare_messages(
+            query, top_k, corpus_version
+        )
+        response = await self.llm.agenerate_response(messages)
+        self._store_answer(
+            vector, query, response, retrieved_documents, top_k, corpus_version
+        )
+        return response, retrieved_documents
 
-        if not retrieved_documents:
-            print('[red]Nenhum documento encontrado![/red]')
-            raise Exception('No documents found.')  # noqa: E501
+    async def astream_response(
+        self, query: str, top_k: int = 5
+    ) -> AsyncIterator[dict]:
+        """
+        Stream the response to a given query as events, sources first.
 
-        context = self._handle_contexts(retrieved_documents)
-        print(f'Context: {context}')
+        The first event carries the retrieved documents, followed by one event
+        per piece of the response as the LLM generates it, so the client can
+        render the answer without waiting for it to be complete.
 
-        system_context = f"""Papel: Você é um chatbot especializado em saúde mental que receberá um contexto com informações confiáveis relacionadas à pergunta do usuário, provenientes de uma base de dados vetorial.
-Regras:
-    - Você não é um profissional de saúde e não pode fornecer diagnósticos ou tratamentos;
-    - O conteúdo fornecido pode estar segmentado e fora de ordem; ao responder, organize as informações de forma coerente e cite a fonte de forma humanizada e fácil de entender (ex.: não apenas o nome do pdf, mas sim o nome do artigo/livro/...);
-    - Você pode utilizar o contexto para fornecer informações embasadas e verdadeiras. Caso o contexto não seja suficiente, você deve informar ao usuário, mas nunca inventar informações;
-    - Detalhe bem suas respostas, mas mantenha-as certas, não invente informações.
-    - Ao final de todas as respostas, mencione as fontes utilizadas para a resposta. No caso de artigos, mencione o nome do artigo e outras informações relevantes para que o usuário possa acessar a fonte original.
-    - Apenas referencie na resposta os contextos passados dentro da tag <contexto>. E caso o contexto seja de um artigo e o texto cite uma referência, não cite-a como se tivesse acesso à ela pois você só conhece o texto passado na tag contexto.
-    - Ao citar as fontes no final da pergunta, apenas cite as que realmente foram úteis para o texto.
-
-<contexto>{context}</contexto>"""  # noqa: E501
+        Args:
+            query (str): The query to generate a response for.
+            top_k (int, optional): The number of documents to retrieve from the database. Defaults to 5.
 
-        messages = [
-            ('system', system_context),
-            ('human', f'Pergunta: {query}\n\nResposta:'),
-        ]
+        Returns:
+            AsyncIterator[dict]: Events `{'type': 'sources', 'source_documents': [...]}`, then `{'type': 'token', 'content': '...'}` for each piece and a final `{'type': 'done'}`.
 
-        response = self.llm.generate_response(messages)
-        return response, retrieved_documents
+        Raises:
+            Exception: If the database is not available or no documents are found.
+        """  # noqa: E501
+        corpus_version = self.vector_db.corpus_version
+        vector = await self._aembed_query(query)
+        cached = self._lookup_answer(vector, top_k, corpus_version)
+        if cached is not None:
+            yield {
+                'type': 'sources',
+                'source_documents': cached.source_documents,
+            }
+            yield {'type': 'token', 'content': cached.response}
+            yield {'type': 'done'}
+            return
+
+        messages, retrieved_documents = await self._aprepare_messages(
+            query, top_k, corpus_version
+        )
+        yield {'type': 'sources', 'source_documents': retrieved_documents}
+
+        tokens = []
+        async for token in self.llm.astream_response(messages):
+            tokens.append(token)
+            yield {'type': 'token', 'content': token}
+
+        self._store_answer(
+            vector,
+            query,
+            ''.join(tokens),
+            retrieved_documents,
+            top_k,
+            corpus_version,
+        )
+        yield {'type': 'done'}
 
 
 if __name__ == '__main__':
@@ -11,6 +11,21 @@ class Settings(BaseSettings):
     LLM_MODEL_NAME: str
     WEAVIATE_URL: str = 'localhost'
     WEAVIATE_PORT: str = '8080'
+    VECTOR_DB_BACKEND: str = 'weaviate'
+    FAISS_INDEX_PATH: str = 'data/faiss'
+    SEMANTIC_CACHE_ENABLED: bool = False
+    SEMANTIC_CACHE_THRESHOLD: float = 0.95
+    SEMANTIC_CACHE_MAX_SIZE: int = 1024
+    SEMANTIC_CACHE_TTL: float = 3600
+    RETRIEVAL_CACHE_MAX_SIZE: int = 256
+    RETRIEVAL_CACHE_TTL: float = 300
+    QUERY_EMBEDDING_IN_PROCESS: bool = False
+    QUERY_EMBEDDING_MODEL: str = ''
+    QUERY_EMBEDDING_CACHE_SIZE: int = 1024
+    LLM_BATCH_CONCURRENCY: int = 4
+    MAX_BATCH_QUERIES: int = 32
+    CONTEXT_TOKEN_BUDGET: int = 6000
+    OLLAMA_TOKENIZER: str = ''
 
 
 settings = Settings()
@@ -0,0 +1,114 @@
+import time
+
+from langchain_core.embeddings import Embeddings
+
+from mental_health_ai.rag.cache import RetrievalCache, SemanticCache
+
+
+class FakeEmbeddings(Embeddings):
+    """Embeds queries with fixed vectors, so similarities are predictable."""
+
+    vectors = {
+        'o que é TDAH': [1.0, 0.0, 0.0],
+        'me explique o TDAH': [0.99, 0.1, 0.0],
+        'o que é depressão': [0.0, 1.0, 0.0],
+    }
+
+    def embed_documents(self, texts):
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, text):
+        return self.vectors[text]
+
+
+def _store(cache, query, corpus_version=0):
+    cache.store(
+        cache.embed(query), query, f'answer: {query}', [], 5, corpus_version
+    )
+
+
+def test_semantic_cache_serves_paraphrases():
+    """Test that a similar query hits and a different one misses."""
+    cache = SemanticCache(FakeEmbeddings(), threshold=0.95)
+    _store(cache, 'o que é TDAH')
+
+    hit = cache.lookup(cache.embed('me explique o TDAH'), 5, 0)
+    miss = cache.lookup(cache.embed('o que é depressão'), 5, 0)
+
+    assert hit.response == 'answer: o que é TDAH'
+    assert miss is None
+    assert cache.stats() == {
+        'hits': 1,
+        'misses': 1,
+        'size': 1,
+        'hit_rate': 0.5,
+    }
+
+
+def test_semantic_cache_requires_same_top_k():
+    """Test that answers retrieved with another top_k are not served."""
+    cache = SemanticCache(FakeEmbeddings())
+    _store(cache, 'o que é TDAH')
+
+    assert cache.lookup(cache.embed('o que é TDAH'), 10, 0) is None
+
+
+def test_semantic_cache_evicts_least_recently_used():
+    """Test that the least recently used answer is evicted beyond max_size."""
+    cache = SemanticCache(FakeEmbeddings(), max_size=2)
+    _store(cache, 'o que é TDAH')
+    _store(cache, 'o que é depressão')
+    cache.lookup(cache.embed('o que é TDAH'), 5, 0)
+    _store(cache, 'me explique o TDAH')
+
+    remaining = {entry.query for entry in cache._entries.values()}
+    assert remaining == {'o que é TDAH', 'me explique o TDAH'}
+
+
+def test_semantic_cache_expires_and_invalidates():
+    """Test that answers expire after the TTL and on corpus changes."""
+    cache = SemanticCache(FakeEmbeddings(), ttl=60)
+    _store(cache, 'o que é TDAH')
+
+    assert cache.lookup(cache.embed('o que é TDAH'), 5, 1) is None
+    assert len(cache) == 0
+
+    _store(cache, 'o que é TDAH', corpus_version=1)
+    next(iter(cache._entries.values())).created_at = time.monotonic() - 61
+    assert cache.lookup(cache.embed('o que é TDAH'), 5, 1) is None
+    assert len(cache) == 0
+
+
+def test_retrieval_cache_normalizes_queries():
+    """Test that case and whitespace variations of a query share an entry."""
+    cache = RetrievalCache()
+    cache.put('O que é  TDAH?', 5, 0, 'context', ['doc'])
+
+    assert cache.get(' o que é tdah? ', 5, 0) == ('context', ['doc'])
+    assert cache.get('o que é tdah?', 3, 0) is None
+
+
+def test_retrieval_cache_follows_corpus_version():
+    """Test that a corpus change drops entries and stale puts are ignored."""
+    cache = RetrievalCache(max_size=1)
+    cache.put('TDAH', 5, 0, 'old context', [])
+
+    assert cache.get('TDAH', 5, 1) is None
+    cache.put('TDAH', 5, 0, 'stale context', [])
+    assert len(cache) == 0
+
+    cache.put('TDAH', 5, 1, 'context', [])
+    cache.put('depressão', 5, 1, 'other context', [])
+    assert cache.get('TDAH', 5, 1) is None
+    assert cache.get('depressão', 5, 1) == ('other context', [])
+
+
+def test_retrieval_cache_entries_expire():
+    """Test that a retrieval older than the TTL is a miss."""
+    cache = RetrievalCache(ttl=60)
+    cache.put('TDAH', 5, 0, 'context', [])
+    [key] = cache._entries
+    cache._entries[key] = ('context', [], time.monotonic() - 61)
+
+    assert cache.get('TDAH', 5, 0) is None
+    assert len(cache) == 0
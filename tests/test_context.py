@@ -0,0 +1,96 @@
+from types import SimpleNamespace
+
+from mental_health_ai.rag.context import (
+    ContextBlock,
+    pack_context,
+    page_overhead,
+    render_context,
+    source_overhead,
+)
+
+
+def count_words(text):
+    return len(text.split())
+
+
+def _block(page_number, *chunks):
+    return ContextBlock(
+        key=('dsm-5', 'dsm5', page_number),
+        document=None,
+        chunks=list(chunks),
+        overhead=2,
+    )
+
+
+def test_pack_context_truncates_at_chunk_boundaries():
+    """Test that pages fill the budget in order and are cut between chunks."""
+    blocks = [
+        _block(1, 'um dois', 'três quatro'),
+        _block(2, 'cinco seis sete', 'oito'),
+        _block(3, 'nove'),
+    ]
+
+    packed = pack_context(blocks, 16, count_words)
+
+    assert [block.chunks for block in packed.blocks] == [
+        ['um dois', 'três quatro'],
+        ['cinco seis sete'],
+    ]
+    assert packed.tokens <= packed.budget
+    assert packed.dropped_chunks == len(['oito', 'nove'])
+
+
+def test_pack_context_without_budget_keeps_everything():
+    """Test that a None budget keeps every chunk and still counts tokens."""
+    blocks = [_block(1, 'um dois'), _block(2, 'três')]
+
+    packed = pack_context(blocks, None, count_words)
+
+    assert packed.blocks == blocks
+    assert packed.tokens == len(['Fontes:', 'Trechos:']) + (2 + 3) + (2 + 2)
+
+
+def test_render_context_describes_each_source_once():
+    """Test that pages of a source share one description and its number."""
+    document = SimpleNamespace(
+        properties={
+            'title': 'Artigo sobre TDAH - Page 3',
+            'metadata': {
+                'source': 'artigo.pdf',
+                'source_description': 'Resumo do artigo.',
+            },
+        }
+    )
+    blocks = [
+        ContextBlock(('article', 'artigo.pdf', 3), document, ['um']),
+        ContextBlock(('article', 'artigo.pdf', 4), document, ['dois']),
+    ]
+
+    context = render_context(blocks)
+
+    assert context.count('Resumo do artigo.') == 1
+    assert '[1] Artigo sobre TDAH - artigo.pdf' in context
+    assert '[1, p. 3]\num' in context
+    assert '[1, p. 4]\ndois' in context
+
+
+def test_packed_tokens_bound_the_rendered_context():
+    """Test that the counted tokens cover the headings and separators."""
+    document = SimpleNamespace(
+        properties={'title': 'DSM-5 Page 1', 'metadata': {'source': 'dsm5'}}
+    )
+    blocks = [
+        ContextBlock(
+            key=('dsm-5', 'dsm5', page_number),
+            document=document,
+            chunks=['um dois', 'três'],
+            overhead=page_overhead(len, 1, page_number),
+            source_overhead=source_overhead(len, document, 1),
+        )
+        for page_number in range(1, 4)
+    ]
+
+    packed = pack_context(blocks, 60, len)
+
+    assert len(render_context(packed.blocks)) <= packed.tokens <= packed.budget
+    assert packed.dropped_chunks
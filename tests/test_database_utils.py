@@ -0,0 +1,32 @@
+import json
+
+from mental_health_ai.rag.database.utils import (
+    iter_documents_in_file,
+    iter_json_files,
+)
+
+
+def test_iter_documents_reads_json_and_jsonl(tmp_path, sample_document):
+    """Test streaming documents from JSON arrays, objects and JSON Lines."""
+    nested = tmp_path / 'nested'
+    nested.mkdir()
+    (tmp_path / 'a.json').write_text(
+        json.dumps([sample_document, sample_document]), encoding='utf-8'
+    )
+    (nested / 'b.json').write_text(
+        json.dumps(sample_document), encoding='utf-8'
+    )
+    (nested / 'c.jsonl').write_text(
+        f'{json.dumps(sample_document)}\n\n{json.dumps(sample_document)}\n',
+        encoding='utf-8',
+    )
+    (tmp_path / 'ignored.txt').write_text('not json', encoding='utf-8')
+
+    documents = (
+        document
+        for file_path in iter_json_files(str(tmp_path))
+        for document in iter_documents_in_file(file_path)
+    )
+
+    assert next(documents) == sample_document
+    assert len(list(documents)) == 4  # noqa: PLR2004
@@ -0,0 +1,69 @@
+import asyncio
+
+from langchain_core.embeddings import Embeddings
+
+from mental_health_ai.rag.embeddings import (
+    CachedQueryEmbeddings,
+    aembed_queries,
+)
+
+
+class CountingEmbeddings(Embeddings):
+    """Embeds texts by length and counts the calls to the model."""
+
+    def __init__(self):
+        self.calls = 0
+        self.batches = 0
+
+    def embed_documents(self, texts):
+        self.batches += 1
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, text):
+        self.calls += 1
+        return [float(len(text))]
+
+
+def test_cached_query_embeddings_memoizes_normalized_queries():
+    """Test that normalized repeats of a query are embedded once."""
+    model = CountingEmbeddings()
+    embeddings = CachedQueryEmbeddings(model)
+
+    first = embeddings.embed_query('O que é TDAH?')
+    second = embeddings.embed_query('  o que é   tdah? ')
+    third = asyncio.run(embeddings.aembed_query('o que é tdah?'))
+
+    assert first == second == third
+    assert model.calls == 1
+    assert embeddings.stats()['misses'] == 1
+
+
+def test_cached_query_embeddings_evicts_least_recently_used():
+    """Test that the least recently used query is evicted beyond max_size."""
+    model = CountingEmbeddings()
+    embeddings = CachedQueryEmbeddings(model, max_size=2)
+
+    embeddings.embed_query('TDAH')
+    embeddings.embed_query('depressão')
+    embeddings.embed_query('TDAH')
+    embeddings.embed_query('ansiedade')
+    model.calls = 0
+    embeddings.embed_query('TDAH')
+    embeddings.embed_query('depressão')
+
+    assert model.calls == 1
+
+
+def test_embed_queries_embeds_missing_queries_in_one_batch():
+    """Test that a batch embeds only its uncached queries, each once."""
+    model = CountingEmbeddings()
+    embeddings = CachedQueryEmbeddings(model)
+    cached = embeddings.embed_query('TDAH')
+
+    vectors = embeddings.embed_queries(['tdah', 'depressão', 'Depressão'])
+    repeated = asyncio.run(aembed_queries(embeddings, ['TDAH', 'depressão']))
+
+    assert vectors[0] == cached
+    assert vectors[1] == vectors[2] == repeated[1]
+    assert model.calls == len(['TDAH', 'depressão'])
+    assert model.batches == 1
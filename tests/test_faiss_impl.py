@@ -0,0 +1,194 @@
+import json
+
+import pytest
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+pytest.importorskip('faiss')
+
+from mental_health_ai.rag.database.faiss_impl import (  # noqa: E402
+    FaissDatabase,
+)
+from mental_health_ai.rag.database.vectors import embed_corpus  # noqa: E402
+
+
+class QueryOnlyEmbeddings(DeterministicFakeEmbedding):
+    """Embeddings failing on documents, to check precomputed vectors."""
+
+    @staticmethod
+    def embed_documents(texts):
+        raise AssertionError('Documents should not be embedded.')
+
+
+def _document(content, doc_type='dsm-5', page_number=1, source='dsm5'):
+    return {
+        'title': 'DSM-5',
+        'page_content': content,
+        'metadata': {
+            'type': doc_type,
+            'source': source,
+            'page_number': page_number,
+            'source_description': 'Manual',
+            'date': '2023-01-01T00:00:00Z',
+        },
+    }
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """Fixture writing a small processed corpus."""
+    root = tmp_path / 'processed'
+    root.mkdir()
+    (root / 'dsm5.json').write_text(
+        json.dumps([
+            _document('TDAH é um transtorno do neurodesenvolvimento.'),
+            _document('Sintomas de desatenção.', page_number=1),
+            _document('Depressão maior.', page_number=2),
+        ]),
+        encoding='utf-8',
+    )
+    return root
+
+
+@pytest.fixture
+def faiss_db(tmp_path):
+    """Fixture to create a FaissDatabase in a temporary directory."""
+    with FaissDatabase(
+        str(tmp_path / 'faiss'), DeterministicFakeEmbedding(size=16)
+    ) as db:
+        yield db
+
+
+def test_load_and_search(faiss_db, corpus):
+    """Test that loaded documents are found by their content."""
+    assert faiss_db.load_documents(str(corpus))
+    assert faiss_db.verify_database()
+
+    results = faiss_db.search('Depressão maior.', limit=1)
+
+    assert results[0].properties['page_content'] == 'Depressão maior.'
+    assert results[0].metadata.distance == pytest.approx(0, abs=1e-5)
+    [batched, _] = faiss_db.search_many(
+        ['Depressão maior.', 'Sintomas de desatenção.'], limit=1
+    )
+    assert batched[0].uuid == results[0].uuid
+
+
+def test_reload_is_incremental(faiss_db, corpus):
+    """Test that loading an unchanged corpus inserts nothing."""
+    faiss_db.load_documents(str(corpus))
+    corpus_version = faiss_db.corpus_version
+    size = faiss_db.build_page_index()
+
+    faiss_db.load_documents(str(corpus))
+
+    assert faiss_db.corpus_version == corpus_version
+    assert faiss_db.build_page_index() == size
+
+
+def test_sync_document_count(faiss_db, corpus):
+    """Test that only a change of the checked document count bumps the corpus version."""  # noqa: E501
+    assert faiss_db.sync_document_count(faiss_db.count_documents()) is False
+
+    faiss_db.load_documents(str(corpus))
+    corpus_version = faiss_db.corpus_version
+
+    assert faiss_db.sync_document_count(faiss_db.count_documents()) is True
+    assert faiss_db.sync_document_count(faiss_db.count_documents()) is False
+    assert faiss_db.corpus_version == corpus_version + 1
+
+
+def test_get_documents_by_pages(faiss_db, corpus):
+    """Test the page lookup table, with and without a source."""
+    faiss_db.load_documents(str(corpus))
+
+    pages = faiss_db.get_documents_by_pages([
+        ('DSM-5', None, 1),
+        ('dsm-5', 'dsm5', 2),
+        ('article', None, 1),
+    ])
+
+    assert [
+        doc.properties['chunk_index'] for doc in pages['dsm-5', None, 1]
+    ] == [0, 1]
+    assert len(pages['dsm-5', 'dsm5', 2]) == 1
+    assert pages['article', None, 1] == []
+
+
+def test_delete_and_reopen(faiss_db, corpus, tmp_path):
+    """Test that deletions and documents persist across instances."""
+    faiss_db.load_documents(str(corpus))
+    deleted = faiss_db.search('Depressão maior.', limit=1)[0]
+
+    faiss_db.delete_document_by_id(deleted.uuid)
+    faiss_db.close()
+
+    with FaissDatabase(
+        str(tmp_path / 'faiss'), DeterministicFakeEmbedding(size=16)
+    ) as reopened:
+        assert reopened.get_document_by_id(deleted.uuid) is None
+        assert reopened.get_documents_by_type_and_page_number('dsm-5', 2) == []
+        remaining = reopened.search('Depressão maior.', limit=5)
+        assert deleted.uuid not in {doc.uuid for doc in remaining}
+        assert remaining
+
+
+def test_load_uses_precomputed_vectors(corpus, tmp_path):
+    """Test that sidecar vectors of the same model skip the embedding."""
+    embed_corpus(str(corpus), DeterministicFakeEmbedding(size=16), 'fake')
+
+    with FaissDatabase(
+        str(tmp_path / 'faiss'),
+        QueryOnlyEmbeddings(size=16),
+        model_name='fake',
+    ) as db:
+        assert db.load_documents(str(corpus))
+        [result] = db.search('Depressão maior.', limit=1)
+
+    assert result.properties['page_content'] == 'Depressão maior.'
+
+
+def test_reopened_store_accepts_changes(faiss_db, corpus, tmp_path):
+    """Test that the memory-mapped index of a reopened store can change."""
+    faiss_db.load_documents(str(corpus))
+    faiss_db.close()
+
+    with FaissDatabase(
+        str(tmp_path / 'faiss'), DeterministicFakeEmbedding(size=16)
+    ) as reopened:
+        assert reopened.add_document(_document('Ansiedade.', page_number=3))
+        [result] = reopened.search('Ansiedade.', limit=1)
+
+    assert result.properties['page_content'] == 'Ansiedade.'
+
+
+def test_deleted_rows_are_compacted(faiss_db, corpus, tmp_path):
+    """Test that deleted rows are dropped from the documents file."""
+    faiss_db.load_documents(str(corpus))
+    for content in ('Depressão maior.', 'Sintomas de desatenção.'):
+        [deleted] = faiss_db.search(content, limit=1)
+        faiss_db.delete_document_by_id(deleted.uuid)
+    faiss_db.close()
+
+    documents_path = tmp_path / 'faiss' / 'documents.jsonl'
+    assert len(documents_path.read_text(encoding='utf-8').splitlines()) == 1
+    with FaissDatabase(
+        str(tmp_path / 'faiss'), DeterministicFakeEmbedding(size=16)
+    ) as reopened:
+        [result] = reopened.search('Depressão maior.', limit=5)
+        [page] = reopened.get_documents_by_pages([('dsm-5', None, 1)]).values()
+
+    assert result.properties['page_content'].startswith('TDAH')
+    assert [document.uuid for document in page] == [result.uuid]
+
+
+def test_count_documents_sees_other_instances(faiss_db, corpus, tmp_path):
+    """Test that a store saved by another instance is reloaded on count."""
+    faiss_db.sync_document_count(faiss_db.count_documents())
+
+    with FaissDatabase(
+        str(tmp_path / 'faiss'), DeterministicFakeEmbedding(size=16)
+    ) as writer:
+        writer.load_documents(str(corpus))
+
+    assert faiss_db.sync_document_count(faiss_db.count_documents())
+    assert faiss_db.search('Depressão maior.', limit=1)
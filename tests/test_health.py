@@ -0,0 +1,74 @@
+import asyncio
+
+from mental_health_ai.rag.database.health import HealthMonitor
+
+
+class FakeDatabase:
+    def __init__(self, error=None):
+        self.error = error
+        self.calls = 0
+        self.document_count = 10
+        self.synced_counts = []
+
+    async def averify_database(self):
+        self.calls += 1
+        if self.error:
+            raise self.error
+        return True
+
+    async def acount_documents(self):
+        return self.document_count
+
+    def sync_document_count(self, document_count):
+        self.synced_counts.append(document_count)
+
+
+def test_health_monitor_caches_ready_status():
+    """Test that a successful check is cached until the monitor is stopped."""
+    database = FakeDatabase()
+    monitor = HealthMonitor(database, interval=60)
+
+    async def run():
+        await monitor.start()
+        assert monitor.is_running
+        ready = monitor.is_ready
+        await monitor.stop()
+        return ready
+
+    assert asyncio.run(run())
+    assert database.calls == 1
+    assert not monitor.is_running
+
+
+def test_health_monitor_reports_failed_check():
+    """Test that a failing check is cached as not ready with its reason."""
+    monitor = HealthMonitor(FakeDatabase(RuntimeError('Collection is empty.')))
+
+    status = asyncio.run(monitor.check())
+
+    assert not status.ready
+    assert status.detail == 'Collection is empty.'
+    assert not monitor.is_ready
+
+
+def test_health_monitor_stale_status_is_not_ready():
+    """Test that a status older than max_age is not considered ready."""
+    monitor = HealthMonitor(FakeDatabase(), interval=60, max_age=0)
+
+    asyncio.run(monitor.check())
+
+    assert monitor.status.ready
+    assert not monitor.is_ready
+
+
+def test_health_monitor_syncs_document_count():
+    """Test that each check passes the document count to the database."""
+    database = FakeDatabase()
+    monitor = HealthMonitor(database)
+
+    asyncio.run(monitor.check())
+    database.document_count += 2
+    status = asyncio.run(monitor.check())
+
+    assert status.document_count == database.document_count
+    assert database.synced_counts == [10, database.document_count]
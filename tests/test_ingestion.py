@@ -0,0 +1,73 @@
+import json
+
+from mental_health_ai.rag.database.ingestion import (
+    IngestionManifest,
+    assign_chunk_ids,
+    document_uuid,
+    iter_changed_chunks,
+)
+
+
+def _ingest(root_path, manifest):
+    """Consume the changed chunks, returning their UUIDs and the stale ones."""
+    stale_uuids = []
+    uuids = [
+        uuid
+        for uuid, _, _ in iter_changed_chunks(
+            str(root_path), manifest, list, stale_uuids
+        )
+    ]
+    return uuids, stale_uuids
+
+
+def test_document_uuid_is_deterministic(sample_document):
+    """Test that the UUID depends only on the chunk identity and content."""
+    changed = {**sample_document, 'page_content': 'Changed content.'}
+    assert document_uuid(sample_document, 0) == document_uuid(
+        dict(sample_document), 0
+    )
+    assert document_uuid(sample_document, 0) != document_uuid(
+        sample_document, 1
+    )
+    assert document_uuid(sample_document, 0) != document_uuid(changed, 0)
+
+
+def test_assign_chunk_ids_numbers_chunks_per_page(sample_document):
+    """Test that chunks are numbered in order within each page."""
+    other_page = {
+        **sample_document,
+        'metadata': {**sample_document['metadata'], 'page_number': 2},
+    }
+    chunks = assign_chunk_ids([sample_document, other_page, sample_document])
+    assert [chunk_index for _, chunk_index, _ in chunks] == [0, 0, 1]
+
+
+def test_iter_changed_chunks_is_incremental(tmp_path, sample_document):
+    """Test that re-ingestion only yields new chunks and reports stale ones."""
+    manifest = IngestionManifest.load(str(tmp_path / 'manifest.json'))
+    data_path = tmp_path / 'data'
+    data_path.mkdir()
+    file_path = data_path / 'a.json'
+    file_path.write_text(json.dumps([sample_document]), encoding='utf-8')
+
+    first_uuids, _ = _ingest(data_path, manifest)
+    assert len(first_uuids) == 1
+    manifest.save()
+
+    manifest = IngestionManifest.load(manifest.path)
+    assert _ingest(data_path, manifest) == ([], [])
+
+    changed = {**sample_document, 'page_content': 'Changed content.'}
+    file_path.write_text(
+        json.dumps([sample_document, changed]), encoding='utf-8'
+    )
+    new_uuids, stale_uuids = _ingest(data_path, manifest)
+    assert len(new_uuids) == 1
+    assert new_uuids != first_uuids
+    assert not stale_uuids
+
+    file_path.unlink()
+    removed_uuids, stale_uuids = _ingest(data_path, manifest)
+    assert not removed_uuids
+    assert sorted(stale_uuids) == sorted([*first_uuids, *new_uuids])
+    assert not manifest.entries
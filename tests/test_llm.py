@@ -0,0 +1,115 @@
+import asyncio
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.language_models.fake_chat_models import (
+    FakeListChatModel,
+)
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import (
+    ChatGeneration,
+    ChatGenerationChunk,
+    ChatResult,
+)
+
+from mental_health_ai.rag.llm.llm_interface import (
+    ChatModelBatchMixin,
+    LLMInterface,
+)
+from mental_health_ai.rag.llm.ollama_impl import OllamaLLM
+from mental_health_ai.rag.llm.openai_impl import OpenAILLM
+
+
+class FakeChatLLM(ChatModelBatchMixin, LLMInterface):
+    """Backend over a fake chat model, recording the batched responses."""
+
+    def __init__(self, responses):
+        self.llm = FakeListChatModel(responses=responses)
+        self.recorded = []
+
+    def generate_response(self, messages):
+        return self.llm.invoke(messages).content
+
+    def _record_usage(self, response):
+        self.recorded.append(response.content)
+
+
+def test_generate_responses_goes_through_batch():
+    """Test that batched responses keep the input order and are recorded."""
+    llm = FakeChatLLM(['primeira', 'segunda'])
+    messages_list = [[('human', 'TDAH')], [('human', 'depressão')]]
+
+    responses = llm.generate_responses(messages_list, max_concurrency=1)
+
+    assert responses == ['primeira', 'segunda']
+    assert llm.recorded == responses
+    assert asyncio.run(
+        llm.agenerate_responses(messages_list, max_concurrency=1)
+    ) == ['primeira', 'segunda']
+
+
+class UsageChatModel(BaseChatModel):
+    """Chat model streaming a response with the usage in its last chunk."""
+
+    @property
+    def _llm_type(self):
+        return 'usage'
+
+    @staticmethod
+    def _generate(messages, stop=None, run_manager=None, **kwargs):
+        return ChatResult(
+            generations=[ChatGeneration(message=AIMessage(content='TDAH'))]
+        )
+
+    @staticmethod
+    def _stream(messages, stop=None, run_manager=None, **kwargs):
+        yield ChatGenerationChunk(message=AIMessageChunk(content='TDAH'))
+        yield ChatGenerationChunk(
+            message=AIMessageChunk(
+                content='',
+                usage_metadata={
+                    'input_tokens': 10,
+                    'output_tokens': 1,
+                    'total_tokens': 11,
+                    'input_token_details': {'cache_read': 8},
+                },
+            )
+        )
+
+
+def test_openai_stream_records_usage(monkeypatch):
+    """Test that streamed responses count their prompt and cached tokens."""
+    monkeypatch.setenv('OPENAI_API_KEY', 'sk-test')
+    llm = OpenAILLM(model_name='gpt-4o-mini', use_auth_token=False)
+    llm.llm = UsageChatModel()
+
+    async def astream():
+        return [
+            piece async for piece in llm.astream_response([('human', 'Oi')])
+        ]
+
+    assert list(llm.stream_response([('human', 'Oi')])) == ['TDAH']
+    assert asyncio.run(astream()) == ['TDAH']
+    assert llm.prompt_cache_stats() == {
+        'prompt_tokens': 20,
+        'cached_prompt_tokens': 16,
+        'hit_rate': 0.8,
+    }
+    assert FakeChatLLM([]).prompt_cache_stats() is None
+
+
+class WordTokenizer:
+    """Tokenizer splitting words, standing in for a Hugging Face tokenizer."""
+
+    @staticmethod
+    def encode(text, add_special_tokens=True):
+        return text.split()
+
+
+def test_ollama_counts_tokens_with_its_tokenizer():
+    """Test that Ollama counts with the tokenizer, or overestimates without."""
+    llm = OllamaLLM(model_name='llama3', tokenizer_name='')
+    text = 'O transtorno de déficit de atenção'
+
+    assert llm.count_tokens(text) > LLMInterface.count_tokens(llm, text)
+    llm.tokenizer = WordTokenizer()
+    assert llm.count_tokens(text) == len(text.split())
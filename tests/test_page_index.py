@@ -0,0 +1,66 @@
+import pytest
+
+from mental_health_ai.rag.database.page_index import PageIndex
+
+
+@pytest.fixture
+def page_index(sample_document) -> PageIndex:
+    """Fixture to create a PageIndex with two chunks of the same page."""
+    index = PageIndex()
+    index.add('uuid-1', sample_document)
+    index.add('uuid-2', {**sample_document, 'page_content': 'Second chunk.'})
+    return index
+
+
+def test_get_chunks_of_page(page_index: PageIndex):
+    """Test that the chunks of a page are returned in insertion order."""
+    pages = page_index.get_many([('Article', 'https://example.com', 1)])
+    chunks = pages['article', 'https://example.com', 1]
+    assert [chunk.uuid for chunk in chunks] == ['uuid-1', 'uuid-2']
+    assert chunks[1].properties['page_content'] == 'Second chunk.'
+    assert chunks[0].properties['title'] == 'Sample Document'
+
+
+def test_get_page_of_any_source(page_index: PageIndex):
+    """Test that a None source matches the page of every source."""
+    pages = page_index.get_many([('article', None, 1)])
+    assert len(pages['article', None, 1]) == 2  # noqa: PLR2004
+
+
+def test_missing_page_is_empty(page_index: PageIndex):
+    """Test that a page without chunks maps to an empty list."""
+    assert page_index.get_many([('article', None, 2)]) == {
+        ('article', None, 2): []
+    }
+
+
+def test_remove_chunk(page_index: PageIndex):
+    """Test removing chunks until the page disappears from the index."""
+    assert page_index.remove('uuid-1') is True
+    assert page_index.remove('uuid-1') is False
+    page_index.remove('uuid-2')
+    assert len(page_index) == 0
+    assert page_index.get_many([('article', None, 1)]) == {
+        ('article', None, 1): []
+    }
+
+
+def test_document_without_page_is_not_indexed(sample_document):
+    """Test that documents without a page number are skipped."""
+    index = PageIndex()
+    metadata = {**sample_document['metadata'], 'page_number': None}
+    assert index.add('uuid-1', {**sample_document, 'metadata': metadata}) is (
+        False
+    )
+    assert len(index) == 0
+
+
+def test_chunks_are_ordered_by_chunk_index(sample_document):
+    """Test that chunks are returned by chunk index, not insertion order."""
+    index = PageIndex()
+    index.add('uuid-2', {**sample_document, 'chunk_index': 1})
+    index.add('uuid-1', {**sample_document, 'chunk_index': 0})
+    pages = index.get_many([('article', 'https://example.com', 1)])
+    assert [
+        chunk.uuid for chunk in pages['article', 'https://example.com', 1]
+    ] == ['uuid-1', 'uuid-2']
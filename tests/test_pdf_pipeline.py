@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+from mental_health_ai.processing_raw_data.extractors import get_extractor
+from mental_health_ai.processing_raw_data.pdf_pipeline import (
+    PdfJob,
+    build_parser,
+    job_fingerprint,
+    process_pdfs,
+    record_path,
+)
+from mental_health_ai.rag.database.ingestion import file_sha256
+
+
+def _job(tmp_path):
+    pdf_path = tmp_path / 'artigo.pdf'
+    pdf_path.write_bytes(b'%PDF-1.4')
+    return PdfJob(
+        pdf_path=str(pdf_path),
+        output_path=str(tmp_path / 'artigo.json'),
+        title_prefix='Artigo - Page ',
+        doc_type='Article',
+        source='artigo.pdf',
+        source_description='Resumo do artigo.',
+        date='2023-01-01T00:00:00Z',
+    )
+
+
+def test_process_pdfs_skips_unchanged_outputs(tmp_path):
+    """Test that PDFs with an up-to-date record are not processed again."""
+    job = _job(tmp_path)
+    fingerprint = job_fingerprint(job, file_sha256(job.pdf_path), 15)
+    (tmp_path / 'artigo.json').write_text('[]', encoding='utf-8')
+    with open(record_path(job.output_path), 'w', encoding='utf-8') as f:
+        json.dump({'fingerprint': fingerprint}, f)
+
+    stats = process_pdfs([job], workers=1, target_lines_per_chunk=15)
+
+    assert stats == {'processed': 0, 'skipped': 1, 'failed': 0}
+
+
+def test_job_fingerprint_depends_on_pdf_and_parameters(tmp_path):
+    """Test that changing the PDF or the chunking reprocesses the file."""
+    job = _job(tmp_path)
+    fingerprint = job_fingerprint(job, 'hash', 15)
+
+    assert fingerprint == job_fingerprint(job, 'hash', 15)
+    assert fingerprint != job_fingerprint(job, 'other hash', 15)
+    assert fingerprint != job_fingerprint(job, 'hash', 10)
+    assert fingerprint != job_fingerprint(job, 'hash', 15, 'pypdfium2')
+
+
+def test_get_extractor_rejects_unknown_engines():
+    """Test that engines are chosen by name from the registry."""
+    assert get_extractor('pypdfium2').name == 'pypdfium2'
+    with pytest.raises(ValueError, match='Unknown PDF extractor'):
+        get_extractor('ocr')
+
+
+def test_build_parser_uses_script_chunk_size():
+    """Test that the chunk size of a script is the default of its parser."""
+    chunk_size = 20
+
+    args = build_parser('Split PDFs.', chunk_size).parse_args([])
+
+    assert args.target_lines_per_chunk == chunk_size
@@ -0,0 +1,125 @@
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from mental_health_ai.processing_raw_data.process_articles import (
+    PARTIAL_SUFFIX,
+    create_session,
+    download_articles,
+    download_file,
+)
+
+PAYLOAD = bytes(range(256)) * 1024
+
+
+class PdfHandler(BaseHTTPRequestHandler):
+    """Serve `PAYLOAD` with range support, failing the first requests."""
+
+    failures = 0
+    requests = []
+    heads = 0
+
+    def do_HEAD(self):
+        type(self).heads += 1
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Length', str(len(PAYLOAD)))
+        self.end_headers()
+
+    def do_GET(self):
+        type(self).requests.append(self.headers.get('Range'))
+        if type(self).failures:
+            type(self).failures -= 1
+            self.send_error(HTTPStatus.SERVICE_UNAVAILABLE)
+            return
+
+        start = 0
+        if self.headers.get('Range'):
+            start = int(self.headers['Range'][len('bytes=') : -1])
+        self.send_response(
+            HTTPStatus.PARTIAL_CONTENT if start else HTTPStatus.OK
+        )
+        if start:
+            self.send_header(
+                'Content-Range',
+                f'bytes {start}-{len(PAYLOAD) - 1}/{len(PAYLOAD)}',
+            )
+        self.send_header('Content-Length', str(len(PAYLOAD) - start))
+        self.end_headers()
+        self.wfile.write(PAYLOAD[start:])
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def pdf_server():
+    """Local stand-in for the article PDF server."""
+    PdfHandler.failures = 0
+    PdfHandler.requests = []
+    PdfHandler.heads = 0
+    server = ThreadingHTTPServer(('127.0.0.1', 0), PdfHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+def test_download_articles_skips_existing_files(pdf_server, tmp_path):
+    """Test that PDFs are streamed to disk once and then skipped."""
+    articles = [
+        {'title': f'Artigo {index}', 'pdf_url': f'{pdf_server}/{index}.pdf'}
+        for index in range(4)
+    ]
+
+    first = download_articles(articles, str(tmp_path), concurrency=2)
+    second = download_articles(articles, str(tmp_path), concurrency=2)
+
+    assert first['downloaded'] == len(articles)
+    assert second['skipped'] == len(articles)
+    assert (tmp_path / 'artigo_0.pdf').read_bytes() == PAYLOAD
+    assert len(PdfHandler.requests) == len(articles)
+    assert PdfHandler.heads == len(articles)
+
+
+def test_download_articles_deduplicates_paths(pdf_server, tmp_path):
+    """Test that titles cleaning to the same file name are downloaded once."""
+    articles = [
+        {'title': 'Artigo, 1', 'pdf_url': f'{pdf_server}/a.pdf'},
+        {'title': 'artigo 1', 'pdf_url': f'{pdf_server}/b.pdf'},
+    ]
+
+    stats = download_articles(articles, str(tmp_path), concurrency=2)
+
+    assert stats['downloaded'] == 1
+    assert PdfHandler.requests == [None]
+
+
+def test_download_file_replaces_truncated_file(pdf_server, tmp_path):
+    """Test that a file smaller than the remote one is downloaded again."""
+    path = tmp_path / 'artigo.pdf'
+    path.write_bytes(PAYLOAD[:1000])
+
+    with create_session(1) as session:
+        status = download_file(session, f'{pdf_server}/artigo.pdf', str(path))
+
+    assert status == 'downloaded'
+    assert path.read_bytes() == PAYLOAD
+
+
+def test_download_file_resumes_after_failures(pdf_server, tmp_path):
+    """Test that a partial file is resumed with a range request on retry."""
+    path = tmp_path / 'artigo.pdf'
+    (tmp_path / f'artigo.pdf{PARTIAL_SUFFIX}').write_bytes(PAYLOAD[:1000])
+    PdfHandler.failures = 2
+
+    with create_session(1) as session:
+        status = download_file(
+            session, f'{pdf_server}/artigo.pdf', str(path), backoff=0
+        )
+
+    assert status == 'resumed'
+    assert path.read_bytes() == PAYLOAD
+    assert PdfHandler.requests == ['bytes=1000-'] * 3
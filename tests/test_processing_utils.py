@@ -0,0 +1,26 @@
+import pytest
+
+from mental_health_ai.processing_raw_data.utils import (
+    split_into_sentences,
+)
+
+
+def test_regex_splitter_keeps_abbreviations():
+    """Test that abbreviations and initials do not end a sentence."""
+    text = (
+        'O Dr. Silva revisou o TDAH (Barkley et al. 2015). Os dados são '
+        'claros! Veja a Fig. 2 e a\ntabela. J. Smith concorda.'
+    )
+
+    assert split_into_sentences(text, 'regex') == [
+        'O Dr. Silva revisou o TDAH (Barkley et al. 2015).',
+        'Os dados são claros!',
+        'Veja a Fig. 2 e a\ntabela.',
+        'J. Smith concorda.',
+    ]
+
+
+def test_split_into_sentences_rejects_unknown_splitters():
+    """Test that the splitter is chosen by name."""
+    with pytest.raises(ValueError, match='Unknown sentence splitter'):
+        split_into_sentences('Texto.', 'spacy')
@@ -0,0 +1,243 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from mental_health_ai.rag.cache import RetrievalCache, SemanticCache
+from mental_health_ai.rag.database.page_index import PageIndex
+from mental_health_ai.rag.llm.llm_interface import LLMInterface
+from mental_health_ai.rag.rag import NO_CONTEXT_MESSAGE, RAGFactory
+
+
+class FakeDatabase:
+    """In-memory database implementing the lookups used by `RAGFactory`."""
+
+    corpus_version = 0
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.searches = 0
+        self.page_lookups = 0
+        self.page_index = PageIndex()
+        for uuid, properties in chunks:
+            self.page_index.add(uuid, properties)
+
+    @staticmethod
+    def verify_database():
+        return True
+
+    def search(self, query, limit):
+        self.searches += 1
+        if query == 'sem resultados':
+            return []
+        return [
+            SimpleNamespace(uuid=uuid, properties=properties)
+            for uuid, properties in self.chunks[:limit]
+        ]
+
+    def search_many(self, queries, limit):
+        return [self.search(query, limit) for query in queries]
+
+    def get_documents_by_pages(self, pages):
+        self.page_lookups += 1
+        return self.page_index.get_many(pages)
+
+    async def averify_database(self):
+        return self.verify_database()
+
+    async def asearch(self, query, limit):
+        return self.search(query, limit)
+
+    async def asearch_many(self, queries, limit):
+        return self.search_many(queries, limit)
+
+    async def aget_documents_by_pages(self, pages):
+        return self.get_documents_by_pages(pages)
+
+
+class FakeLLM(LLMInterface):
+    @staticmethod
+    def generate_response(messages):
+        return f'sync: {len(messages[0][1])}'
+
+    @staticmethod
+    async def agenerate_response(messages):
+        return f'async: {len(messages[0][1])}'
+
+
+class ConstantEmbeddings(Embeddings):
+    """Embeds every text to the same vector, so every query is a paraphrase."""
+
+    def embed_documents(self, texts):
+        return [self.embed_query(text) for text in texts]
+
+    @staticmethod
+    def embed_query(text):
+        return [1.0, 0.0]
+
+
+def _chunk(uuid, doc_type, page_number, content):
+    return uuid, {
+        'title': f'{doc_type} page {page_number}',
+        'page_content': content,
+        'metadata': {
+            'type': doc_type,
+            'source': f'{doc_type}.pdf',
+            'page_number': page_number,
+        },
+    }
+
+
+def test_agenerate_response_matches_sync_response():
+    """Test that the async path builds the same prompt as the sync path."""
+    database = FakeDatabase([
+        _chunk('1', 'DSM-5', 10, 'First chunk'),
+        _chunk('2', 'DSM-5', 10, 'Second chunk'),
+        _chunk('3', 'article', 2, 'Article chunk'),
+    ])
+    rag_factory = RAGFactory(vector_db=database, llm=FakeLLM())
+
+    sync_response, sync_documents = rag_factory.generate_response('TDAH')
+    async_response, async_documents = asyncio.run(
+        rag_factory.agenerate_response('TDAH')
+    )
+
+    assert sync_response.removeprefix('sync: ') == async_response.removeprefix(
+        'async: '
+    )
+    assert [doc.uuid for doc in sync_documents] == [
+        doc.uuid for doc in async_documents
+    ]
+    context = rag_factory._handle_contexts(sync_documents)
+    assert 'First chunk\nSecond chunk' in context
+    assert context.index('DSM-5') < context.index('Article chunk')
+
+
+def test_astream_response_sends_sources_before_tokens():
+    """Test that streaming yields the sources, the tokens and a final event."""
+    database = FakeDatabase([_chunk('1', 'DSM-5', 10, 'First chunk')])
+    rag_factory = RAGFactory(vector_db=database, llm=FakeLLM())
+
+    async def collect():
+        return [event async for event in rag_factory.astream_response('TDAH')]
+
+    events = asyncio.run(collect())
+
+    assert [event['type'] for event in events] == ['sources', 'token', 'done']
+    assert events[0]['source_documents'][0].uuid == '1'
+    assert events[1]['content'].startswith('async: ')
+
+
+def test_generate_response_served_from_answer_cache():
+    """Test that a repeated query skips the search and reuses the answer."""
+    database = FakeDatabase([_chunk('1', 'DSM-5', 10, 'First chunk')])
+    cache = SemanticCache(ConstantEmbeddings())
+    rag_factory = RAGFactory(
+        vector_db=database, llm=FakeLLM(), answer_cache=cache
+    )
+
+    first = rag_factory.generate_response('o que é TDAH')
+    second = rag_factory.generate_response('me explique o TDAH')
+
+    assert second == first
+    assert database.searches == 1
+    assert cache.stats()['hits'] == 1
+
+
+def test_retrieval_cache_skips_database_until_corpus_changes():
+    """Test that a repeated query reuses its retrieval until the corpus changes."""  # noqa: E501
+    database = FakeDatabase([_chunk('1', 'DSM-5', 10, 'First chunk')])
+    rag_factory = RAGFactory(
+        vector_db=database, llm=FakeLLM(), retrieval_cache=RetrievalCache()
+    )
+
+    rag_factory.generate_response('O que é TDAH?')
+    asyncio.run(rag_factory.agenerate_response('o que é tdah?'))
+    assert database.searches == 1
+
+    database.corpus_version += 1
+    database.searches = 0
+    rag_factory.generate_response('O que é TDAH?')
+    assert database.searches == 1
+
+
+def test_agenerate_responses_shares_retrieval():
+    """Test that a batch deduplicates queries and merges the page lookups."""
+    database = FakeDatabase([
+        _chunk('1', 'DSM-5', 10, 'First chunk'),
+        _chunk('2', 'article', 2, 'Article chunk'),
+    ])
+    rag_factory = RAGFactory(vector_db=database, llm=FakeLLM())
+    queries = ['TDAH', 'depressão', ' tdah', 'sem resultados']
+
+    results = asyncio.run(rag_factory.agenerate_responses(queries))
+
+    assert [response for response, _ in results] == [
+        results[0][0],
+        results[1][0],
+        results[0][0],
+        NO_CONTEXT_MESSAGE,
+    ]
+    assert results[0][0].startswith('async: ')
+    assert database.searches == len(['TDAH', 'depressão', 'sem resultados'])
+    assert database.page_lookups == 1
+    assert rag_factory.generate_responses(queries[:1]) == [
+        rag_factory.generate_response('TDAH')
+    ]
+
+
+def test_generate_responses_only_skips_missing_context():
+    """Test that a batch answers queries without context and raises on bugs."""
+    database = FakeDatabase([_chunk('1', 'glossary', 1, 'Glossary chunk')])
+    rag_factory = RAGFactory(vector_db=database, llm=FakeLLM())
+
+    assert rag_factory.generate_responses(['TDAH']) == [
+        (NO_CONTEXT_MESSAGE, [])
+    ]
+
+    class BrokenLLM(FakeLLM):
+        @staticmethod
+        def count_tokens(text):
+            raise ValueError('tokenizer failure')
+
+    database = FakeDatabase([_chunk('1', 'DSM-5', 10, 'First chunk')])
+    rag_factory = RAGFactory(vector_db=database, llm=BrokenLLM())
+    with pytest.raises(ValueError, match='tokenizer failure'):
+        rag_factory.generate_responses(['TDAH'])
+
+
+def test_context_respects_token_budget():
+    """Test that the context stays within the budget whatever the top_k."""
+    database = FakeDatabase([
+        _chunk(str(page), 'DSM-5', page, 'palavra ' * 200)
+        for page in range(20)
+    ])
+    rag_factory = RAGFactory(
+        vector_db=database, llm=FakeLLM(), context_token_budget=500
+    )
+    documents = database.search('TDAH', limit=20)
+
+    context = rag_factory._handle_contexts(documents)
+
+    assert FakeLLM().count_tokens(context) <= rag_factory.context_token_budget
+    assert '[1, p. 0]' in context
+    assert '[1, p. 19]' not in context
+
+
+def test_prompt_prefix_is_stable():
+    """Test that prompts share the system message and sort pages by page."""
+    database = FakeDatabase([
+        _chunk('1', 'DSM-5', 12, 'Later page'),
+        _chunk('2', 'DSM-5', 3, 'Earlier page'),
+    ])
+    rag_factory = RAGFactory(vector_db=database, llm=FakeLLM())
+
+    context = rag_factory._handle_contexts(database.search('TDAH', 2))
+
+    first = rag_factory._build_messages('TDAH', context)
+    second = rag_factory._build_messages('depressão', context)
+
+    assert first[0] == second[0]
+    assert 'Pergunta' not in first[0][1]
+    assert first[1][1].index('Earlier page') < first[1][1].index('Later page')
@@ -0,0 +1,48 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from mental_health_ai.rag.database.snapshot import (
+    iter_snapshot,
+    read_snapshot_header,
+    write_snapshot,
+)
+
+
+def test_snapshot_round_trip(tmp_path):
+    """Test that objects, properties and vectors survive a snapshot."""
+    date = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    objects = [
+        (
+            f'00000000-0000-0000-0000-00000000000{index}',
+            {
+                'title': f'Documento {index}',
+                'metadata': {'type': 'dsm-5', 'date': date},
+            },
+            [float(index), 1.0],
+        )
+        for index in range(5)
+    ]
+    objects.append((
+        '00000000-0000-0000-0000-000000000009',
+        {'title': 'Sem vetor'},
+        None,
+    ))
+    path = str(tmp_path / 'documents.snapshot')
+
+    assert write_snapshot(path, objects, chunk_size=2) == len(objects)
+    restored = list(iter_snapshot(path))
+
+    assert [uuid for uuid, _, _ in restored] == [
+        uuid for uuid, _, _ in objects
+    ]
+    assert restored[3] == (
+        objects[3][0],
+        {
+            'title': 'Documento 3',
+            'metadata': {'type': 'dsm-5', 'date': '2023-01-01T00:00:00+00:00'},
+        },
+        pytest.approx([3.0, 1.0]),
+    )
+    assert restored[-1] == (objects[-1][0], {'title': 'Sem vetor'}, None)
+    assert read_snapshot_header(path)['chunks'] == len(objects) // 2
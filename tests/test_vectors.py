@@ -0,0 +1,70 @@
+import json
+
+import numpy as np
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from mental_health_ai.rag.database.ingestion import assign_chunk_ids
+from mental_health_ai.rag.database.vectors import (
+    SidecarVectors,
+    VectorSidecar,
+    embed_corpus,
+)
+
+
+class CountingEmbeddings(DeterministicFakeEmbedding):
+    """Deterministic embeddings counting the embedded texts."""
+
+    embedded: int = 0
+
+    def embed_documents(self, texts):
+        self.embedded += len(texts)
+        return super().embed_documents(texts)
+
+
+def _document(content, page_number=1):
+    return {
+        'title': 'DSM-5',
+        'page_content': content,
+        'metadata': {
+            'type': 'dsm-5',
+            'source': 'dsm5',
+            'page_number': page_number,
+        },
+    }
+
+
+def _write(path, documents):
+    path.write_text(json.dumps(documents), encoding='utf-8')
+
+
+def test_embed_corpus_reuses_unchanged_chunks(tmp_path):
+    """Test that only new chunks are embedded when a file changes."""
+    file_path = tmp_path / 'dsm5.json'
+    _write(file_path, [_document('TDAH'), _document('Depressão', 2)])
+    embeddings = CountingEmbeddings(size=8)
+
+    assert embed_corpus(str(tmp_path), embeddings, 'fake') == (0, 2)
+    assert embed_corpus(str(tmp_path), embeddings, 'fake') == (2, 0)
+
+    _write(file_path, [_document('TDAH'), _document('Ansiedade', 2)])
+    assert embed_corpus(str(tmp_path), embeddings, 'fake', dtype='float16')
+    assert embeddings.embedded == len(['TDAH', 'Depressão', 'Ansiedade'])
+
+    sidecar = VectorSidecar.load(str(file_path))
+    assert sidecar.vectors.dtype == np.float16
+    assert len(sidecar.ids) == len(sidecar.vectors)
+
+
+def test_sidecar_vectors_lookup(tmp_path):
+    """Test that vectors are found by chunk UUID and filtered by model."""
+    documents = [_document('TDAH')]
+    _write(tmp_path / 'dsm5.json', documents)
+    embeddings = DeterministicFakeEmbedding(size=8)
+    embed_corpus(str(tmp_path), embeddings, 'fake')
+    [(uuid, _, _)] = assign_chunk_ids(documents)
+
+    vector = SidecarVectors(str(tmp_path), 'fake').get(uuid)
+
+    assert np.allclose(vector, embeddings.embed_query('TDAH'))
+    assert SidecarVectors(str(tmp_path), 'other').get(uuid) is None
+    assert (tmp_path / '.dsm5.json.vectors.npy').exists()
@@ -1,6 +1,38 @@
+import json
+
+import pytest
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from mental_health_ai.rag.database.vectors import embed_corpus
 from mental_health_ai.rag.database.weaviate_impl import WeaviateClient
 
 
+class RecordingEmbeddings(DeterministicFakeEmbedding):
+    """Deterministic embeddings recording the embedded texts."""
+
+    texts: list = []
+
+    def embed_documents(self, texts):
+        self.texts.extend(texts)
+        return super().embed_documents(texts)
+
+
+def _vectorizer_input(document, local_embeddings):
+    """Rebuild the text a `text2vec` module embeds from the collection config."""  # noqa: E501
+    vectorizer = WeaviateClient._vectorizer_config(local_embeddings)._to_dict()
+    parts = ['Documents'] if vectorizer['vectorizeClassName'] else []
+    for prop in sorted(
+        WeaviateClient._collection_properties(), key=lambda prop: prop.name
+    ):
+        value = document.get(prop.name)
+        if prop.skip_vectorization or not isinstance(value, str):
+            continue
+        if prop.vectorize_property_name:
+            parts.append(prop.name)
+        parts.append(value)
+    return ' '.join(parts)
+
+
 def test_db_init(weaviate_client: WeaviateClient):
     """Test that the WeaviateClient is initialized correctly."""
     assert weaviate_client is not None
@@ -11,6 +43,44 @@ def test_verify_db_connection(weaviate_client: WeaviateClient):
     assert weaviate_client.verify_database() is True
 
 
+def test_filterable_values_from_metadata(sample_document):
+    """Test the top-level filterable values extracted from metadata."""
+    values = WeaviateClient._filterable_values({
+        **sample_document['metadata'],
+        'type': 'DSM-5',
+        'page_number': 3.0,
+    })
+    assert values == {
+        'type': 'dsm-5',
+        'source': 'https://example.com',
+        'page_number': 3,
+    }
+
+
+def test_filterable_values_skip_missing_fields():
+    """Test that missing metadata fields are not set as filterable values."""
+    assert WeaviateClient._filterable_values({'type': 'Article'}) == {
+        'type': 'article'
+    }
+
+
+@pytest.mark.parametrize('local_embeddings', [True, False])
+def test_sidecars_embed_the_vectorizer_input(
+    sample_document, tmp_path, local_embeddings
+):
+    """Test that sidecar vectors embed the same text as the Weaviate vectorizer."""  # noqa: E501
+    (tmp_path / 'articles.json').write_text(
+        json.dumps([sample_document]), encoding='utf-8'
+    )
+    embeddings = RecordingEmbeddings(size=8, texts=[])
+
+    embed_corpus(str(tmp_path), embeddings, 'fake')
+
+    assert embeddings.texts == [
+        _vectorizer_input(sample_document, local_embeddings)
+    ]
+
+
 # def test_add_valid_document(weaviate_client: WeaviateClient, sample_document): # noqa E501
 # TODO: descomentar quando instância do weaviate para teste for criada corretamente # noqa E501
 #     """Test adding a valid document."""